@@ -0,0 +1,65 @@
+"""Decode/encode time of the JSON codecs on representative SDK payloads.
+
+Run from packages/sdk-python::
+
+    python benchmarks/bench_codec.py [--repeat 10]
+
+Payloads:
+    backtest_result  strategy backtest result with ~10y of daily
+                     portfolio/benchmark values and monthly weights
+    data_fetch       data.fetch records, 500 tickers x 1y daily closes
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from qbique._codec import CODECS, get_codec  # noqa: E402
+from qbique.testing import backtest_result_payload as backtest_result  # noqa: E402
+from qbique.testing import data_fetch_payload as data_fetch  # noqa: E402
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    payloads = {"backtest_result": backtest_result(), "data_fetch": data_fetch()}
+    codecs = []
+    for codec_name in CODECS:
+        try:
+            codecs.append(get_codec(codec_name))
+        except ImportError:
+            print(f"({codec_name} not installed, skipped)")
+
+    print(f"{'payload':<16} {'size':>8} {'codec':<8} {'decode ms':>10} {'encode ms':>10} {'vs stdlib':>10}")
+    for name, payload in payloads.items():
+        body = get_codec("stdlib").dumps(payload)
+        timings = [
+            (codec.name, timeit(lambda: codec.loads(body), args.repeat), timeit(lambda: codec.dumps(payload), args.repeat))
+            for codec in codecs
+        ]
+        baseline = dict((n, d) for n, d, _ in timings)["stdlib"]
+        for codec_name, decode, encode in timings:
+            print(
+                f"{name:<16} {len(body) / 1e6:>6.1f}MB {codec_name:<8} "
+                f"{decode * 1e3:>10.1f} {encode * 1e3:>10.1f} {baseline / decode:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Throughput of per-worker clients vs. clients sharing one ConnectionPool.
+
+Starts a local HTTP/1.1 keep-alive stand-in server and issues ``GET /health``
+from a thread pool. Each task creates a ``QbiqueClient`` (as workers that
+build clients per job do) and makes a few requests, either with its own
+connection pool or bound to one shared :class:`~qbique.ConnectionPool`.
+
+Run from packages/sdk-python::
+
+    python benchmarks/bench_pool.py [--tasks 400] [--requests 5] [--workers 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from qbique import ConnectionPool, QbiqueClient  # noqa: E402
+
+BODY = json.dumps({"status": "ok"}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with Handler.lock:
+            Handler.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(endpoint: str, tasks: int, requests: int, workers: int, pool: ConnectionPool | None) -> tuple[float, int]:
+    def task(_: int) -> None:
+        with QbiqueClient(api_key="qbi_bench", endpoint=endpoint, pool=pool) as client:
+            for _ in range(requests):
+                client.health.check()
+
+    Handler.connections = 0
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(task, range(tasks)))
+    elapsed = time.perf_counter() - t0
+    return tasks * requests / elapsed, Handler.connections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{args.tasks} clients x {args.requests} requests, {args.workers} threads")
+    print(f"{'mode':<14} {'req/s':>10} {'connections':>12}")
+    rps, conns = run(endpoint, args.tasks, args.requests, args.workers, None)
+    print(f"{'per-client':<14} {rps:>10.0f} {conns:>12}")
+    with ConnectionPool(max_connections=args.workers, max_keepalive_connections=args.workers) as pool:
+        rps, conns = run(endpoint, args.tasks, args.requests, args.workers, pool)
+    print(f"{'shared pool':<14} {rps:>10.0f} {conns:>12}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""SDK throughput and tail latency under load, against qbique.testing.FakeServer.
+
+Run from packages/sdk-python::
+
+    python benchmarks/load.py                                  # in-memory transport, threads
+    python benchmarks/load.py --async --concurrency 1,16,128
+    python benchmarks/load.py --http --error-rate 0.02         # real sockets on localhost
+    python benchmarks/load.py --mix health=1,backtest=1 --job-seconds 0.5
+    python benchmarks/load.py --mix portfolio=1 --http --http-cache
+
+Each worker runs SDK operations in a loop for ``--duration`` seconds, picked
+at random from ``--mix`` (relative weights):
+
+    health      client.health.check()
+    portfolio   client.portfolio.summary() + drift() + pnl()
+    fetch       client.data.fetch() for 50 tickers x 1y
+    backtest    client.backtest.strategy() + wait() (slow job, polled)
+
+Server time per request is log-normal (``--latency-ms`` median,
+``--sigma``); ``--error-rate`` of requests fail with 500/502/503. Per
+concurrency level the script prints completed operations/s, HTTP requests/s,
+failed operations and p50/p95/p99/max operation latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from qbique import AsyncQbiqueClient, QbiqueClient, QbiqueError  # noqa: E402
+from qbique.testing import FakeServer, lognormal  # noqa: E402
+
+TICKERS = [f"{t:06d}" for t in range(50)]
+BACKTEST = dict(start="2015-01-01", end="2024-12-31")
+WAIT = dict(poll_interval=0.05, max_interval=1.0)
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - {"health", "portfolio", "fetch", "backtest"}
+    if unknown:
+        raise SystemExit(f"unknown operations in --mix: {sorted(unknown)}")
+    return mix
+
+
+def sync_operations(client: QbiqueClient) -> dict[str, Callable[[], object]]:
+    def portfolio():
+        client.portfolio.summary("p1")
+        client.portfolio.drift("p1")
+        client.portfolio.pnl("p1")
+
+    def backtest():
+        job = client.backtest.strategy(**BACKTEST)
+        client.backtest.wait(job["job_id"], **WAIT)
+
+    return {
+        "health": client.health.check,
+        "portfolio": portfolio,
+        "fetch": lambda: client.data.fetch(tickers=TICKERS),
+        "backtest": backtest,
+    }
+
+
+def async_operations(client: AsyncQbiqueClient) -> dict[str, Callable[[], object]]:
+    async def portfolio():
+        await client.portfolio.summary("p1")
+        await client.portfolio.drift("p1")
+        await client.portfolio.pnl("p1")
+
+    async def backtest():
+        job = await client.backtest.strategy(**BACKTEST)
+        await client.backtest.wait(job["job_id"], **WAIT)
+
+    return {
+        "health": client.health.check,
+        "portfolio": portfolio,
+        "fetch": lambda: client.data.fetch(tickers=TICKERS),
+        "backtest": backtest,
+    }
+
+
+Sample = tuple[str, float, bool]  # (operation, seconds, ok)
+
+
+def run_threads(client: QbiqueClient, mix: dict[str, float], workers: int, duration: float) -> list[Sample]:
+    operations = sync_operations(client)
+    names, weights = list(mix), list(mix.values())
+    samples: list[Sample] = []
+    lock = threading.Lock()
+    stop = time.perf_counter() + duration
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        local = []
+        while time.perf_counter() < stop:
+            name = rng.choices(names, weights)[0]
+            t0 = time.perf_counter()
+            try:
+                operations[name]()
+                ok = True
+            except QbiqueError:
+                ok = False
+            local.append((name, time.perf_counter() - t0, ok))
+        with lock:
+            samples.extend(local)
+
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(worker, range(workers)))
+    return samples
+
+
+async def run_tasks(client: AsyncQbiqueClient, mix: dict[str, float], workers: int, duration: float) -> list[Sample]:
+    operations = async_operations(client)
+    names, weights = list(mix), list(mix.values())
+    samples: list[Sample] = []
+    stop = time.perf_counter() + duration
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < stop:
+            name = rng.choices(names, weights)[0]
+            t0 = time.perf_counter()
+            try:
+                await operations[name]()
+                ok = True
+            except QbiqueError:
+                ok = False
+            samples.append((name, time.perf_counter() - t0, ok))
+
+    await asyncio.gather(*(worker(i) for i in range(workers)))
+    return samples
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+def report(concurrency: int, samples: list[Sample], requests: int, elapsed: float) -> None:
+    latencies = sorted(s for _, s, _ in samples)
+    failed = sum(1 for _, _, ok in samples if not ok)
+    print(
+        f"{concurrency:>6} {len(samples) / elapsed:>10.1f} {requests / elapsed:>10.1f} {failed:>7} "
+        f"{percentile(latencies, 50) * 1e3:>9.1f} {percentile(latencies, 95) * 1e3:>9.1f} "
+        f"{percentile(latencies, 99) * 1e3:>9.1f} {(latencies[-1] if latencies else 0) * 1e3:>9.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,8,32,64", help="comma-separated worker counts")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per concurrency level")
+    parser.add_argument("--mix", default="health=4,portfolio=3,fetch=2,backtest=1")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="median server time per request")
+    parser.add_argument("--sigma", type=float, default=0.6, help="log-normal spread of server time")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--job-seconds", type=float, default=2.0, help="median greedy backtest duration")
+    parser.add_argument("--job-failure-rate", type=float, default=0.0)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="AsyncQbiqueClient + asyncio tasks")
+    parser.add_argument("--http", action="store_true", help="serve over localhost HTTP instead of a mock transport")
+    parser.add_argument("--http-cache", action="store_true", help="enable the client's ETag / Cache-Control cache")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    server = FakeServer(
+        latency=lognormal(args.latency_ms / 1e3, args.sigma),
+        error_rate=args.error_rate,
+        job_duration=lognormal(args.job_seconds, 0.5),
+        job_failure_rate=args.job_failure_rate,
+    )
+
+    mode = f"{'async' if args.use_async else 'threads'}, {'http' if args.http else 'mock transport'}"
+    if args.http_cache:
+        mode += ", http cache"
+    print(f"mix {args.mix}; server {args.latency_ms:g}ms median (sigma {args.sigma}), "
+          f"{args.error_rate:.0%} errors; {args.duration:g}s per level; {mode}")
+    print(f"{'conc':>6} {'ops/s':>10} {'req/s':>10} {'failed':>7} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+
+    with server.serve() if args.http else nullcontext(None) as endpoint:
+        for concurrency in (int(c) for c in args.concurrency.split(",") if c):
+            options = dict(
+                api_key="qbi_load",
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                http_cache=args.http_cache,
+            )
+            before = sum(server.requests.values())
+            t0 = time.perf_counter()
+            if args.use_async:
+                async def go() -> list[Sample]:
+                    transport = None if args.http else server.async_transport()
+                    kwargs = dict(endpoint=endpoint) if args.http else dict(transport=transport)
+                    async with AsyncQbiqueClient(**options, **kwargs) as client:
+                        return await run_tasks(client, mix, concurrency, args.duration)
+
+                samples = asyncio.run(go())
+            else:
+                kwargs = dict(endpoint=endpoint) if args.http else dict(transport=server.transport())
+                with QbiqueClient(**options, **kwargs) as client:
+                    samples = run_threads(client, mix, concurrency, args.duration)
+            elapsed = time.perf_counter() - t0
+            report(concurrency, samples, sum(server.requests.values()) - before, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""SDK benchmark suite with stored baselines and regression reporting.
+
+Run from packages/sdk-python::
+
+    python benchmarks/suite.py                  # all cases
+    python benchmarks/suite.py -k decode        # cases whose name contains "decode"
+    python benchmarks/suite.py --save           # record current results as the baseline
+
+Every request goes through the real client stack (auth headers, metrics,
+codec) against an in-memory ``httpx.MockTransport``, so the timings are SDK
+overhead only, with no network. Cases (best of ``--repeat``, seconds):
+
+    request/health/...           200 sequential small GETs, metrics on / off, sync / async
+    decode/backtest_result/<N>   10y strategy result with monthly weights for N
+                                 assets (100 / 1,000 / 5,000), per available codec
+    decode/data_fetch/<N>x1y     data.fetch records, N tickers x 1y daily closes
+
+Baselines are stored in ``benchmarks/baseline.json`` with the machine they were
+recorded on. Cases more than ``--tolerance`` (default 25%) slower than the
+baseline are reported as REGRESSION and the script exits with status 1.
+Re-record with ``--save`` when moving to a different machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from qbique import AsyncQbiqueClient, QbiqueClient  # noqa: E402
+from qbique._codec import CODECS, get_codec  # noqa: E402
+from qbique.testing import backtest_result_payload, data_fetch_payload  # noqa: E402
+
+BASELINE = os.path.join(HERE, "baseline.json")
+REQUESTS = 200
+
+Case = tuple[str, Callable[[], object]]
+
+
+def json_handler(routes: dict[str, bytes]) -> Callable[[httpx.Request], httpx.Response]:
+    """Handler serving pre-encoded JSON bodies by path."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = routes.get(request.url.path)
+        if body is None:
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    return handler
+
+
+def client(routes: dict[str, bytes], **kwargs) -> QbiqueClient:
+    return QbiqueClient(api_key="bench", transport=httpx.MockTransport(json_handler(routes)), **kwargs)
+
+
+def request_cases() -> list[Case]:
+    routes = {"/health": json.dumps({"status": "ok"}).encode()}
+    with_metrics = client(routes)
+    without_metrics = client(routes, metrics=False)
+
+    def sequential(c: QbiqueClient) -> None:
+        for _ in range(REQUESTS):
+            c.health.check()
+
+    def run_async() -> None:
+        async def go() -> None:
+            transport = httpx.MockTransport(json_handler(routes))
+            async with AsyncQbiqueClient(api_key="bench", transport=transport) as c:
+                for _ in range(REQUESTS):
+                    await c.health.check()
+
+        asyncio.run(go())
+
+    return [
+        (f"request/health/{REQUESTS}x_metrics_on", lambda: sequential(with_metrics)),
+        (f"request/health/{REQUESTS}x_metrics_off", lambda: sequential(without_metrics)),
+        (f"request/health/{REQUESTS}x_async", run_async),
+    ]
+
+
+def decode_cases(sizes: list[int]) -> list[Case]:
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name).name)
+        except ImportError:
+            print(f"({name} not installed, skipped)")
+
+    cases: list[Case] = []
+    for n in sizes:
+        result_body = json.dumps(backtest_result_payload(assets=n)).encode()
+        fetch_body = json.dumps(data_fetch_payload(tickers=n, days=252)).encode()
+        for codec in codecs:
+            c = client(
+                {
+                    "/api/backtest/strategy/greedy/job/result": result_body,
+                    "/api/cli/data/fetch": fetch_body,
+                },
+                json_codec=codec,
+            )
+            cases.append((f"decode/backtest_result/{n}/{codec}", lambda c=c: c.backtest.strategy_result("job")))
+            cases.append((f"decode/data_fetch/{n}x1y/{codec}", lambda c=c: c.data.fetch(cache=False)))
+    return cases
+
+
+# ── running and comparing ──
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def machine() -> dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "httpx": httpx.__version__,
+    }
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"machine": None, "results": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict[str, float], baseline: dict, tolerance: float, noise: float = 1e-3) -> list[str]:
+    """Print the result table and return the names of regressed cases.
+
+    Differences below ``noise`` seconds are never reported.
+    """
+    base = baseline.get("results", {})
+    regressions = []
+    print(f"{'case':<44} {'seconds':>10} {'baseline':>10} {'ratio':>7}  status")
+    for name, seconds in results.items():
+        ref = base.get(name)
+        if ref is None:
+            print(f"{name:<44} {seconds:>10.4f} {'-':>10} {'-':>7}  new")
+            continue
+        ratio = seconds / ref if ref > 0 else float("inf")
+        status = "ok"
+        if abs(seconds - ref) < noise:
+            pass
+        elif ratio > 1.0 + tolerance:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1.0 / (1.0 + tolerance):
+            status = "faster"
+        print(f"{name:<44} {seconds:>10.4f} {ref:>10.4f} {ratio:>6.2f}x  {status}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma-separated asset/ticker counts")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="keyword", default="", help="only run cases whose name contains this")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="slowdown ratio reported as a regression")
+    parser.add_argument("--save", action="store_true", help="merge the results into the baseline file")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    if baseline.get("machine") and baseline["machine"] != machine():
+        print(f"note: baseline was recorded on {baseline['machine']}")
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results: dict[str, float] = {}
+    for name, fn in [*request_cases(), *decode_cases(sizes)]:
+        if args.keyword in name:
+            results[name] = best_of(fn, args.repeat)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if args.save:
+        merged = {**baseline.get("results", {}), **{k: round(v, 6) for k, v in results.items()}}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine(), "results": dict(sorted(merged.items()))}, f, indent=2)
+            f.write("\n")
+        print(f"saved {len(results)} results to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
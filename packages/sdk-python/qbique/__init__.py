@@ -9,9 +9,14 @@ Usage:
     result = client.strategy.list()
     result = client.data.fetch(universe="KOSPI")
     result = client.backtest.run(tickers=["005930", "000660"], start="2023-01-01", end="2024-12-31")
+
+    async with AsyncQbiqueClient(api_key="qbi_xxx") as client:
+        result = await client.strategy.list()
 """
 
-from qbique.client import QbiqueClient
+from qbique.client import QbiqueClient, AsyncQbiqueClient
+from qbique.pool import ConnectionPool
+from qbique.metrics import MetricsCollector
 from qbique.exceptions import (
     QbiqueError,
     AuthenticationError,
@@ -19,15 +24,22 @@ from qbique.exceptions import (
     ValidationError,
     ServerError,
     ConnectionError,
+    JobFailedError,
+    JobTimeoutError,
 )
 
 __version__ = "0.1.0"
 __all__ = [
     "QbiqueClient",
+    "AsyncQbiqueClient",
+    "ConnectionPool",
+    "MetricsCollector",
     "QbiqueError",
     "AuthenticationError",
     "NotFoundError",
     "ValidationError",
     "ServerError",
     "ConnectionError",
+    "JobFailedError",
+    "JobTimeoutError",
 ]
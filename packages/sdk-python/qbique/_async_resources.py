@@ -0,0 +1,344 @@
+"""Async resource namespaces for AsyncQbiqueClient.
+
+Each async namespace reuses the request building of its sync counterpart in
+``_resources.py``. Bound to an :class:`~qbique._http.AsyncHttpClient`, the
+inherited methods return the coroutine produced by ``get``/``post``, so every
+call is awaitable::
+
+    result = await client.strategy.list()
+
+Only methods that compose several requests are overridden here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+import os
+import time
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Mapping, Sequence
+
+from qbique._resources import (
+    StrategyResource,
+    OptimizeResource,
+    BacktestResource,
+    DataResource,
+    PortfolioResource,
+    ContractResource,
+    HealthResource,
+)
+from qbique._bulk import GZIP_HEADERS, IMPORT_PATH, Chunk, ImportCheckpoint, is_retryable, iter_chunks
+from qbique._waiter import COMPLETED, PollSchedule, failure_message, job_state
+from qbique.exceptions import JobFailedError, JobTimeoutError, QbiqueError
+from qbique.types import BulkImportResult, ChunkResult
+from qbique.sweep import (
+    DEFAULT_METRICS,
+    SweepCheckpoint,
+    combo_key,
+    expand_grid,
+    sweep_error_row,
+    sweep_row,
+    sweep_timeout_row,
+)
+
+if TYPE_CHECKING:
+    from qbique._http import AsyncHttpClient
+
+
+class AsyncStrategyResource(StrategyResource):
+    """Strategy management (async)."""
+
+    _http: AsyncHttpClient
+
+
+class AsyncOptimizeResource(OptimizeResource):
+    """Portfolio optimization (async)."""
+
+    _http: AsyncHttpClient
+
+
+def _still_pending(task: asyncio.Future) -> bool:
+    """Whether a ``wait_many`` poll task had not finished its job (running or timed out)."""
+    if not task.done():
+        return True
+    return not task.cancelled() and isinstance(task.exception(), JobTimeoutError)
+
+
+class AsyncBacktestResource(BacktestResource):
+    """Backtesting (async)."""
+
+    _http: AsyncHttpClient
+
+    async def compare(self, id_a: str, id_b: str) -> dict:
+        """Compare two backtest results (client-side, fetched concurrently)."""
+        a, b = await asyncio.gather(self.results(id_a), self.results(id_b))
+        return {"backtest_a": a, "backtest_b": b}
+
+    async def wait(
+        self,
+        job_id: str,
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+    ) -> dict:
+        """Await a strategy (greedy) backtest and return its result.
+
+        See :meth:`BacktestResource.wait`.
+        """
+        async for _, result in self.wait_many(
+            [job_id],
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+        ):
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def wait_many(
+        self,
+        job_ids: Iterable[str],
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        raise_on_failure: bool = True,
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Await many strategy backtests, yielding ``(job_id, result)`` in completion order.
+
+        Every job is polled concurrently on its own adaptive schedule over the
+        client's shared connection pool. See :meth:`BacktestResource.wait_many`
+        for the scheduling rules and arguments.
+        """
+        deadline = time.monotonic() + timeout
+        args = (poll_interval, max_interval, backoff)
+
+        async def poll(job_id: str) -> tuple[str, dict]:
+            status = await self._poll_until_done(job_id, PollSchedule(*args), deadline)
+            if job_state(status) == COMPLETED:
+                return job_id, await self.strategy_result(job_id)
+            if raise_on_failure:
+                raise JobFailedError(failure_message(job_id, status), job_id=job_id, details=status)
+            return job_id, status
+
+        tasks = {asyncio.ensure_future(poll(j)): j for j in dict.fromkeys(job_ids)}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except JobTimeoutError:
+                    pending = [j for t, j in tasks.items() if _still_pending(t)]
+                    raise JobTimeoutError(
+                        f"Timed out after {timeout}s waiting for {len(pending)} backtest job(s)",
+                        job_ids=pending,
+                    ) from None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def sweep(
+        self,
+        grid: Mapping[str, Sequence[Any]],
+        *,
+        start: str,
+        end: str,
+        concurrency: int = 8,
+        checkpoint: str | os.PathLike[str] | None = None,
+        metrics: Sequence[str] = DEFAULT_METRICS,
+        poll_interval: float = 1.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        timeout: float | None = None,
+        **fixed: Any,
+    ) -> AsyncIterator[dict]:
+        """Async parameter sweep; see :meth:`BacktestResource.sweep`."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        accepted = inspect.signature(BacktestResource.strategy).parameters
+        unknown = sorted(k for k in [*grid, *fixed] if k not in accepted or k in ("self", "start", "end"))
+        if unknown:
+            raise ValueError(f"Unknown strategy backtest parameter(s): {unknown}")
+
+        ckpt = SweepCheckpoint(checkpoint) if checkpoint is not None else None
+        slots = asyncio.Semaphore(concurrency)
+        args = (poll_interval, max_interval, backoff)
+
+        async def run(key: str, params: dict, job_id: str | None) -> dict:
+            async with slots:
+                deadline = math.inf if timeout is None else time.monotonic() + timeout
+                try:
+                    if job_id is None:
+                        job = await self.strategy(start=start, end=end, **fixed, **params)
+                        job_id = job.get("job_id")
+                        if not job_id:
+                            raise QbiqueError(f"No job_id returned for sweep combination {params}", details=job)
+                        if ckpt is not None:
+                            ckpt.record_submit(key, job_id)
+                        await asyncio.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+                    try:
+                        status = await self._poll_until_done(job_id, PollSchedule(*args), deadline)
+                    except JobTimeoutError:
+                        # not checkpointed: a re-run polls this job again
+                        return sweep_timeout_row(params, job_id, timeout, metrics)
+                    if job_state(status) == COMPLETED:
+                        row = sweep_row(params, job_id, COMPLETED, await self.strategy_result(job_id), metrics)
+                    else:
+                        row = sweep_row(params, job_id, "failed", status, metrics)
+                except QbiqueError as e:
+                    row = sweep_error_row(params, job_id, e, metrics)
+            if ckpt is not None:
+                ckpt.record_row(key, row)
+            return row
+
+        tasks = []
+        for params in expand_grid(grid):
+            key = combo_key({"start": start, "end": end, **fixed, **params})
+            if ckpt is not None and key in ckpt.rows:
+                yield ckpt.rows[key]
+                continue
+            job_id = ckpt.submitted.get(key) if ckpt is not None else None
+            tasks.append(asyncio.ensure_future(run(key, params, job_id)))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _poll_until_done(self, job_id: str, schedule: PollSchedule, deadline: float) -> dict:
+        """Poll a job on ``schedule`` until it completes or fails; return the final status."""
+        while True:
+            status = await self.strategy_status(job_id)
+            if job_state(status) != "pending":
+                return status
+            now = time.monotonic()
+            if now >= deadline:
+                raise JobTimeoutError(f"Timed out waiting for backtest job {job_id}", job_ids=[job_id])
+            await asyncio.sleep(min(schedule.next_delay(status, now), deadline - now))
+
+
+class AsyncDataResource(DataResource):
+    """Market data (async)."""
+
+    _http: AsyncHttpClient
+
+    async def export_to(
+        self,
+        dataset: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        tickers: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        format: str = "csv",
+        chunk_size: int = 64 * 1024,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict:
+        """Stream an export to a file or sink; see :meth:`DataResource.export_to`."""
+        payload, headers = self._export_stream_request(dataset, tickers, start_date, end_date, format)
+        kwargs = dict(json=payload, headers=headers, chunk_size=chunk_size, progress=progress)
+        if hasattr(dest, "write"):
+            written = await self._http.stream("POST", "/api/cli/data/export", dest, **kwargs)
+            return {"dataset": dataset, "format": format, "bytes": written, "path": None}
+
+        path = os.fspath(dest)
+        tmp = path + ".part"
+        try:
+            with open(tmp, "wb") as f:
+                written = await self._http.stream("POST", "/api/cli/data/export", f, **kwargs)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return {"dataset": dataset, "format": format, "bytes": written, "path": path}
+
+    async def import_bulk(
+        self,
+        dataset: str,
+        records: Iterable[dict],
+        *,
+        metadata: dict | None = None,
+        chunk_records: int = 10_000,
+        max_chunk_bytes: int = 8 * 1024 * 1024,
+        parallelism: int = 4,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> BulkImportResult:
+        """Chunked, compressed, concurrent import; see :meth:`DataResource.import_bulk`."""
+        if parallelism < 1:
+            raise ValueError("parallelism must be >= 1")
+        ckpt = None
+        if checkpoint is not None:
+            ckpt = ImportCheckpoint(
+                checkpoint, dataset=dataset, chunk_records=chunk_records, max_chunk_bytes=max_chunk_bytes
+            )
+        chunks = iter_chunks(
+            dataset,
+            records,
+            metadata=metadata,
+            max_records=chunk_records,
+            max_bytes=max_chunk_bytes,
+            skip=frozenset(ckpt.done) if ckpt is not None else frozenset(),
+        )
+        result = BulkImportResult(dataset=dataset)
+        pending: set[asyncio.Task] = set()
+        for chunk in chunks:
+            if chunk.skipped:
+                ckpt.verify(chunk)
+                result.chunks.append(ChunkResult(
+                    chunk.index, chunk.offset, chunk.records, 0, ok=True, skipped=True
+                ))
+                continue
+            if len(pending) >= parallelism:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                result.chunks.extend(t.result() for t in done)
+            pending.add(asyncio.ensure_future(self._upload_chunk(chunk, max_retries, retry_backoff, ckpt)))
+        if pending:
+            result.chunks.extend(await asyncio.gather(*pending))
+        result.chunks.sort(key=lambda c: c.index)
+        return result
+
+    async def _upload_chunk(
+        self, chunk: Chunk, max_retries: int, retry_backoff: float, ckpt: ImportCheckpoint | None
+    ) -> ChunkResult:
+        outcome = ChunkResult(chunk.index, chunk.offset, chunk.records, len(chunk.body), ok=False)
+        while True:
+            outcome.attempts += 1
+            try:
+                await self._http.post_content(IMPORT_PATH, chunk.body, GZIP_HEADERS)
+            except QbiqueError as e:
+                outcome.error = str(e)
+                if outcome.attempts > max_retries or not is_retryable(e):
+                    return outcome
+                self._http.record_retry("POST", IMPORT_PATH)
+                await asyncio.sleep(retry_backoff * 2 ** (outcome.attempts - 1))
+                continue
+            outcome.ok, outcome.error = True, None
+            if ckpt is not None:
+                ckpt.record(chunk.index, chunk.offset, chunk.records)
+            return outcome
+
+
+class AsyncPortfolioResource(PortfolioResource):
+    """Portfolio monitoring (async)."""
+
+    _http: AsyncHttpClient
+
+
+class AsyncContractResource(ContractResource):
+    """Contract management (async)."""
+
+    _http: AsyncHttpClient
+
+
+class AsyncHealthResource(HealthResource):
+    """Server health (async)."""
+
+    _http: AsyncHttpClient
@@ -0,0 +1,133 @@
+"""Chunking, compression and checkpointing for bulk data imports."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from qbique.exceptions import ConnectionError, QbiqueError, ServerError
+
+IMPORT_PATH = "/api/cli/data/import"
+
+
+@dataclass
+class Chunk:
+    index: int
+    offset: int
+    records: int
+    body: bytes  # gzip-compressed JSON request body (empty when skipped)
+    raw_bytes: int
+    skipped: bool = False
+
+
+def iter_chunks(
+    dataset: str,
+    records: Iterable[dict],
+    *,
+    metadata: dict | None,
+    max_records: int,
+    max_bytes: int,
+    compresslevel: int = 6,
+    skip: frozenset[int] = frozenset(),
+) -> Iterator[Chunk]:
+    """Split ``records`` lazily into size-bounded, gzip-compressed import bodies.
+
+    A chunk closes when it holds ``max_records`` records or when adding the
+    next record would push its uncompressed JSON past ``max_bytes``. Chunk
+    boundaries depend only on the records and limits, so a re-run with the
+    same input reproduces the same chunk indexes; indexes in ``skip`` are
+    still counted and yielded with ``skipped=True`` but never compressed.
+    """
+    if max_records < 1 or max_bytes < 1:
+        raise ValueError("max_records and max_bytes must be positive")
+    head = json.dumps({"dataset": dataset, "metadata": metadata}, separators=(",", ":"))[:-1]
+    index = offset = size = 0
+    parts: list[bytes] = []
+
+    def close() -> Chunk:
+        if index in skip:
+            return Chunk(index, offset, len(parts), b"", 0, skipped=True)
+        raw = b"".join([head.encode(), b',"chunk":', str(index).encode(), b',"data":[', b",".join(parts), b"]}"])
+        return Chunk(index, offset, len(parts), gzip.compress(raw, compresslevel), len(raw))
+
+    for record in records:
+        encoded = json.dumps(record, separators=(",", ":"), default=str).encode()
+        if parts and (len(parts) >= max_records or size + len(encoded) + 1 > max_bytes):
+            yield close()
+            index += 1
+            offset += len(parts)
+            parts, size = [], 0
+        parts.append(encoded)
+        size += len(encoded) + 1
+    if parts:
+        yield close()
+
+
+def is_retryable(error: QbiqueError) -> bool:
+    """Server errors, connection failures and timeouts are worth retrying."""
+    return isinstance(error, (ServerError, ConnectionError)) or (
+        type(error) is QbiqueError and error.status_code is None
+    )
+
+
+GZIP_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+
+class ImportCheckpoint:
+    """JSON-lines record of chunk indexes the server has accepted.
+
+    The first line is a header with the dataset and chunking limits. Chunk
+    indexes only identify the same records when those match, so opening a
+    checkpoint written for a different dataset or limits raises
+    :class:`ValueError`, as does a skipped chunk whose offset or record count
+    differs from the recorded one (the input changed between runs).
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, dataset: str, chunk_records: int, max_chunk_bytes: int):
+        self.path = os.fspath(path)
+        self.header = {"dataset": dataset, "chunk_records": chunk_records, "max_chunk_bytes": max_chunk_bytes}
+        self.done: dict[int, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        header = None
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "header" in entry:
+                        header = entry["header"]
+                    else:
+                        self.done[entry["index"]] = entry
+        if header is None and self.done:
+            raise ValueError(f"Import checkpoint {self.path} has no header; start a new checkpoint file")
+        if header is None:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"header": self.header}) + "\n")
+        elif header != self.header:
+            raise ValueError(
+                f"Import checkpoint {self.path} was written for {header}, not {self.header}; "
+                "use the same dataset and limits or a new checkpoint file"
+            )
+
+    def verify(self, chunk: Chunk) -> None:
+        """Check that a chunk being skipped still covers the recorded records."""
+        entry = self.done[chunk.index]
+        if (entry["offset"], entry["records"]) != (chunk.offset, chunk.records):
+            raise ValueError(
+                f"Chunk {chunk.index} covers records {chunk.offset}..{chunk.offset + chunk.records} "
+                f"but the checkpoint recorded {entry['offset']}..{entry['offset'] + entry['records']}; "
+                "the records changed since the checkpoint was written"
+            )
+
+    def record(self, index: int, offset: int, records: int) -> None:
+        entry = {"index": index, "offset": offset, "records": records}
+        with self._lock:
+            self.done[index] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
@@ -0,0 +1,86 @@
+"""Pluggable JSON codecs for request/response bodies.
+
+``get_codec("auto")`` picks the fastest installed backend: orjson, then
+msgspec, then the standard library. Install one with ``pip install qbique[fast]``.
+
+Every backend writes NaN and infinite floats as ``null``, so a body does not
+change with the installed backend.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Callable
+
+CODECS = ("orjson", "msgspec", "stdlib")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A named pair of ``dumps(obj) -> bytes`` / ``loads(bytes) -> obj``."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN / infinite floats with None, as orjson and msgspec encode them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    try:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError:  # non-finite floats: rare, so only then walk the object
+        text = json.dumps(_finite(obj), separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    return text.encode()
+
+
+def _stdlib() -> JsonCodec:
+    return JsonCodec("stdlib", _stdlib_dumps, json.loads)
+
+
+def _orjson() -> JsonCodec:
+    import orjson
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    return JsonCodec("orjson", lambda obj: orjson.dumps(obj, option=option), orjson.loads)
+
+
+def _msgspec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec("msgspec", encoder.encode, decoder.decode)
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "stdlib": _stdlib}
+
+
+def get_codec(name: str | JsonCodec = "auto") -> JsonCodec:
+    """Resolve a codec by name (``auto`` | ``orjson`` | ``msgspec`` | ``stdlib``).
+
+    A :class:`JsonCodec` instance is returned unchanged. Naming a backend that
+    is not installed raises ``ImportError``.
+    """
+    if isinstance(name, JsonCodec):
+        return name
+    if name == "auto":
+        for candidate in CODECS:
+            try:
+                return _FACTORIES[candidate]()
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of {('auto',) + CODECS}")
+    return _FACTORIES[name]()
@@ -1,9 +1,23 @@
-"""Low-level HTTP client wrapper around httpx."""
+"""Low-level HTTP client wrappers around httpx (sync and async)."""
 
 from __future__ import annotations
 
+import gzip
+import time
+from typing import IO, TYPE_CHECKING, Any, Callable
+
 import httpx
 
+from qbique._codec import JsonCodec, get_codec
+from qbique.cache import make_key
+from qbique.metrics import (
+    MetricsCollector,
+    RequestEvent,
+    RequestHook,
+    ResponseEvent,
+    ResponseHook,
+    endpoint_template,
+)
 from qbique.exceptions import (
     QbiqueError,
     AuthenticationError,
@@ -13,50 +27,173 @@ from qbique.exceptions import (
     ConnectionError,
 )
 
+if TYPE_CHECKING:
+    from qbique.cache import CachePolicy, HttpCache, HttpCacheEntry, ResponseCache
 
-class HttpClient:
-    """Thin httpx wrapper with error mapping."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0):
-        self._client = httpx.Client(
+def _downloaded(response: httpx.Response | None) -> int:
+    """Body bytes received on the wire so far (compressed size)."""
+    return 0 if response is None else response.num_bytes_downloaded
+
+
+class _BaseHttpClient:
+    """Shared configuration, body encoding and error mapping for the sync/async clients.
+
+    JSON bodies are encoded and decoded with a pluggable codec (see
+    :mod:`qbique._codec`). Request bodies of at least ``compress_threshold``
+    bytes are sent gzip-compressed; compressed responses are negotiated via
+    ``Accept-Encoding`` and decoded transparently by httpx.
+
+    Every request is recorded into ``metrics`` (when set) and reported to the
+    registered request/response hooks (see :mod:`qbique.metrics`).
+
+    With an ``http_cache`` (see :class:`~qbique.cache.HttpCache`), GETs are
+    served from memory while fresh and revalidated with conditional requests
+    once stale.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        cache: ResponseCache | None = None,
+        codec: str | JsonCodec = "auto",
+        compress_threshold: int | None = None,
+        metrics: MetricsCollector | None = None,
+        http_cache: HttpCache | None = None,
+    ):
+        self.cache = cache
+        self.http_cache = http_cache
+        self.metrics = metrics
+        self.request_hooks: list[RequestHook] = []
+        self.response_hooks: list[ResponseHook] = []
+        self.codec = get_codec(codec)
+        self.compress_threshold = compress_threshold
+        self._client_kwargs = dict(
             base_url=base_url,
             timeout=timeout,
             headers={
                 "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
                 "X-API-Key": api_key,
                 "User-Agent": "qbique-python-sdk/0.1.0",
             },
         )
 
-    def get(self, path: str, params: dict | None = None) -> dict:
-        return self._request("GET", path, params=params)
+    def _encode_body(self, json: Any, headers: dict | None) -> tuple[bytes | None, dict | None]:
+        """Encode a JSON body with the codec, gzip-compressing large bodies."""
+        if json is None:
+            return None, headers
+        content = self.codec.dumps(json)
+        if self.compress_threshold is not None and len(content) >= self.compress_threshold:
+            content = gzip.compress(content, 6)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        return content, headers
 
-    def post(self, path: str, json: dict | None = None, params: dict | None = None) -> dict:
-        return self._request("POST", path, json=json, params=params)
+    def _begin(self, method: str, path: str, content: bytes | None) -> RequestEvent | None:
+        """Open a metrics/hook record for a request; None when nothing listens."""
+        if self.metrics is None and not self.request_hooks and not self.response_hooks:
+            return None
+        event = RequestEvent(method, path, endpoint_template(path), len(content) if content else 0)
+        if self.metrics is not None:
+            self.metrics.request_started(event)
+        for hook in self.request_hooks:
+            hook(event)
+        return event
 
-    def delete(self, path: str) -> dict:
-        return self._request("DELETE", path)
+    def _end(
+        self,
+        event: RequestEvent | None,
+        status_code: int | None,
+        response_bytes: int = 0,
+        error: BaseException | None = None,
+    ) -> None:
+        if event is None:
+            return
+        done = ResponseEvent(
+            method=event.method,
+            path=event.path,
+            endpoint=event.endpoint,
+            status_code=status_code,
+            elapsed=time.perf_counter() - event.started,
+            request_bytes=event.request_bytes,
+            response_bytes=response_bytes,
+            error=type(error).__name__ if error is not None else None,
+        )
+        if self.metrics is not None:
+            self.metrics.request_finished(done)
+        for hook in self.response_hooks:
+            hook(done)
 
-    def close(self) -> None:
-        self._client.close()
+    def record_retry(self, method: str, path: str) -> None:
+        """Count a caller-level retry of ``method path`` in the metrics."""
+        if self.metrics is not None:
+            self.metrics.record_retry(method, path)
 
-    def _request(self, method: str, path: str, **kwargs) -> dict:
-        try:
-            response = self._client.request(method, path, **kwargs)
-        except httpx.ConnectError as e:
-            raise ConnectionError(
-                f"Cannot connect to Qbique server at {self._client.base_url}. "
-                f"Is the backend running? Error: {e}"
-            ) from e
-        except httpx.TimeoutException as e:
-            raise QbiqueError(f"Request timed out: {e}") from e
+    def _decode(self, response: httpx.Response) -> Any:
+        return self.codec.loads(response.content) if response.content else {}
 
+    def _cache_lookup(
+        self, method: str, path: str, payload: dict | None, policy: CachePolicy | None
+    ) -> tuple[str | None, dict | None]:
+        """Return ``(key, cached_value)``; ``key`` is None when caching is off for the call."""
+        if policy is None or self.cache is None:
+            return None, None
+        key = self._cache_key(method, path, payload)
+        if policy.refresh:
+            return key, None
+        return key, self.cache.get(key)
+
+    def _cache_key(self, method: str, path: str, payload: Any) -> str:
+        """Per-server, per-API-key key for :attr:`cache` and :attr:`http_cache` entries."""
+        return make_key(
+            self._client_kwargs["base_url"], method, path, payload,
+            api_key=self._client_kwargs["headers"]["X-API-Key"],
+        )
+
+    def _http_cache_key(self, path: str, params: dict | None) -> str:
+        """Key for :attr:`http_cache` entries."""
+        return self._cache_key("GET", path, params)
+
+    def invalidate_cache(self, method: str, path: str, payload: dict | None = None) -> bool:
+        """Drop the :attr:`cache` entry stored for ``method path payload``; returns whether it existed."""
+        if self.cache is None:
+            return False
+        return self.cache.invalidate(self._cache_key(method, path, payload))
+
+    def _cached_get_result(
+        self, key: str, entry: HttpCacheEntry | None, response: httpx.Response, path: str
+    ) -> Any:
+        """Resolve a (possibly conditional) GET response against :attr:`http_cache`."""
+        if response.status_code == 304 and entry is not None:
+            return self.http_cache.not_modified(key, entry, response.headers)
+        result = self._handle_response(response, path)
+        if response.status_code == 200:
+            self.http_cache.store(key, response.headers, result, len(response.content))
+        return result
+
+    @staticmethod
+    def _stream_total(response: httpx.Response) -> int | None:
+        """Expected body size for progress reporting (unknown when content-encoded)."""
+        length = response.headers.get("Content-Length")
+        if length is None or response.headers.get("Content-Encoding"):
+            return None
+        return int(length)
+
+    def _connect_error(self, e: Exception) -> ConnectionError:
+        return ConnectionError(
+            f"Cannot connect to Qbique server at {self._client.base_url}. "
+            f"Is the backend running? Error: {e}"
+        )
+
+    def _handle_response(self, response: httpx.Response, path: str) -> dict:
         if response.status_code == 401:
             raise AuthenticationError("Invalid or missing API key.", status_code=401)
         if response.status_code == 404:
             raise NotFoundError(f"Resource not found: {path}", status_code=404)
         if response.status_code == 422:
-            body = response.json() if response.content else {}
+            body = self._decode(response)
             raise ValidationError(
                 f"Validation error: {body.get('detail', body)}",
                 status_code=422,
@@ -68,11 +205,267 @@ class HttpClient:
                 status_code=response.status_code,
             )
         if response.status_code >= 400:
-            body = response.json() if response.content else {}
+            body = self._decode(response)
             raise QbiqueError(
                 f"API error ({response.status_code}): {body}",
                 status_code=response.status_code,
                 details=body,
             )
 
-        return response.json()
+        return self._decode(response)
+
+
+class HttpClient(_BaseHttpClient):
+    """Thin httpx wrapper with error mapping."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        cache: ResponseCache | None = None,
+        codec: str | JsonCodec = "auto",
+        compress_threshold: int | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        metrics: MetricsCollector | None = None,
+        http_cache: HttpCache | None = None,
+    ):
+        super().__init__(base_url, api_key, timeout, cache, codec, compress_threshold, metrics, http_cache)
+        self._client = httpx.Client(
+            **self._client_kwargs,
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2,
+            transport=transport,
+        )
+
+    def get(self, path: str, params: dict | None = None) -> dict:
+        if self.http_cache is None:
+            return self._request("GET", path, params=params)
+        key = self._http_cache_key(path, params)
+        entry, fresh = self.http_cache.lookup(key)
+        if fresh:
+            return entry.read()
+        headers = entry.conditional_headers() if entry is not None else None
+        response = self._send("GET", path, params=params, headers=headers)
+        return self._cached_get_result(key, entry, response, path)
+
+    def post(
+        self,
+        path: str,
+        json: dict | None = None,
+        params: dict | None = None,
+        *,
+        cache: CachePolicy | None = None,
+    ) -> dict:
+        key, cached = self._cache_lookup("POST", path, json, cache)
+        if cached is not None:
+            return cached
+        result = self._request("POST", path, json=json, params=params)
+        if key is not None:
+            self.cache.set(key, result, ttl=cache.ttl)
+        return result
+
+    def post_content(self, path: str, content: bytes, headers: dict) -> dict:
+        """POST a pre-encoded body (e.g. gzip-compressed JSON)."""
+        return self._request("POST", path, content=content, headers=headers)
+
+    def delete(self, path: str) -> dict:
+        return self._request("DELETE", path)
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        sink: IO[bytes],
+        *,
+        json: dict | None = None,
+        headers: dict | None = None,
+        chunk_size: int = 64 * 1024,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> int:
+        """Write the response body to ``sink`` in chunks; returns bytes written.
+
+        The body is never held in memory as a whole. ``progress`` is called
+        after each chunk with ``(bytes_written, total_or_None)``.
+        """
+        written = 0
+        status = None
+        response: httpx.Response | None = None
+        content, headers = self._encode_body(json, headers)
+        event = self._begin(method, path, content)
+        try:
+            with self._client.stream(method, path, content=content, headers=headers) as response:
+                status = response.status_code
+                if response.status_code >= 400:
+                    response.read()
+                    self._handle_response(response, path)
+                total = self._stream_total(response)
+                for chunk in response.iter_bytes(chunk_size):
+                    sink.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress(written, total)
+        except httpx.ConnectError as e:
+            self._end(event, status, _downloaded(response), e)
+            raise self._connect_error(e) from e
+        except httpx.TimeoutException as e:
+            self._end(event, status, _downloaded(response), e)
+            raise QbiqueError(f"Request timed out: {e}") from e
+        except BaseException as e:
+            self._end(event, status, _downloaded(response), None if status is not None else e)
+            raise
+        self._end(event, status, _downloaded(response))
+        return written
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _request(self, method: str, path: str, json: Any = None, **kwargs) -> dict:
+        return self._handle_response(self._send(method, path, json, **kwargs), path)
+
+    def _send(self, method: str, path: str, json: Any = None, **kwargs) -> httpx.Response:
+        if json is not None:
+            kwargs["content"], kwargs["headers"] = self._encode_body(json, kwargs.get("headers"))
+        event = self._begin(method, path, kwargs.get("content"))
+        try:
+            response = self._client.request(method, path, **kwargs)
+        except httpx.ConnectError as e:
+            self._end(event, None, error=e)
+            raise self._connect_error(e) from e
+        except httpx.TimeoutException as e:
+            self._end(event, None, error=e)
+            raise QbiqueError(f"Request timed out: {e}") from e
+        except BaseException as e:
+            self._end(event, None, error=e)
+            raise
+
+        self._end(event, response.status_code, response.num_bytes_downloaded)
+        return response
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """httpx.AsyncClient wrapper with the same error mapping as :class:`HttpClient`."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 30.0,
+        cache: ResponseCache | None = None,
+        codec: str | JsonCodec = "auto",
+        compress_threshold: int | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        metrics: MetricsCollector | None = None,
+        http_cache: HttpCache | None = None,
+    ):
+        super().__init__(base_url, api_key, timeout, cache, codec, compress_threshold, metrics, http_cache)
+        self._client = httpx.AsyncClient(
+            **self._client_kwargs,
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2,
+            transport=transport,
+        )
+
+    async def get(self, path: str, params: dict | None = None) -> dict:
+        if self.http_cache is None:
+            return await self._request("GET", path, params=params)
+        key = self._http_cache_key(path, params)
+        entry, fresh = self.http_cache.lookup(key)
+        if fresh:
+            return entry.read()
+        headers = entry.conditional_headers() if entry is not None else None
+        response = await self._send("GET", path, params=params, headers=headers)
+        return self._cached_get_result(key, entry, response, path)
+
+    async def post(
+        self,
+        path: str,
+        json: dict | None = None,
+        params: dict | None = None,
+        *,
+        cache: CachePolicy | None = None,
+    ) -> dict:
+        key, cached = self._cache_lookup("POST", path, json, cache)
+        if cached is not None:
+            return cached
+        result = await self._request("POST", path, json=json, params=params)
+        if key is not None:
+            self.cache.set(key, result, ttl=cache.ttl)
+        return result
+
+    async def post_content(self, path: str, content: bytes, headers: dict) -> dict:
+        """POST a pre-encoded body (e.g. gzip-compressed JSON)."""
+        return await self._request("POST", path, content=content, headers=headers)
+
+    async def delete(self, path: str) -> dict:
+        return await self._request("DELETE", path)
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        sink: IO[bytes],
+        *,
+        json: dict | None = None,
+        headers: dict | None = None,
+        chunk_size: int = 64 * 1024,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> int:
+        """Async :meth:`HttpClient.stream`."""
+        written = 0
+        status = None
+        response: httpx.Response | None = None
+        content, headers = self._encode_body(json, headers)
+        event = self._begin(method, path, content)
+        try:
+            async with self._client.stream(method, path, content=content, headers=headers) as response:
+                status = response.status_code
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._handle_response(response, path)
+                total = self._stream_total(response)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    sink.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress(written, total)
+        except httpx.ConnectError as e:
+            self._end(event, status, _downloaded(response), e)
+            raise self._connect_error(e) from e
+        except httpx.TimeoutException as e:
+            self._end(event, status, _downloaded(response), e)
+            raise QbiqueError(f"Request timed out: {e}") from e
+        except BaseException as e:
+            self._end(event, status, _downloaded(response), None if status is not None else e)
+            raise
+        self._end(event, status, _downloaded(response))
+        return written
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, json: Any = None, **kwargs) -> dict:
+        return self._handle_response(await self._send(method, path, json, **kwargs), path)
+
+    async def _send(self, method: str, path: str, json: Any = None, **kwargs) -> httpx.Response:
+        if json is not None:
+            kwargs["content"], kwargs["headers"] = self._encode_body(json, kwargs.get("headers"))
+        event = self._begin(method, path, kwargs.get("content"))
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.ConnectError as e:
+            self._end(event, None, error=e)
+            raise self._connect_error(e) from e
+        except httpx.TimeoutException as e:
+            self._end(event, None, error=e)
+            raise QbiqueError(f"Request timed out: {e}") from e
+        except BaseException as e:
+            self._end(event, None, error=e)
+            raise
+
+        self._end(event, response.status_code, response.num_bytes_downloaded)
+        return response
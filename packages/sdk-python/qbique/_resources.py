@@ -2,7 +2,29 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import inspect
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from qbique._bulk import GZIP_HEADERS, IMPORT_PATH, Chunk, ImportCheckpoint, is_retryable, iter_chunks
+from qbique.cache import CachePolicy
+from qbique._waiter import COMPLETED, JobQueue, failure_message, job_state
+from qbique.exceptions import JobFailedError, JobTimeoutError, QbiqueError
+from qbique.types import BulkImportResult, ChunkResult
+from qbique.sweep import (
+    DEFAULT_METRICS,
+    SweepCheckpoint,
+    combo_key,
+    expand_grid,
+    sweep_error_row,
+    sweep_row,
+    sweep_timeout_row,
+)
 
 if TYPE_CHECKING:
     from qbique._http import HttpClient
@@ -172,7 +194,8 @@ class BacktestResource(_BaseResource):
 
         ``portfolio_strategy`` accepts max_sharpe | risk_parity | hrp |
         min_variance | equal_weight. Returns a job descriptor; poll
-        :meth:`strategy_status` and fetch :meth:`strategy_result`.
+        :meth:`strategy_status` and fetch :meth:`strategy_result`, or use
+        :meth:`wait` / :meth:`wait_many`.
 
         Example (RP, monthly, US, 2023-2025)::
 
@@ -224,6 +247,217 @@ class BacktestResource(_BaseResource):
         """Fetch a completed strategy (greedy) backtest result."""
         return self._http.get(f"/api/backtest/strategy/greedy/{job_id}/result")
 
+    def wait(
+        self,
+        job_id: str,
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+    ) -> dict:
+        """Block until a strategy (greedy) backtest completes and return its result.
+
+        Polls :meth:`strategy_status` with adaptive backoff (see
+        :meth:`wait_many`) and fetches :meth:`strategy_result` once the job
+        reports ``completed``.
+
+        Raises:
+            JobFailedError: the job finished with a failure status.
+            JobTimeoutError: the job did not finish within ``timeout`` seconds.
+        """
+        for _, result in self.wait_many(
+            [job_id],
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+        ):
+            return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def wait_many(
+        self,
+        job_ids: Iterable[str],
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        raise_on_failure: bool = True,
+    ) -> Iterator[tuple[str, dict]]:
+        """Wait for many strategy backtests, yielding ``(job_id, result)`` in completion order.
+
+        Each job keeps its own poll schedule: the interval starts at
+        ``poll_interval`` and grows by ``backoff`` up to ``max_interval``
+        while the job reports no progress; when the server reports an
+        advancing ``progress`` fraction the next poll is aimed at the
+        estimated finish time. Status checks for all jobs share the client's
+        connection pool and are issued in deadline order, so a job is fetched
+        as soon as its next scheduled check sees it ``completed``.
+
+        Args:
+            job_ids: Job ids returned by :meth:`strategy`.
+            timeout: Overall deadline in seconds for all jobs.
+            poll_interval: Initial (and minimum) seconds between status checks.
+            max_interval: Upper bound on seconds between status checks.
+            backoff: Interval growth factor while a job shows no progress.
+            raise_on_failure: Raise :class:`JobFailedError` for a failed job.
+                When False, the failed job's status payload is yielded instead.
+
+        Raises:
+            JobFailedError: a job failed and ``raise_on_failure`` is set.
+            JobTimeoutError: jobs were still pending at the deadline.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        queue = JobQueue(poll_interval, max_interval, backoff)
+        for job_id in dict.fromkeys(job_ids):
+            queue.add(job_id, start)
+
+        while queue:
+            due, job_id = queue.pop()
+            status = self._poll_due(job_id, due)
+            state = job_state(status)
+            if state == COMPLETED:
+                queue.discard(job_id)
+                yield job_id, self.strategy_result(job_id)
+            elif state == "failed":
+                queue.discard(job_id)
+                if raise_on_failure:
+                    raise JobFailedError(failure_message(job_id, status), job_id=job_id, details=status)
+                yield job_id, status
+            else:
+                now = time.monotonic()
+                if now >= deadline:
+                    pending = [job_id] + queue.pending()
+                    raise JobTimeoutError(
+                        f"Timed out after {timeout}s waiting for {len(pending)} backtest job(s)",
+                        job_ids=pending,
+                    )
+                queue.reschedule(job_id, status, now, deadline)
+
+    def sweep(
+        self,
+        grid: Mapping[str, Sequence[Any]],
+        *,
+        start: str,
+        end: str,
+        concurrency: int = 8,
+        checkpoint: str | os.PathLike[str] | None = None,
+        metrics: Sequence[str] = DEFAULT_METRICS,
+        poll_interval: float = 1.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        timeout: float | None = None,
+        **fixed: Any,
+    ) -> Iterator[dict]:
+        """Run a strategy backtest for every combination in ``grid``.
+
+        Keeps at most ``concurrency`` jobs in flight, polls them with the
+        adaptive schedule of :meth:`wait_many`, and yields one tidy row per
+        combination as soon as its job finishes (swept params, ``job_id``,
+        ``status`` and ``metrics``; failed jobs get ``status="failed"`` and
+        an ``error`` column instead of raising). A :class:`QbiqueError` while
+        submitting or polling one combination also becomes a failed row, so
+        one bad request does not abort the sweep. See :mod:`qbique.sweep`.
+
+        With ``timeout``, a job still running that many seconds after it was
+        submitted (or picked up again from the checkpoint) gets a
+        ``status="timeout"`` row and the sweep moves on. Timeout rows are not
+        written to the checkpoint, so re-running the sweep polls those jobs
+        again instead of resubmitting them.
+
+        Args:
+            grid: Mapping of :meth:`strategy` keyword -> values to sweep.
+            start: Backtest start date (YYYY-MM-DD).
+            end: Backtest end date (YYYY-MM-DD).
+            concurrency: Maximum number of jobs submitted but not finished.
+            checkpoint: JSON-lines file that makes the sweep resumable.
+            metrics: Result fields copied into each row.
+            timeout: Seconds to wait for each job (None waits indefinitely).
+            **fixed: Other :meth:`strategy` keywords shared by every job.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        accepted = inspect.signature(BacktestResource.strategy).parameters
+        unknown = sorted(k for k in [*grid, *fixed] if k not in accepted or k in ("self", "start", "end"))
+        if unknown:
+            raise ValueError(f"Unknown strategy backtest parameter(s): {unknown}")
+
+        ckpt = SweepCheckpoint(checkpoint) if checkpoint is not None else None
+        queue = JobQueue(poll_interval, max_interval, backoff)
+        in_flight: dict[str, tuple[str, dict, float]] = {}  # job_id -> (key, params, deadline)
+        job_timeout = math.inf if timeout is None else timeout
+        todo: deque[tuple[str, dict]] = deque()
+
+        for params in expand_grid(grid):
+            key = combo_key({"start": start, "end": end, **fixed, **params})
+            if ckpt is not None and key in ckpt.rows:
+                yield ckpt.rows[key]
+            elif ckpt is not None and key in ckpt.submitted:
+                job_id = ckpt.submitted[key]
+                in_flight[job_id] = (key, params, time.monotonic() + job_timeout)
+                queue.add(job_id, time.monotonic())
+            else:
+                todo.append((key, params))
+
+        while todo or queue:
+            while todo and len(in_flight) < concurrency:
+                key, params = todo.popleft()
+                try:
+                    job = self.strategy(start=start, end=end, **fixed, **params)
+                    job_id = job.get("job_id")
+                    if not job_id:
+                        raise QbiqueError(f"No job_id returned for sweep combination {params}", details=job)
+                except QbiqueError as e:
+                    row = sweep_error_row(params, None, e, metrics)
+                    if ckpt is not None:
+                        ckpt.record_row(key, row)
+                    yield row
+                    continue
+                if ckpt is not None:
+                    ckpt.record_submit(key, job_id)
+                in_flight[job_id] = (key, params, time.monotonic() + job_timeout)
+                queue.add(job_id, time.monotonic() + poll_interval)
+
+            if not queue:  # every remaining submit failed
+                continue
+            due, job_id = queue.pop()
+            try:
+                status = self._poll_due(job_id, due)
+                state = job_state(status)
+                deadline = in_flight[job_id][2]
+                if state == "pending" and time.monotonic() < deadline:
+                    queue.reschedule(job_id, status, time.monotonic(), deadline)
+                    continue
+                result = self.strategy_result(job_id) if state == COMPLETED else status
+            except QbiqueError as e:
+                state, result = "error", e
+
+            queue.discard(job_id)
+            key, params, _ = in_flight.pop(job_id)
+            if state == COMPLETED:
+                row = sweep_row(params, job_id, COMPLETED, result, metrics)
+            elif state == "pending":
+                row = sweep_timeout_row(params, job_id, timeout, metrics)
+            elif state == "error":
+                row = sweep_error_row(params, job_id, result, metrics)
+            else:
+                row = sweep_row(params, job_id, "failed", result, metrics)
+            if ckpt is not None and state != "pending":
+                ckpt.record_row(key, row)
+            yield row
+
+    def _poll_due(self, job_id: str, due: float) -> dict:
+        """Sleep until ``due`` (monotonic time), then fetch the job status."""
+        now = time.monotonic()
+        if due > now:
+            time.sleep(due - now)
+        return self.strategy_status(job_id)
+
     def available_range(self) -> dict:
         """Available date range for strategy backtests."""
         return self._http.get("/api/backtest/strategy/available-range")
@@ -243,9 +477,34 @@ class BacktestResource(_BaseResource):
         return {"backtest_a": a, "backtest_b": b}
 
 
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
 class DataResource(_BaseResource):
     """Market data — qbique data *"""
 
+    def _cache_policy(self, enabled: bool, refresh: bool, end_date: str | date | None) -> CachePolicy | None:
+        """Client-side cache policy for a data call (only used when the client has a cache).
+
+        Ranges that end before today are immutable and never expire; open or
+        current ranges, and end dates that do not parse as ``YYYY-MM-DD``, use
+        the cache's default TTL.
+        """
+        cache = self._http.cache
+        if not enabled or cache is None:
+            return None
+        historical = False
+        if end_date is not None:
+            try:
+                historical = date.fromisoformat(str(end_date)[:10]) < date.today()
+            except ValueError:
+                pass
+        return CachePolicy(ttl=None if historical else cache.ttl, refresh=refresh)
+
     def search(self, query: str, *, limit: int = 10) -> dict:
         """Search tickers by name or code."""
         return self._http.post("/api/optimization/search-tickers", json={
@@ -266,8 +525,15 @@ class DataResource(_BaseResource):
         tickers: list[str] | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        cache: bool = True,
+        refresh: bool = False,
     ) -> dict:
-        """Fetch market data."""
+        """Fetch market data.
+
+        When the client was created with a response cache, the result is
+        stored on disk; pass ``cache=False`` to bypass it or ``refresh=True``
+        to re-download and overwrite the stored entry.
+        """
         payload: dict = {}
         if universe:
             payload["universe"] = universe
@@ -277,7 +543,9 @@ class DataResource(_BaseResource):
             payload["start_date"] = start_date
         if end_date:
             payload["end_date"] = end_date
-        return self._http.post("/api/cli/data/fetch", json=payload)
+        return self._http.post(
+            "/api/cli/data/fetch", json=payload, cache=self._cache_policy(cache, refresh, end_date)
+        )
 
     def export(
         self,
@@ -287,8 +555,71 @@ class DataResource(_BaseResource):
         start_date: str | None = None,
         end_date: str | None = None,
         format: str = "json",
+        cache: bool = True,
+        refresh: bool = False,
+    ) -> dict:
+        """Export data from the platform.
+
+        Cached like :meth:`fetch` when the client has a response cache.
+        """
+        payload = self._export_payload(dataset, tickers, start_date, end_date, format)
+        return self._http.post(
+            "/api/cli/data/export", json=payload, cache=self._cache_policy(cache, refresh, end_date)
+        )
+
+    def export_to(
+        self,
+        dataset: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        tickers: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        format: str = "csv",
+        chunk_size: int = 64 * 1024,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict:
+        """Stream an export straight to a file or binary file-like sink.
+
+        Unlike :meth:`export`, the response body is written in chunks as it
+        arrives and never decoded, so memory use stays constant regardless of
+        export size. Use ``format="csv"`` or ``format="jsonl"`` (one JSON
+        record per line) to consume the file incrementally.
+
+        Args:
+            dest: Output path (written atomically) or object with ``write(bytes)``.
+            format: ``csv`` | ``jsonl`` | ``json``.
+            chunk_size: Bytes per write.
+            progress: Called as ``progress(bytes_written, total_or_None)``.
+
+        Returns:
+            ``{"dataset", "format", "bytes", "path"}`` (``path`` is None for sinks).
+        """
+        payload, headers = self._export_stream_request(dataset, tickers, start_date, end_date, format)
+        kwargs = dict(json=payload, headers=headers, chunk_size=chunk_size, progress=progress)
+        if hasattr(dest, "write"):
+            written = self._http.stream("POST", "/api/cli/data/export", dest, **kwargs)
+            return {"dataset": dataset, "format": format, "bytes": written, "path": None}
+
+        path = os.fspath(dest)
+        tmp = path + ".part"
+        try:
+            with open(tmp, "wb") as f:
+                written = self._http.stream("POST", "/api/cli/data/export", f, **kwargs)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return {"dataset": dataset, "format": format, "bytes": written, "path": path}
+
+    @staticmethod
+    def _export_payload(
+        dataset: str,
+        tickers: list[str] | None,
+        start_date: str | None,
+        end_date: str | None,
+        format: str,
     ) -> dict:
-        """Export data from the platform."""
         payload: dict = {"dataset": dataset, "format": format}
         if tickers:
             payload["tickers"] = tickers
@@ -296,7 +627,20 @@ class DataResource(_BaseResource):
             payload["start_date"] = start_date
         if end_date:
             payload["end_date"] = end_date
-        return self._http.post("/api/cli/data/export", json=payload)
+        return payload
+
+    def _export_stream_request(
+        self,
+        dataset: str,
+        tickers: list[str] | None,
+        start_date: str | None,
+        end_date: str | None,
+        format: str,
+    ) -> tuple[dict, dict]:
+        if format not in _EXPORT_MEDIA_TYPES:
+            raise ValueError(f"format must be one of {sorted(_EXPORT_MEDIA_TYPES)}, got {format!r}")
+        payload = self._export_payload(dataset, tickers, start_date, end_date, format)
+        return payload, {"Accept": _EXPORT_MEDIA_TYPES[format]}
 
     def import_data(self, dataset: str, data: list[dict] | dict, *, metadata: dict | None = None) -> dict:
         """Import local data via API."""
@@ -306,6 +650,102 @@ class DataResource(_BaseResource):
             "metadata": metadata,
         })
 
+    def import_bulk(
+        self,
+        dataset: str,
+        records: Iterable[dict],
+        *,
+        metadata: dict | None = None,
+        chunk_records: int = 10_000,
+        max_chunk_bytes: int = 8 * 1024 * 1024,
+        parallelism: int = 4,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> BulkImportResult:
+        """Import a large record stream as gzip-compressed chunks uploaded in parallel.
+
+        ``records`` may be any iterable, including a generator: it is consumed
+        lazily and at most ``2 * parallelism`` compressed chunks are held in
+        memory at a time. Each chunk is one ``POST /api/cli/data/import``
+        request with ``Content-Encoding: gzip`` and a ``chunk`` index next to
+        ``dataset``/``data``/``metadata``. Server errors, connection failures
+        and timeouts are retried with exponential backoff; other errors mark
+        the chunk failed without stopping the import.
+
+        Pass ``checkpoint`` to make the import resumable: accepted chunk
+        indexes are appended to that file, and a re-run with the same records
+        and limits skips them. The file records the dataset and limits;
+        resuming with different ones, or with records that no longer match
+        a recorded chunk, raises :class:`ValueError`.
+
+        Args:
+            dataset: Target dataset name.
+            records: Iterable of record dicts.
+            metadata: Sent with every chunk.
+            chunk_records: Maximum records per chunk.
+            max_chunk_bytes: Maximum uncompressed JSON bytes of records per chunk.
+            parallelism: Concurrent chunk uploads.
+            max_retries: Retries per chunk for retryable errors.
+            retry_backoff: Initial retry delay in seconds (doubles per attempt).
+            checkpoint: JSON-lines file of accepted chunks.
+
+        Returns:
+            :class:`~qbique.types.BulkImportResult` with one entry per chunk.
+        """
+        if parallelism < 1:
+            raise ValueError("parallelism must be >= 1")
+        ckpt = None
+        if checkpoint is not None:
+            ckpt = ImportCheckpoint(
+                checkpoint, dataset=dataset, chunk_records=chunk_records, max_chunk_bytes=max_chunk_bytes
+            )
+        chunks = iter_chunks(
+            dataset,
+            records,
+            metadata=metadata,
+            max_records=chunk_records,
+            max_bytes=max_chunk_bytes,
+            skip=frozenset(ckpt.done) if ckpt is not None else frozenset(),
+        )
+        result = BulkImportResult(dataset=dataset)
+        with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="qbique-import") as pool:
+            pending: set[Future] = set()
+            for chunk in chunks:
+                if chunk.skipped:
+                    ckpt.verify(chunk)
+                    result.chunks.append(ChunkResult(
+                        chunk.index, chunk.offset, chunk.records, 0, ok=True, skipped=True
+                    ))
+                    continue
+                if len(pending) >= 2 * parallelism:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    result.chunks.extend(f.result() for f in done)
+                pending.add(pool.submit(self._upload_chunk, chunk, max_retries, retry_backoff, ckpt))
+            result.chunks.extend(f.result() for f in pending)
+        result.chunks.sort(key=lambda c: c.index)
+        return result
+
+    def _upload_chunk(
+        self, chunk: Chunk, max_retries: int, retry_backoff: float, ckpt: ImportCheckpoint | None
+    ) -> ChunkResult:
+        outcome = ChunkResult(chunk.index, chunk.offset, chunk.records, len(chunk.body), ok=False)
+        while True:
+            outcome.attempts += 1
+            try:
+                self._http.post_content(IMPORT_PATH, chunk.body, GZIP_HEADERS)
+            except QbiqueError as e:
+                outcome.error = str(e)
+                if outcome.attempts > max_retries or not is_retryable(e):
+                    return outcome
+                self._http.record_retry("POST", IMPORT_PATH)
+                time.sleep(retry_backoff * 2 ** (outcome.attempts - 1))
+                continue
+            outcome.ok, outcome.error = True, None
+            if ckpt is not None:
+                ckpt.record(chunk.index, chunk.offset, chunk.records)
+            return outcome
+
 
 class PortfolioResource(_BaseResource):
     """Portfolio monitoring — qbique portfolio *"""
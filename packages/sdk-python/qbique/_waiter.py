@@ -0,0 +1,93 @@
+"""Adaptive polling schedule shared by the sync/async job waiters."""
+
+from __future__ import annotations
+
+import heapq
+
+COMPLETED = "completed"
+FAILED = frozenset({"failed", "error", "cancelled"})
+
+
+def job_state(status: dict) -> str:
+    """Classify a job status payload as ``completed``, ``failed`` or ``pending``."""
+    value = str(status.get("status", "")).lower()
+    if value == COMPLETED:
+        return COMPLETED
+    if value in FAILED:
+        return "failed"
+    return "pending"
+
+
+def failure_message(job_id: str, status: dict) -> str:
+    reason = status.get("message") or status.get("error") or "unknown error"
+    return f"Backtest job {job_id} failed: {reason}"
+
+
+class PollSchedule:
+    """Per-job poll interval with exponential backoff and progress-based ETA.
+
+    While a job reports no progress the interval grows geometrically from
+    ``poll_interval`` up to ``max_interval``. Once the server reports a
+    numeric ``progress`` (0..1) that advances between polls, the next poll is
+    scheduled at the estimated completion time instead, which keeps the dead
+    time after a job finishes short without hammering the status endpoint.
+    """
+
+    def __init__(self, poll_interval: float, max_interval: float, backoff: float):
+        if poll_interval <= 0 or max_interval < poll_interval or backoff < 1.0:
+            raise ValueError("require 0 < poll_interval <= max_interval and backoff >= 1")
+        self.min_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._interval = poll_interval
+        self._last: tuple[float, float] | None = None  # (time, progress)
+
+    def next_delay(self, status: dict, now: float) -> float:
+        progress = status.get("progress")
+        if isinstance(progress, (int, float)) and not isinstance(progress, bool):
+            last = self._last
+            self._last = (now, float(progress))
+            if last is not None and progress > last[1] and now > last[0]:
+                rate = (progress - last[1]) / (now - last[0])
+                eta = max(1.0 - progress, 0.0) / rate
+                return min(max(eta, self.min_interval), self.max_interval)
+
+        delay = self._interval
+        self._interval = min(self._interval * self.backoff, self.max_interval)
+        return delay
+
+
+class JobQueue:
+    """Deadline-ordered poll queue with one :class:`PollSchedule` per job."""
+
+    def __init__(self, poll_interval: float, max_interval: float, backoff: float):
+        self._args = (poll_interval, max_interval, backoff)
+        self._schedules: dict[str, PollSchedule] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, job_id: str, due: float) -> None:
+        self._schedules[job_id] = PollSchedule(*self._args)
+        self._push(job_id, due)
+
+    def pop(self) -> tuple[float, str]:
+        """Remove and return the job whose next check is due first."""
+        due, _, job_id = heapq.heappop(self._heap)
+        return due, job_id
+
+    def reschedule(self, job_id: str, status: dict, now: float, deadline: float) -> None:
+        delay = self._schedules[job_id].next_delay(status, now)
+        self._push(job_id, min(now + delay, deadline))
+
+    def discard(self, job_id: str) -> None:
+        self._schedules.pop(job_id, None)
+
+    def pending(self) -> list[str]:
+        return [job_id for _, _, job_id in sorted(self._heap)]
+
+    def _push(self, job_id: str, due: float) -> None:
+        heapq.heappush(self._heap, (due, self._seq, job_id))
+        self._seq += 1
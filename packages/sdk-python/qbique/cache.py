@@ -0,0 +1,370 @@
+"""Opt-in response caches: a persistent store for market data and an
+in-memory HTTP validator cache for polled GETs.
+
+Usage::
+
+    from qbique import QbiqueClient
+    from qbique.cache import ResponseCache
+
+    client = QbiqueClient(api_key="qbi_xxx", cache=ResponseCache(max_bytes=1 << 30))
+    client.data.fetch(universe="KOSPI", start_date="2015-01-01", end_date="2024-12-31")  # network
+    client.data.fetch(universe="KOSPI", start_date="2015-01-01", end_date="2024-12-31")  # disk
+
+    client.data.fetch(universe="KOSPI", cache=False)     # bypass
+    client.data.fetch(universe="KOSPI", refresh=True)    # re-download and overwrite
+    client.cache.clear()
+
+Entries are keyed on server, method, path and the normalized request payload.
+Each entry carries an optional expiry; the total stored size is capped and the
+least recently used entries are evicted first.
+
+:class:`HttpCache` follows HTTP caching semantics instead, for GETs that are
+polled repeatedly (portfolio summaries, strategy and contract lists)::
+
+    client = QbiqueClient(api_key="qbi_xxx", http_cache=True)
+    client.portfolio.summary("p1")   # 200, stored with its ETag / Last-Modified
+    client.portfolio.summary("p1")   # If-None-Match -> 304, served from memory
+    client.http_cache.stats()        # {"hits": 0, "revalidated": 1, "misses": 1, ...}
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+
+def default_cache_dir() -> str:
+    """``$QBIQUE_CACHE_DIR``, else ``$XDG_CACHE_HOME/qbique``, else ``~/.cache/qbique``."""
+    if os.environ.get("QBIQUE_CACHE_DIR"):
+        return os.environ["QBIQUE_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "qbique")
+
+
+def make_key(
+    base_url: str, method: str, path: str, payload: Any = None, *, api_key: str | None = None
+) -> str:
+    """Stable cache key; payload dict keys are sorted and ``None`` values dropped.
+
+    Pass ``api_key`` to keep entries of different keys apart in a shared cache.
+    Only the SHA-256 of the key parts is stored, never the API key itself.
+    """
+    if isinstance(payload, dict):
+        payload = {k: v for k, v in payload.items() if v is not None}
+    canonical = json.dumps(
+        [str(base_url).rstrip("/"), method.upper(), path, payload, api_key],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Per-call cache behaviour.
+
+    Attributes:
+        ttl: Seconds until the stored entry expires; ``None`` never expires
+            (still subject to LRU eviction).
+        refresh: Skip the lookup and overwrite the entry with a fresh response.
+    """
+
+    ttl: float | None = None
+    refresh: bool = False
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL, a size cap and LRU eviction.
+
+    Args:
+        directory: Cache directory (default: :func:`default_cache_dir`).
+        ttl: Default entry lifetime in seconds for responses that may change.
+        max_bytes: Cap on the total compressed size of stored entries.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        ttl: float = 24 * 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.directory = os.fspath(directory) if directory is not None else default_cache_dir()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(self.directory, "responses.sqlite3"),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+            " expires REAL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or ``None`` on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store ``value`` (JSON-serializable) and evict LRU entries over the size cap."""
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode(), 6)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires, now),
+            )
+            self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """Drop one entry; returns whether it existed."""
+        with self._lock:
+            return self._db.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+
+    def size(self) -> int:
+        """Total stored (compressed) bytes."""
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self) -> int:
+        """Number of live (unexpired) entries."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM entries WHERE expires IS NULL OR expires > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _evict(self) -> None:
+        self._db.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(directory={self.directory!r}, hits={self.hits}, misses={self.misses})"
+
+
+_DIRECTIVE = re.compile(r'([\w-]+)(?:=(?:"([^"]*)"|([^,\s]*)))?')
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """``Cache-Control`` directives as ``{name: argument_or_None}`` (names lowercased)."""
+    if not value:
+        return {}
+    return {m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3)
+            for m in _DIRECTIVE.finditer(value)}
+
+
+def freshness_lifetime(headers: Mapping[str, str], now: float) -> float:
+    """Seconds a response stays fresh: ``max-age`` minus ``Age``, else ``Expires``, else 0."""
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(headers.get("Age") or 0)
+            return max(float(max_age) - age, 0.0)
+        except ValueError:
+            return 0.0
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return max(parsedate_to_datetime(expires).timestamp() - now, 0.0)
+        except (TypeError, ValueError):
+            return 0.0  # invalid Expires means already expired
+    return 0.0
+
+
+def _copy_value(value: Any) -> Any:
+    """Deep copy of a decoded JSON value (about twice as fast as ``copy.deepcopy``)."""
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return copy.deepcopy(value)
+
+
+@dataclass
+class HttpCacheEntry:
+    """A stored GET response: decoded value, validators and freshness deadline.
+
+    ``value`` is owned by the cache; :meth:`read` hands out private copies.
+    """
+
+    value: Any
+    etag: str | None
+    last_modified: str | None
+    fresh_until: float
+    size: int
+
+    def read(self) -> Any:
+        """Return a copy of the cached value that the caller may mutate."""
+        return _copy_value(self.value)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """In-memory HTTP cache for GET responses with validator revalidation.
+
+    A ``200`` response is stored when it carries an ``ETag`` or
+    ``Last-Modified`` validator or a freshness lifetime (``Cache-Control:
+    max-age`` or ``Expires``), unless it says ``Cache-Control: no-store``.
+    While fresh it is served without a request; once stale (immediately for
+    ``no-cache`` or without a lifetime) the next call sends ``If-None-Match``
+    / ``If-Modified-Since`` and a ``304 Not Modified`` is answered from
+    memory. The decoded value is kept, so a revalidated response costs
+    neither the body transfer nor JSON decoding.
+
+    The cache keeps its own copy of each value and every hit or ``304``
+    returns a fresh copy, so callers may mutate results freely. Entries are
+    keyed per server, API key, path and query parameters, so one cache may be
+    shared by several clients.
+
+    Args:
+        max_entries: Stored responses kept; least recently used are evicted.
+        max_entry_bytes: Responses with larger bodies are not stored.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, max_entry_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.hits = 0  # fresh entries served without a request
+        self.revalidated = 0  # 304 responses served from memory
+        self.misses = 0  # full responses downloaded
+        self.bytes_saved = 0  # body bytes not transferred thanks to hits and 304s
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, HttpCacheEntry] = OrderedDict()
+
+    def lookup(self, key: str) -> tuple[HttpCacheEntry | None, bool]:
+        """Return ``(entry, fresh)``; a fresh entry is counted as a hit."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            if entry.fresh_until > time.monotonic():
+                self.hits += 1
+                self.bytes_saved += entry.size
+                return entry, True
+            return entry, False
+
+    def not_modified(self, key: str, entry: HttpCacheEntry, headers: Mapping[str, str]) -> Any:
+        """Apply a ``304`` to ``entry`` (refreshing validators and lifetime); returns a copy of its value."""
+        now = time.monotonic()
+        with self._lock:
+            self.revalidated += 1
+            self.bytes_saved += entry.size
+            if "no-store" in parse_cache_control(headers.get("Cache-Control")):
+                self._entries.pop(key, None)
+                return entry.read()
+            entry.etag = headers.get("ETag") or entry.etag
+            entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+            entry.fresh_until = now + freshness_lifetime(headers, time.time())
+        return entry.read()
+
+    def store(self, key: str, headers: Mapping[str, str], value: Any, size: int) -> None:
+        """Record a full ``200`` response, storing a copy of ``value`` when it is cacheable."""
+        now = time.monotonic()
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        lifetime = freshness_lifetime(headers, time.time())
+        cacheable = (
+            "no-store" not in directives
+            and size <= self.max_entry_bytes
+            and (etag is not None or last_modified is not None or lifetime > 0)
+        )
+        with self._lock:
+            self.misses += 1
+            if not cacheable:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = HttpCacheEntry(_copy_value(value), etag, last_modified, now + lifetime, size)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> bool:
+        """Drop one entry; returns whether it existed."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+                "bytes": sum(e.size for e in self._entries.values()),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"HttpCache(hits={self.hits}, revalidated={self.revalidated}, misses={self.misses})"
@@ -30,11 +30,37 @@ Usage:
 
     # Health
     client.health.check()
+
+    # Conditional GET cache (ETag / Last-Modified / Cache-Control)
+    client = QbiqueClient(api_key="qbi_xxx", http_cache=True)
+    client.http_cache.stats()
+
+    # Metrics
+    client.metrics.snapshot()
+    print(client.metrics.to_prometheus())
+
+    # Async
+    async with AsyncQbiqueClient(api_key="qbi_xxx") as client:
+        results = await asyncio.gather(*(client.backtest.strategy_status(j) for j in job_ids))
 """
 
 from __future__ import annotations
 
-from qbique._http import HttpClient
+import httpx
+
+from qbique.cache import HttpCache, ResponseCache
+from qbique.metrics import MetricsCollector, RequestHook, ResponseHook
+from qbique.pool import ConnectionPool
+from qbique._http import HttpClient, AsyncHttpClient
+from qbique._async_resources import (
+    AsyncStrategyResource,
+    AsyncOptimizeResource,
+    AsyncBacktestResource,
+    AsyncDataResource,
+    AsyncPortfolioResource,
+    AsyncContractResource,
+    AsyncHealthResource,
+)
 from qbique._resources import (
     StrategyResource,
     OptimizeResource,
@@ -46,6 +72,30 @@ from qbique._resources import (
 )
 
 
+def _resolve_metrics(metrics: MetricsCollector | bool | None) -> MetricsCollector | None:
+    if metrics is True:
+        return MetricsCollector()
+    if metrics is False:
+        return None
+    return metrics
+
+
+def _resolve_cache(cache: ResponseCache | bool | None) -> ResponseCache | None:
+    if cache is True:
+        return ResponseCache()
+    if cache is False:
+        return None
+    return cache
+
+
+def _resolve_http_cache(http_cache: HttpCache | bool | None) -> HttpCache | None:
+    if http_cache is True:
+        return HttpCache()
+    if http_cache is False:
+        return None
+    return http_cache
+
+
 class QbiqueClient:
     """Qbique platform API client.
 
@@ -53,6 +103,28 @@ class QbiqueClient:
         api_key: API key for authentication (qbi_xxx format).
         endpoint: Backend server URL (default: http://localhost:8001).
         timeout: Request timeout in seconds (default: 30).
+        cache: Persistent response cache for market data calls. Pass a
+            :class:`~qbique.cache.ResponseCache`, or True for one in the
+            default location (default: disabled).
+        json_codec: JSON backend: auto | orjson | msgspec | stdlib
+            (default: auto, the fastest installed).
+        compress_threshold: Gzip request bodies of at least this many bytes
+            (default: None, never).
+        pool: Shared :class:`~qbique.pool.ConnectionPool`. When given, the
+            connection options below are taken from the pool.
+        max_connections: Maximum concurrent connections (default: 100).
+        max_keepalive_connections: Idle connections kept open (default: 20).
+        keepalive_expiry: Seconds an idle connection is kept (default: 5).
+        http2: Negotiate HTTP/2 (requires ``qbique[http2]``; default: False).
+        transport: Custom httpx transport (e.g. a mock for tests).
+        metrics: Per-endpoint request metrics. Pass a shared
+            :class:`~qbique.metrics.MetricsCollector`, or False to disable
+            (default: True, a collector per client).
+        http_cache: In-memory HTTP cache for GETs: honours Cache-Control
+            and revalidates with ETag / Last-Modified. Cached results are
+            returned as copies, so they are safe to mutate. Pass a
+            :class:`~qbique.cache.HttpCache`, or True for a new one
+            (default: disabled).
     """
 
     def __init__(
@@ -60,8 +132,37 @@ class QbiqueClient:
         api_key: str,
         endpoint: str = "http://localhost:8001",
         timeout: float = 30.0,
+        cache: ResponseCache | bool | None = None,
+        json_codec: str = "auto",
+        compress_threshold: int | None = None,
+        pool: ConnectionPool | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        transport=None,
+        metrics: MetricsCollector | bool = True,
+        http_cache: HttpCache | bool | None = None,
     ):
-        self._http = HttpClient(base_url=endpoint, api_key=api_key, timeout=timeout)
+        if pool is not None and transport is None:
+            transport = pool.transport()
+        self._http = HttpClient(
+            base_url=endpoint,
+            api_key=api_key,
+            timeout=timeout,
+            cache=_resolve_cache(cache),
+            codec=json_codec,
+            compress_threshold=compress_threshold,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+            metrics=_resolve_metrics(metrics),
+            http_cache=_resolve_http_cache(http_cache),
+        )
 
         # Resource namespaces
         self.strategy = StrategyResource(self._http)
@@ -72,6 +173,35 @@ class QbiqueClient:
         self.contract = ContractResource(self._http)
         self.health = HealthResource(self._http)
 
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The persistent response cache, if enabled."""
+        return self._http.cache
+
+    def invalidate_cache(self, method: str, path: str, payload: dict | None = None) -> bool:
+        """Drop the cached response for ``method path payload``; returns whether it existed."""
+        return self._http.invalidate_cache(method, path, payload)
+
+    @property
+    def metrics(self) -> MetricsCollector | None:
+        """Per-endpoint request metrics, if enabled."""
+        return self._http.metrics
+
+    @property
+    def http_cache(self) -> HttpCache | None:
+        """The in-memory HTTP (ETag / Cache-Control) cache, if enabled."""
+        return self._http.http_cache
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """Register ``hook(RequestEvent)`` to run before every request. Usable as a decorator."""
+        self._http.request_hooks.append(hook)
+        return hook
+
+    def on_response(self, hook: ResponseHook) -> ResponseHook:
+        """Register ``hook(ResponseEvent)`` to run after every request. Usable as a decorator."""
+        self._http.response_hooks.append(hook)
+        return hook
+
     def close(self) -> None:
         """Close the underlying HTTP client."""
         self._http.close()
@@ -84,3 +214,111 @@ class QbiqueClient:
 
     def __repr__(self) -> str:
         return f"QbiqueClient(endpoint={self._http._client.base_url!r})"
+
+
+class AsyncQbiqueClient:
+    """Async Qbique platform API client built on ``httpx.AsyncClient``.
+
+    Exposes the same namespaces as :class:`QbiqueClient`; every method is
+    awaitable, so many requests can be fanned out from one event loop.
+
+    Args:
+        api_key: API key for authentication (qbi_xxx format).
+        endpoint: Backend server URL (default: http://localhost:8001).
+        timeout: Request timeout in seconds (default: 30).
+        cache: Persistent response cache for market data calls.
+        json_codec: JSON backend (see :class:`QbiqueClient`).
+        compress_threshold: Gzip request bodies of at least this many bytes.
+        pool, max_connections, max_keepalive_connections, keepalive_expiry,
+        http2, transport: Connection options (see :class:`QbiqueClient`).
+        metrics: Per-endpoint request metrics (see :class:`QbiqueClient`).
+        http_cache: In-memory HTTP cache for GETs (see :class:`QbiqueClient`).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str = "http://localhost:8001",
+        timeout: float = 30.0,
+        cache: ResponseCache | bool | None = None,
+        json_codec: str = "auto",
+        compress_threshold: int | None = None,
+        pool: ConnectionPool | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        transport=None,
+        metrics: MetricsCollector | bool = True,
+        http_cache: HttpCache | bool | None = None,
+    ):
+        if pool is not None and transport is None:
+            transport = pool.async_transport()
+        self._http = AsyncHttpClient(
+            base_url=endpoint,
+            api_key=api_key,
+            timeout=timeout,
+            cache=_resolve_cache(cache),
+            codec=json_codec,
+            compress_threshold=compress_threshold,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+            metrics=_resolve_metrics(metrics),
+            http_cache=_resolve_http_cache(http_cache),
+        )
+
+        # Resource namespaces
+        self.strategy = AsyncStrategyResource(self._http)
+        self.optimize = AsyncOptimizeResource(self._http)
+        self.backtest = AsyncBacktestResource(self._http)
+        self.data = AsyncDataResource(self._http)
+        self.portfolio = AsyncPortfolioResource(self._http)
+        self.contract = AsyncContractResource(self._http)
+        self.health = AsyncHealthResource(self._http)
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The persistent response cache, if enabled."""
+        return self._http.cache
+
+    def invalidate_cache(self, method: str, path: str, payload: dict | None = None) -> bool:
+        """Drop the cached response for ``method path payload``; returns whether it existed."""
+        return self._http.invalidate_cache(method, path, payload)
+
+    @property
+    def metrics(self) -> MetricsCollector | None:
+        """Per-endpoint request metrics, if enabled."""
+        return self._http.metrics
+
+    @property
+    def http_cache(self) -> HttpCache | None:
+        """The in-memory HTTP (ETag / Cache-Control) cache, if enabled."""
+        return self._http.http_cache
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """Register ``hook(RequestEvent)`` to run before every request. Usable as a decorator."""
+        self._http.request_hooks.append(hook)
+        return hook
+
+    def on_response(self, hook: ResponseHook) -> ResponseHook:
+        """Register ``hook(ResponseEvent)`` to run after every request. Usable as a decorator."""
+        self._http.response_hooks.append(hook)
+        return hook
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http.close()
+
+    async def __aenter__(self) -> AsyncQbiqueClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f"AsyncQbiqueClient(endpoint={self._http._client.base_url!r})"
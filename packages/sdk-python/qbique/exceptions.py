@@ -33,3 +33,19 @@ class ServerError(QbiqueError):
 class ConnectionError(QbiqueError):
     """Cannot connect to the Qbique server."""
     pass
+
+
+class JobFailedError(QbiqueError):
+    """A server-side job finished with a failure status."""
+
+    def __init__(self, message: str, job_id: str, details: dict | None = None):
+        super().__init__(message, details=details)
+        self.job_id = job_id
+
+
+class JobTimeoutError(QbiqueError):
+    """Waiting for one or more jobs exceeded the timeout."""
+
+    def __init__(self, message: str, job_ids: list[str]):
+        super().__init__(message)
+        self.job_ids = job_ids
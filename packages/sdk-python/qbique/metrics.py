@@ -0,0 +1,204 @@
+"""Per-endpoint request metrics and request/response hooks.
+
+Every client records into a :class:`MetricsCollector` (``client.metrics``)::
+
+    client.metrics.snapshot()        # dict, also client.metrics.to_json()
+    print(client.metrics.to_prometheus())
+
+    client.on_response(lambda ev: ev.elapsed > 1.0 and log.warning("slow %s", ev.endpoint))
+
+Endpoints are templated by replacing id-like path segments (all digits, UUIDs,
+long hex strings) with ``{id}`` (``/api/optimization/result/123`` ->
+``/api/optimization/result/{id}``), so series stay bounded no matter how many
+ids are requested. Other segments, including versions such as ``v2``, are kept.
+``response_bytes`` counts bytes received on the wire (before gzip decoding).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(
+    r"\d+"
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|(?=.*\d)[0-9a-fA-F]{8,}"
+)
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse id-like path segments (digits, UUIDs, hex of 8+ chars) to ``{id}``."""
+    path = path.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.fullmatch(seg) else seg for seg in path.split("/"))
+
+
+@dataclass
+class RequestEvent:
+    """Passed to request hooks before a request is sent."""
+    method: str
+    path: str
+    endpoint: str
+    request_bytes: int
+    started: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class ResponseEvent:
+    """Passed to response hooks after a request finishes (or fails)."""
+    method: str
+    path: str
+    endpoint: str
+    status_code: int | None
+    elapsed: float
+    request_bytes: int
+    response_bytes: int  # as received, before Content-Encoding is decoded
+    error: str | None = None
+
+
+class _EndpointStats:
+    __slots__ = ("count", "errors", "retries", "in_flight", "latency_sum", "buckets",
+                 "status_codes", "request_bytes", "response_bytes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.status_codes: dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bucket bound containing quantile ``q`` (``inf`` for the overflow bucket)."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else float("inf")
+        return float("inf")
+
+
+class MetricsCollector:
+    """Thread-safe per-endpoint latency histograms, payload sizes, status codes,
+    retry counts and in-flight gauges. One collector may be shared by many clients.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], _EndpointStats] = {}
+
+    def _get(self, method: str, endpoint: str) -> _EndpointStats:
+        key = (method, endpoint)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats()
+        return stats
+
+    def request_started(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._get(event.method, event.endpoint).in_flight += 1
+
+    def request_finished(self, event: ResponseEvent) -> None:
+        with self._lock:
+            stats = self._get(event.method, event.endpoint)
+            stats.in_flight -= 1
+            stats.count += 1
+            stats.latency_sum += event.elapsed
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+            status = str(event.status_code) if event.status_code is not None else "error"
+            stats.status_codes[status] = stats.status_codes.get(status, 0) + 1
+            if event.error is not None or (event.status_code or 0) >= 400:
+                stats.errors += 1
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+
+    def record_retry(self, method: str, path: str) -> None:
+        with self._lock:
+            self._get(method, endpoint_template(path)).retries += 1
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return sum(s.in_flight for s in self._stats.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict:
+        """Point-in-time metrics keyed by ``"METHOD endpoint"``."""
+        with self._lock:
+            out = {}
+            for (method, endpoint), s in sorted(self._stats.items()):
+                out[f"{method} {endpoint}"] = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": s.count,
+                    "errors": s.errors,
+                    "retries": s.retries,
+                    "in_flight": s.in_flight,
+                    "latency": {
+                        "sum": s.latency_sum,
+                        "mean": s.latency_sum / s.count if s.count else None,
+                        "p50": s.quantile(0.50),
+                        "p95": s.quantile(0.95),
+                        "p99": s.quantile(0.99),
+                        "buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], s.buckets)),
+                    },
+                    "status_codes": dict(s.status_codes),
+                    "request_bytes": s.request_bytes,
+                    "response_bytes": s.response_bytes,
+                }
+            return out
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "qbique_sdk") -> str:
+        """Prometheus text exposition format snapshot."""
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Request latency.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        counters = {
+            "requests_total": [], "request_errors_total": [], "request_retries_total": [],
+            "request_bytes_total": [], "response_bytes_total": [], "requests_in_flight": [],
+        }
+        with self._lock:
+            items = sorted(self._stats.items())
+            for (method, endpoint), s in items:
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                cumulative = 0
+                for bound, n in zip([*map(str, LATENCY_BUCKETS), "+Inf"], s.buckets):
+                    cumulative += n
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {s.latency_sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {s.count}")
+                for status, n in sorted(s.status_codes.items()):
+                    counters["requests_total"].append(f'{prefix}_requests_total{{{labels},status="{status}"}} {n}')
+                counters["request_errors_total"].append(f"{prefix}_request_errors_total{{{labels}}} {s.errors}")
+                counters["request_retries_total"].append(f"{prefix}_request_retries_total{{{labels}}} {s.retries}")
+                counters["request_bytes_total"].append(f"{prefix}_request_bytes_total{{{labels}}} {s.request_bytes}")
+                counters["response_bytes_total"].append(f"{prefix}_response_bytes_total{{{labels}}} {s.response_bytes}")
+                counters["requests_in_flight"].append(f"{prefix}_requests_in_flight{{{labels}}} {s.in_flight}")
+        for name, samples in counters.items():
+            kind = "gauge" if name == "requests_in_flight" else "counter"
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+RequestHook = Callable[[RequestEvent], None]
+ResponseHook = Callable[[ResponseEvent], None]
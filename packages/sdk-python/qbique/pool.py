@@ -0,0 +1,134 @@
+"""Shareable connection pool for many clients in one process.
+
+Usage::
+
+    from qbique import ConnectionPool, QbiqueClient
+
+    pool = ConnectionPool(max_connections=200, max_keepalive_connections=50, http2=True)
+    clients = [QbiqueClient(api_key=key, pool=pool) for key in api_keys]
+    ...
+    for c in clients:
+        c.close()          # does not close the shared pool
+    pool.close()           # await pool.aclose() once async clients used it
+
+Every client bound to the same pool reuses its keep-alive connections (and,
+with ``http2=True``, multiplexes requests over them), so TLS handshakes are
+paid once per connection instead of once per client. HTTP/2 requires the
+``h2`` package (``pip install qbique[http2]``).
+"""
+
+from __future__ import annotations
+
+import threading
+import warnings
+
+import httpx
+
+
+class ConnectionPool:
+    """Owns one sync and one async httpx transport that clients can share.
+
+    Args:
+        max_connections: Maximum concurrent connections (default: 100).
+        max_keepalive_connections: Idle connections kept open (default: 20).
+        keepalive_expiry: Seconds an idle connection is kept (default: 5).
+        http2: Negotiate HTTP/2 when the server supports it (default: False).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._lock = threading.Lock()
+        self._transport: httpx.HTTPTransport | None = None
+        self._async_transport: httpx.AsyncHTTPTransport | None = None
+
+    def transport(self) -> httpx.BaseTransport:
+        """A handle on the shared sync transport; closing it leaves the pool open."""
+        with self._lock:
+            if self._transport is None:
+                self._transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+            return _SharedTransport(self._transport)
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """A handle on the shared async transport; closing it leaves the pool open."""
+        with self._lock:
+            if self._async_transport is None:
+                self._async_transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            return _SharedAsyncTransport(self._async_transport)
+
+    def close(self) -> None:
+        """Close the sync transport and its connections.
+
+        The async transport can only be closed from its event loop; if async
+        clients used the pool, a ``ResourceWarning`` points to :meth:`aclose`.
+        """
+        with self._lock:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+            async_open = self._async_transport is not None
+        if async_open:
+            warnings.warn(
+                "ConnectionPool.close() left the async transport open; use 'await pool.aclose()'",
+                ResourceWarning,
+                stacklevel=2,
+            )
+
+    async def aclose(self) -> None:
+        """Close both transports and their connections."""
+        with self._lock:
+            transport, self._async_transport = self._async_transport, None
+        self.close()
+        if transport is not None:
+            await transport.aclose()
+
+    def __enter__(self) -> ConnectionPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> ConnectionPool:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionPool(max_connections={self.limits.max_connections}, "
+            f"max_keepalive_connections={self.limits.max_keepalive_connections}, http2={self.http2})"
+        )
+
+
+class _SharedTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
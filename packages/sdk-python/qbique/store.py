@@ -0,0 +1,278 @@
+"""Incremental local price store with gap-only fetching.
+
+Usage::
+
+    from qbique import QbiqueClient
+    from qbique.store import PriceStore
+    from qbique_strategy import MarketData
+
+    client = QbiqueClient(api_key="qbi_xxx")
+    store = PriceStore(client, "~/.qbique/prices")
+
+    prices = store.fetch(universe="KOSPI", start_date="2015-01-01")  # first run: full history
+    prices = store.fetch(universe="KOSPI", start_date="2015-01-01")  # next day: one day fetched
+    market_data = MarketData(prices)
+
+Each dataset (a universe, or ``_tickers`` for explicit ticker requests) is
+kept as NumPy files — a ``dates x tickers`` float64 close matrix plus its date
+and ticker axes — alongside a JSON record of which ``(ticker, date range)``
+spans are already held. Only the missing spans are requested through
+``DataResource.fetch(start_date=..., end_date=...)``. Spans are only marked as
+held up to yesterday, so the current day is re-fetched until it settles.
+
+Requires pandas and numpy (``pip install qbique[jupyter]``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Iterable
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as e:  # pragma: no cover - optional dependency
+    raise ImportError("qbique.store requires pandas and numpy: pip install qbique[jupyter]") from e
+
+if TYPE_CHECKING:
+    from qbique.client import QbiqueClient
+
+Span = tuple[date, date]
+
+_UNIVERSE_KEY = "*"
+_TICKERS_DATASET = "_tickers"
+
+
+def parse_price_records(response: dict) -> pd.DataFrame:
+    """Parse a ``data.fetch`` response into a ``dates x tickers`` close frame.
+
+    Expects long-format records (the same shape as ``qbique data import``)::
+
+        {"data": [{"ticker": "005930", "trade_date": "2024-01-02", "close": 78000}, ...]}
+    """
+    records = response.get("data", response)
+    if isinstance(records, dict):
+        records = records.get("prices", records.get("records", []))
+    if not records:
+        return pd.DataFrame(dtype="float64")
+    long = pd.DataFrame.from_records(records, columns=["ticker", "trade_date", "close"])
+    long["trade_date"] = pd.to_datetime(long["trade_date"])
+    long["ticker"] = long["ticker"].astype(str)
+    wide = long.pivot_table(index="trade_date", columns="ticker", values="close", aggfunc="last")
+    wide.columns.name = None
+    wide.index.name = None
+    return wide.astype("float64").sort_index()
+
+
+def merge_spans(spans: Iterable[Span]) -> list[Span]:
+    """Merge overlapping or adjacent day spans."""
+    merged: list[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_spans(held: Iterable[Span], start: date, end: date) -> list[Span]:
+    """Sub-ranges of ``[start, end]`` not covered by ``held``."""
+    gaps: list[Span] = []
+    cursor = start
+    for h_start, h_end in merge_spans(held):
+        if h_end < cursor:
+            continue
+        if h_start > end:
+            break
+        if h_start > cursor:
+            gaps.append((cursor, h_start - timedelta(days=1)))
+        cursor = max(cursor, h_end + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class PriceStore:
+    """Local close-price store that fetches only the spans it does not hold.
+
+    Args:
+        client: Client used for ``data.fetch`` calls.
+        directory: Root directory for the stored datasets.
+        parser: Converts a ``data.fetch`` response into a ``dates x tickers``
+            frame (default: :func:`parse_price_records`).
+    """
+
+    def __init__(
+        self,
+        client: QbiqueClient,
+        directory: str | os.PathLike[str],
+        *,
+        parser: Callable[[dict], pd.DataFrame] = parse_price_records,
+    ):
+        self._client = client
+        self.directory = os.path.expanduser(os.fspath(directory))
+        self._parser = parser
+        os.makedirs(self.directory, exist_ok=True)
+
+    def fetch(
+        self,
+        *,
+        universe: str | None = None,
+        tickers: list[str] | None = None,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+    ) -> pd.DataFrame:
+        """Return close prices for ``[start_date, end_date]``, fetching only missing spans.
+
+        Same selection arguments as ``DataResource.fetch``. ``start_date``
+        is required; ``end_date`` defaults to today. The result has a
+        ``DatetimeIndex`` and one column per ticker, ready for
+        ``qbique_strategy.MarketData``.
+        """
+        if not universe and not tickers:
+            raise ValueError("Either universe or tickers is required.")
+        if start_date is None:
+            raise ValueError("start_date is required for the local price store.")
+        start = _to_date(start_date)
+        end = _to_date(end_date) if end_date is not None else date.today()
+        if end < start:
+            raise ValueError(f"end_date {end} is before start_date {start}")
+
+        dataset = universe or _TICKERS_DATASET
+        prices, spans = self._load(dataset)
+        settled = min(end, date.today() - timedelta(days=1))
+
+        if universe:
+            gaps = missing_spans(spans.get(_UNIVERSE_KEY, []), start, end)
+            for gap in gaps:
+                prices = _combine(prices, self._fetch_span(gap, universe=universe))
+            if gaps:
+                _mark(spans, [_UNIVERSE_KEY], start, _last_held(prices, None, settled))
+        else:
+            by_gaps: dict[tuple[Span, ...], list[str]] = {}
+            for ticker in dict.fromkeys(tickers):
+                gaps = tuple(missing_spans(spans.get(ticker, []), start, end))
+                if gaps:
+                    by_gaps.setdefault(gaps, []).append(ticker)
+            for gaps, group in by_gaps.items():
+                for gap in gaps:
+                    prices = _combine(prices, self._fetch_span(gap, tickers=group))
+                _mark(spans, group, start, _last_held(prices, group, settled))
+
+        if prices is not None:
+            self._save(dataset, prices, spans)
+        return self._select(prices, tickers, start, end)
+
+    def spans(self, *, universe: str | None = None, ticker: str | None = None) -> list[tuple[str, str]]:
+        """Date spans held locally for a universe, or for one explicitly fetched ticker."""
+        _, spans = self._load(universe or _TICKERS_DATASET, prices=False)
+        held = spans.get(_UNIVERSE_KEY if universe else ticker, [])
+        return [(s.isoformat(), e.isoformat()) for s, e in held]
+
+    def clear(self, universe: str | None = None) -> None:
+        """Delete one dataset (``universe``) or, with no argument, every dataset."""
+        names = [_safe_name(universe)] if universe else os.listdir(self.directory)
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                for f in os.listdir(path):
+                    os.remove(os.path.join(path, f))
+                os.rmdir(path)
+
+    # ── internals ──
+
+    def _fetch_span(self, span: Span, **selection) -> pd.DataFrame:
+        response = self._client.data.fetch(
+            **selection,
+            start_date=span[0].isoformat(),
+            end_date=span[1].isoformat(),
+            cache=False,
+        )
+        return self._parser(response)
+
+    def _path(self, dataset: str, name: str) -> str:
+        return os.path.join(self.directory, _safe_name(dataset), name)
+
+    def _load(self, dataset: str, prices: bool = True) -> tuple[pd.DataFrame | None, dict[str, list[Span]]]:
+        spans: dict[str, list[Span]] = {}
+        if os.path.exists(self._path(dataset, "spans.json")):
+            with open(self._path(dataset, "spans.json"), encoding="utf-8") as f:
+                raw = json.load(f)
+            spans = {k: [(_to_date(s), _to_date(e)) for s, e in v] for k, v in raw.items()}
+        if not prices or not os.path.exists(self._path(dataset, "prices.npy")):
+            return None, spans
+        values = np.load(self._path(dataset, "prices.npy"))
+        dates = np.load(self._path(dataset, "dates.npy"))
+        with open(self._path(dataset, "tickers.json"), encoding="utf-8") as f:
+            tickers = json.load(f)
+        frame = pd.DataFrame(values, index=pd.DatetimeIndex(dates), columns=tickers)
+        return frame, spans
+
+    def _save(self, dataset: str, prices: pd.DataFrame, spans: dict[str, list[Span]]) -> None:
+        os.makedirs(os.path.dirname(self._path(dataset, "x")), exist_ok=True)
+        _atomic(self._path(dataset, "prices.npy"), lambda f: np.save(f, prices.to_numpy(dtype="float64")))
+        _atomic(self._path(dataset, "dates.npy"), lambda f: np.save(f, prices.index.values.astype("datetime64[ns]")))
+        _atomic(self._path(dataset, "tickers.json"), lambda f: f.write(json.dumps(list(prices.columns)).encode()))
+        raw = {k: [(s.isoformat(), e.isoformat()) for s, e in v] for k, v in spans.items()}
+        _atomic(self._path(dataset, "spans.json"), lambda f: f.write(json.dumps(raw).encode()))
+
+    @staticmethod
+    def _select(prices: pd.DataFrame | None, tickers: list[str] | None, start: date, end: date) -> pd.DataFrame:
+        if prices is None:
+            return pd.DataFrame(dtype="float64")
+        window = prices.loc[pd.Timestamp(start):pd.Timestamp(end)]
+        if tickers:
+            window = window.reindex(columns=list(dict.fromkeys(tickers)))
+        return window.dropna(how="all")
+
+
+def _combine(prices: pd.DataFrame | None, new: pd.DataFrame) -> pd.DataFrame:
+    if prices is None:
+        return new.sort_index()
+    if new.empty:
+        return prices
+    return new.combine_first(prices).sort_index()
+
+
+def _last_held(prices: pd.DataFrame | None, columns: list[str] | None, settled: date) -> date | None:
+    """Last date up to ``settled`` with a price in ``columns`` (any column when None).
+
+    Spans are marked only this far, so a tail the server had no rows for yet
+    is fetched again next time instead of being treated as held.
+    """
+    if prices is None:
+        return None
+    window = prices.loc[:pd.Timestamp(settled)]
+    if columns is not None:
+        window = window.reindex(columns=columns)
+    held = window.dropna(how="all").index
+    return held[-1].date() if len(held) else None
+
+
+def _mark(spans: dict[str, list[Span]], keys: Iterable[str], start: date, settled: date | None) -> None:
+    if settled is None or settled < start:
+        return
+    for key in keys:
+        spans[key] = merge_spans([*spans.get(key, []), (start, settled)])
+
+
+def _atomic(path: str, write: Callable) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _to_date(value: str | date) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _safe_name(dataset: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", dataset)
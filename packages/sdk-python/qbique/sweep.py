@@ -0,0 +1,135 @@
+"""Parameter sweeps over strategy (greedy) backtests.
+
+Used by :meth:`BacktestResource.sweep`::
+
+    grid = {
+        "portfolio_strategy": ["max_sharpe", "risk_parity", "hrp"],
+        "rebalance_freq": ["monthly", "quarterly"],
+        "lookback_days": [126, 252],
+    }
+    rows = list(client.backtest.sweep(
+        grid, start="2015-01-01", end="2024-12-31", universe="US",
+        concurrency=8, checkpoint="sweep.jsonl",
+    ))
+    df = to_dataframe(rows)
+
+Every submitted job id and every finished row is appended to the checkpoint
+file, so re-running the same sweep after an interruption re-emits the finished
+rows, resumes polling jobs that were already submitted, and only submits the
+combinations that never reached the server. A request that fails while
+submitting or polling one combination yields a ``status="failed"`` row with
+the error and is checkpointed like a failed job. With a per-job ``timeout``,
+jobs still running at their deadline yield a ``status="timeout"`` row; those
+rows are not checkpointed, so a re-run resumes polling the same jobs.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+from typing import Any, Iterable, Mapping, Sequence
+
+DEFAULT_METRICS = (
+    "total_return",
+    "annualized_return",
+    "annual_volatility",
+    "sharpe_ratio",
+    "max_drawdown",
+    "total_turnover",
+    "final_value",
+)
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> list[dict]:
+    """Cartesian product of a parameter grid, in grid key order."""
+    keys = list(grid)
+    for key in keys:
+        if isinstance(grid[key], (str, bytes)) or not isinstance(grid[key], Iterable):
+            raise TypeError(f"grid values must be sequences, got {type(grid[key]).__name__} for {key!r}")
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def combo_key(request: Mapping[str, Any]) -> str:
+    """Canonical key for a full backtest request (order-independent)."""
+    return json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def sweep_row(
+    params: Mapping[str, Any],
+    job_id: str | None,
+    status: str,
+    payload: Mapping[str, Any],
+    metrics: Sequence[str] = DEFAULT_METRICS,
+) -> dict:
+    """Build one tidy result row: swept params, job id, status and key metrics."""
+    row: dict = dict(params)
+    row["job_id"] = job_id
+    row["status"] = status
+    for name in metrics:
+        row[name] = payload.get(name) if status == "completed" else None
+    if status != "completed":
+        row["error"] = payload.get("message") or payload.get("error") or status
+    return row
+
+
+def sweep_error_row(
+    params: Mapping[str, Any], job_id: str | None, error: Exception, metrics: Sequence[str]
+) -> dict:
+    """Failed row for a combination whose submit or poll request raised ``error``."""
+    return sweep_row(params, job_id, "failed", {"message": f"{type(error).__name__}: {error}"}, metrics)
+
+
+def sweep_timeout_row(params: Mapping[str, Any], job_id: str, timeout: float, metrics: Sequence[str]) -> dict:
+    """Row for a job that was still running when its per-job ``timeout`` expired."""
+    return sweep_row(params, job_id, "timeout", {"message": f"Job still running after {timeout:g}s"}, metrics)
+
+
+class SweepCheckpoint:
+    """Append-only JSON-lines log of submitted jobs and finished rows.
+
+    Each line is either ``{"key", "job_id"}`` (submitted) or
+    ``{"key", "row"}`` (finished). A truncated trailing line from a crash is
+    ignored on load.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = os.fspath(path)
+        self.submitted: dict[str, str] = {}
+        self.rows: dict[str, dict] = {}
+        if os.path.exists(self.path):
+            self._load()
+
+    def record_submit(self, key: str, job_id: str) -> None:
+        self.submitted[key] = job_id
+        self._append({"key": key, "job_id": job_id})
+
+    def record_row(self, key: str, row: dict) -> None:
+        self.rows[key] = row
+        self._append({"key": key, "row": row})
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if "row" in entry:
+                    self.rows[entry["key"]] = entry["row"]
+                elif "job_id" in entry:
+                    self.submitted[entry["key"]] = entry["job_id"]
+
+    def _append(self, entry: dict) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+
+
+def to_dataframe(rows: Iterable[Mapping[str, Any]]):
+    """Collect sweep rows into a ``pandas.DataFrame`` (requires pandas)."""
+    try:
+        import pandas as pd
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise ImportError("to_dataframe requires pandas: pip install qbique[jupyter]") from e
+    return pd.DataFrame(list(rows))
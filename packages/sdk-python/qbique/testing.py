@@ -0,0 +1,528 @@
+"""In-process stand-in for the Qbique API, for offline load and failure testing.
+
+:class:`FakeServer` implements every route used by the resource namespaces
+with realistic payload sizes, and plugs into a client through ``transport=``
+or as a real HTTP server on localhost::
+
+    from qbique import QbiqueClient
+    from qbique.testing import FakeServer, lognormal
+
+    server = FakeServer(
+        latency=lognormal(0.02, 0.6),        # median 20ms, long tail
+        error_rate=0.01,                     # 1% of requests answer 500/502/503
+        job_duration=lognormal(3.0, 0.5),    # greedy backtests take ~3s
+    )
+    client = QbiqueClient(api_key="qbi_test", transport=server.transport())
+    job = client.backtest.strategy(start="2015-01-01", end="2024-12-31")
+    client.backtest.wait(job["job_id"])
+
+    with server.serve() as endpoint:         # real sockets, keep-alive
+        client = QbiqueClient(api_key="qbi_test", endpoint=endpoint)
+
+Latencies are callables ``(rng) -> seconds``; use :func:`fixed`,
+:func:`uniform` or :func:`lognormal`, or any function of a
+:class:`random.Random`. ``server.requests`` counts requests per route
+(``"GET /api/portfolio/{id}/summary"``). Successful GETs carry an ``ETag``
+and honour ``If-None-Match``. ``benchmarks/load.py`` drives the server at
+several concurrency levels and reports throughput and tail latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import gzip
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Union
+
+import httpx
+
+Latency = Callable[[random.Random], float]
+
+ERROR_STATUSES = (500, 502, 503)
+
+
+def fixed(seconds: float) -> Latency:
+    """Always ``seconds``."""
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> Latency:
+    """Uniform between ``low`` and ``high`` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float) -> Latency:
+    """Log-normal with the given median (seconds) and log-space ``sigma``.
+
+    ``sigma`` around 0.5-1.0 gives the long right tail typical of API latency
+    (p99 is ``median * exp(2.33 * sigma)``).
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def _as_latency(value: Union[float, Latency, None]) -> Latency:
+    if value is None:
+        return fixed(0.0)
+    if callable(value):
+        return value
+    return fixed(float(value))
+
+
+# ── payloads ──
+
+
+def backtest_result_payload(days: int = 2520, assets: int = 300, seed: int = 0) -> dict:
+    """Strategy backtest result: ``days`` of portfolio/benchmark values and
+    monthly weights over ``assets`` tickers (~1.3MB of JSON at the defaults)."""
+    rng = random.Random(seed)
+    start = date(2015, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    value, bench = 1e8, 1e8
+    values, bench_values = [], []
+    for d in dates:
+        value *= 1 + rng.gauss(0.0004, 0.01)
+        bench *= 1 + rng.gauss(0.0003, 0.011)
+        values.append({"date": d, "value": value})
+        bench_values.append({"date": d, "value": bench})
+    rebalances = [
+        {"date": dates[i], "weights": {f"T{a:04d}": rng.random() / assets for a in range(assets)}}
+        for i in range(0, days, 21)
+    ]
+    return {
+        "job_id": "bench",
+        "total_return": value / 1e8 - 1,
+        "sharpe_ratio": 1.1,
+        "portfolio_values": values,
+        "benchmark_values": bench_values,
+        "rebalances": rebalances,
+    }
+
+
+def data_fetch_payload(tickers: int | list[str] = 500, days: int = 250, seed: int = 1) -> dict:
+    """``data.fetch`` records: one daily close per ticker and day."""
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    names = [f"{t:06d}" for t in range(tickers)] if isinstance(tickers, int) else tickers
+    return {
+        "data": [
+            {"ticker": ticker, "trade_date": (start + timedelta(days=d)).isoformat(),
+             "close": round(rng.uniform(1e3, 1e5), 2)}
+            for ticker in names
+            for d in range(days)
+        ]
+    }
+
+
+def _holdings(portfolio_id: str, positions: int = 30) -> list[dict]:
+    rng = random.Random(portfolio_id)
+    weights = [rng.random() for _ in range(positions)]
+    total = sum(weights)
+    return [
+        {"ticker": f"{rng.randrange(1_000_000):06d}", "weight": w / total,
+         "shares": rng.randrange(10, 5000), "price": round(rng.uniform(1e3, 1e5), 2)}
+        for w in weights
+    ]
+
+
+# ── server ──
+
+
+class _Route:
+    __slots__ = ("method", "template", "regex", "handler")
+
+    def __init__(self, method: str, template: str, handler: str):
+        self.method = method
+        self.template = template
+        self.regex = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template) + "$")
+        self.handler = handler
+
+
+_ROUTES = [
+    _Route(method, template, handler)
+    for method, template, handler in [
+        ("GET", "/health", "_health"),
+        ("GET", "/api/version/current", "_version"),
+        ("GET", "/api/optimization/methods", "_methods"),
+        ("GET", "/api/onboarding/problem/{id}", "_problem"),
+        ("POST", "/api/cli/strategy/create", "_strategy_create"),
+        ("POST", "/api/cli/strategy/validate", "_strategy_validate"),
+        ("POST", "/api/cli/strategy/push", "_strategy_push"),
+        ("GET", "/api/cli/strategy/{id}/versions", "_strategy_versions"),
+        ("POST", "/api/optimization/execute", "_optimize"),
+        ("POST", "/api/optimization/greedy-cluster", "_optimize"),
+        ("GET", "/api/optimization/result/{id}", "_optimize"),
+        ("POST", "/api/optimization/efficient-frontier", "_frontier"),
+        ("POST", "/api/backtest/run", "_simple_backtest"),
+        ("GET", "/api/backtest/status/{id}", "_simple_status"),
+        ("GET", "/api/backtest/results/{id}", "_simple_results"),
+        ("GET", "/api/backtest/strategy/available-range", "_available_range"),
+        ("POST", "/api/backtest/strategy/greedy", "_job_submit"),
+        ("GET", "/api/backtest/strategy/greedy/{id}", "_job_status"),
+        ("GET", "/api/backtest/strategy/greedy/{id}/result", "_job_result"),
+        ("POST", "/api/optimization/search-tickers", "_search"),
+        ("POST", "/api/optimization/validate-tickers", "_validate_tickers"),
+        ("POST", "/api/cli/data/fetch", "_data_fetch"),
+        ("POST", "/api/cli/data/export", "_data_export"),
+        ("POST", "/api/cli/data/import", "_data_import"),
+        ("GET", "/api/portfolio/{id}/summary", "_portfolio_summary"),
+        ("GET", "/api/portfolio/{id}/drift", "_portfolio_drift"),
+        ("GET", "/api/portfolio/{id}/pnl", "_portfolio_pnl"),
+        ("GET", "/api/contracts/list", "_contracts"),
+        ("GET", "/api/contracts/{id}/status", "_contract_status"),
+    ]
+]
+
+
+class _Reply:
+    """Status, body, extra headers and simulated server time for one request."""
+
+    __slots__ = ("status", "body", "content_type", "headers", "delay")
+
+    def __init__(self, status: int, body: Any, delay: float = 0.0, content_type: str = "application/json"):
+        self.status = status
+        self.content_type = content_type
+        self.body = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.headers: dict[str, str] = {}
+        self.delay = delay
+
+
+class FakeServer:
+    """Stand-in for the Qbique API gateway with latency, error and slow-job injection.
+
+    Args:
+        latency: Per-request server time, seconds or a latency callable
+            (default: none).
+        route_latency: Overrides keyed by ``"METHOD /route/{id}"``, e.g.
+            ``{"POST /api/cli/data/fetch": lognormal(0.3, 0.4)}``.
+        error_rate: Fraction of requests answered with a random status from
+            ``error_statuses`` instead of the route's response.
+        error_statuses: Statuses used for injected errors.
+        job_duration: Time from submitting a greedy backtest until its status
+            reports ``completed`` (default: completes immediately). Status
+            polls report a linear ``progress`` in between.
+        job_failure_rate: Fraction of greedy backtest jobs that end ``failed``.
+        assets: Assets in each greedy backtest result's monthly weights.
+        result_days: Daily values in each greedy backtest result.
+        universe_size: Tickers returned by ``data.fetch`` without ``tickers``.
+        fetch_days: Trading days per ticker returned by ``data.fetch``.
+        etags: Send an ``ETag`` with successful GETs and answer a matching
+            ``If-None-Match`` with ``304 Not Modified``.
+        cache_control: ``Cache-Control`` value sent with successful GETs.
+        seed: Seed for latency, error and job sampling.
+        clock: Monotonic clock used for job progress (tests can pass a fake).
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Union[float, Latency, None] = None,
+        route_latency: dict[str, Union[float, Latency]] | None = None,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = ERROR_STATUSES,
+        job_duration: Union[float, Latency, None] = None,
+        job_failure_rate: float = 0.0,
+        assets: int = 300,
+        result_days: int = 2520,
+        universe_size: int = 500,
+        fetch_days: int = 250,
+        etags: bool = True,
+        cache_control: str | None = None,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0.0 <= error_rate <= 1.0 or not 0.0 <= job_failure_rate <= 1.0:
+            raise ValueError("error_rate and job_failure_rate must be between 0 and 1")
+        self.latency = _as_latency(latency)
+        self.route_latency = {k: _as_latency(v) for k, v in (route_latency or {}).items()}
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.job_duration = _as_latency(job_duration)
+        self.job_failure_rate = job_failure_rate
+        self.assets = assets
+        self.result_days = result_days
+        self.universe_size = universe_size
+        self.fetch_days = fetch_days
+        self.etags = etags
+        self.cache_control = cache_control
+        self.clock = clock
+        self.requests: collections.Counter[str] = collections.Counter()
+        self.injected_errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs: dict[str, tuple[float, float, bool]] = {}  # id -> (submitted, duration, fails)
+        self._bodies: dict[tuple, bytes] = {}  # large payloads, encoded once
+
+    # ── transports ──
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Synchronous ``httpx.MockTransport`` handler (sleeps in the calling thread)."""
+        reply = self._respond(request.method, request.url.path, request.headers, request.read())
+        if reply.delay > 0:
+            time.sleep(reply.delay)
+        return self._httpx_response(reply)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Asynchronous ``httpx.MockTransport`` handler (``asyncio.sleep`` for latency)."""
+        reply = self._respond(request.method, request.url.path, request.headers, await request.aread())
+        if reply.delay > 0:
+            await asyncio.sleep(reply.delay)
+        return self._httpx_response(reply)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for ``QbiqueClient(transport=...)``."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for ``AsyncQbiqueClient(transport=...)``."""
+        return httpx.MockTransport(self.handle_async)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """Serve over HTTP/1.1 (keep-alive) on a background thread; yields the endpoint URL."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                reply = fake._respond(self.command, self.path.split("?", 1)[0], self.headers, body)
+                if reply.delay > 0:
+                    time.sleep(reply.delay)
+                self.send_response(reply.status)
+                self.send_header("Content-Type", reply.content_type)
+                self.send_header("Content-Length", str(len(reply.body)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(reply.body)
+
+            do_GET = do_POST = do_DELETE = _serve
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="qbique-fake-server", daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    # ── dispatch ──
+
+    def _respond(self, method: str, path: str, headers: Any, body: bytes) -> _Reply:
+        """Route one request and sample its latency and injected failure."""
+        for route in _ROUTES:
+            if route.method != method:
+                continue
+            match = route.regex.match(path)
+            if match is not None:
+                key = f"{method} {route.template}"
+                break
+        else:
+            route, match, key = None, None, f"{method} {path}"
+
+        with self._lock:
+            self.requests[key] += 1
+            latency = self.route_latency.get(key, self.latency)
+            delay = max(latency(self._rng), 0.0)
+            inject = self.error_rate > 0 and self._rng.random() < self.error_rate
+            status = self._rng.choice(self.error_statuses) if inject else None
+            if inject:
+                self.injected_errors += 1
+
+        if not headers.get("X-API-Key"):
+            return _Reply(401, {"detail": "Missing API key"}, delay)
+        if route is None:
+            return _Reply(404, {"detail": "Not Found"}, delay)
+        if status is not None:
+            return _Reply(status, {"detail": "Injected failure"}, delay)
+
+        if headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body) if body else {}
+        reply = getattr(self, route.handler)(payload, **match.groupdict())
+        if not isinstance(reply, _Reply):
+            reply = _Reply(200, reply)
+        reply.delay = delay
+        if method == "GET" and reply.status == 200:
+            self._add_cache_headers(reply, headers.get("If-None-Match"))
+        return reply
+
+    def _add_cache_headers(self, reply: _Reply, if_none_match: str | None) -> None:
+        if self.cache_control is not None:
+            reply.headers["Cache-Control"] = self.cache_control
+        if not self.etags:
+            return
+        etag = f'"{hashlib.blake2b(reply.body, digest_size=8).hexdigest()}"'
+        reply.headers["ETag"] = etag
+        if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            reply.status, reply.body = 304, b""
+
+    @staticmethod
+    def _httpx_response(reply: _Reply) -> httpx.Response:
+        headers = {"Content-Type": reply.content_type, **reply.headers}
+        return httpx.Response(reply.status, content=reply.body, headers=headers)
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids):06d}"
+
+    def _cached(self, key: tuple, build: Callable[[], Any]) -> bytes:
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = json.dumps(build()).encode()
+        return body
+
+    # ── routes ──
+
+    def _health(self, payload: dict) -> dict:
+        return {"status": "ok"}
+
+    def _version(self, payload: dict) -> dict:
+        return {"version": "1.0.0", "api": "v1", "build": "fake"}
+
+    def _methods(self, payload: dict) -> dict:
+        names = ["max_sharpe", "risk_parity", "hrp", "min_variance", "equal_weight"]
+        return {"methods": [{"name": n, "description": n.replace("_", " ").title()} for n in names]}
+
+    def _problem(self, payload: dict, id: str) -> dict:
+        return {"problem_id": id, "objective": "max_sharpe", "constraints": {"max_weight": 0.1}}
+
+    def _strategy_create(self, payload: dict) -> dict:
+        return {"problem_id": next(self._ids), "spec": payload}
+
+    def _strategy_validate(self, payload: dict) -> dict:
+        return {"valid": True, "errors": []}
+
+    def _strategy_push(self, payload: dict) -> dict:
+        return {"strategy_id": next(self._ids), "name": payload.get("name"), "version": 1}
+
+    def _strategy_versions(self, payload: dict, id: str) -> dict:
+        return {"strategy_id": id, "versions": [{"version": v, "tag": f"v{v}"} for v in range(1, 4)]}
+
+    def _optimize(self, payload: dict, id: str | None = None) -> _Reply:
+        body = self._cached(("optimize", self.assets), lambda: {
+            "status": "completed",
+            "weights": {f"T{a:04d}": 1.0 / self.assets for a in range(self.assets)},
+            "expected_return": 0.08,
+            "volatility": 0.15,
+        })
+        return _Reply(200, body)
+
+    def _frontier(self, payload: dict) -> dict:
+        n = int(payload.get("n_points", 50))
+        return {"points": [{"volatility": 0.1 + 0.2 * i / n, "return": 0.03 + 0.1 * i / n} for i in range(n)]}
+
+    def _simple_backtest(self, payload: dict) -> dict:
+        return {"job_id": self._next_id("bt"), "status": "completed"}
+
+    def _simple_status(self, payload: dict, id: str) -> dict:
+        return {"job_id": id, "status": "completed"}
+
+    def _simple_results(self, payload: dict, id: str) -> _Reply:
+        return self._result_reply()
+
+    def _available_range(self, payload: dict) -> dict:
+        return {"start_date": "2000-01-03", "end_date": date.today().isoformat()}
+
+    def _job_submit(self, payload: dict) -> dict:
+        job_id = self._next_id("job")
+        with self._lock:
+            duration = max(self.job_duration(self._rng), 0.0)
+            fails = self.job_failure_rate > 0 and self._rng.random() < self.job_failure_rate
+            self._jobs[job_id] = (self.clock(), duration, fails)
+        return {"job_id": job_id, "status": "queued"}
+
+    def _job_status(self, payload: dict, id: str) -> Any:
+        job = self._jobs.get(id)
+        if job is None:
+            return _Reply(404, {"detail": f"Job {id} not found"})
+        submitted, duration, fails = job
+        elapsed = self.clock() - submitted
+        if elapsed >= duration:
+            if fails:
+                return {"job_id": id, "status": "failed", "progress": 1.0, "message": "Optimization did not converge"}
+            return {"job_id": id, "status": "completed", "progress": 1.0}
+        return {"job_id": id, "status": "running", "progress": round(elapsed / duration, 4)}
+
+    def _job_result(self, payload: dict, id: str) -> _Reply:
+        if id not in self._jobs:
+            return _Reply(404, {"detail": f"Job {id} not found"})
+        return self._result_reply()
+
+    def _result_reply(self) -> _Reply:
+        key = ("result", self.result_days, self.assets)
+        return _Reply(200, self._cached(key, lambda: backtest_result_payload(self.result_days, self.assets)))
+
+    def _search(self, payload: dict) -> dict:
+        limit = int(payload.get("limit", 10))
+        return {"results": [{"ticker": f"{i:06d}", "name": f"{payload.get('query', '')} {i}"} for i in range(limit)]}
+
+    def _validate_tickers(self, payload: dict) -> dict:
+        return {"valid": list(payload.get("tickers", [])), "invalid": []}
+
+    def _data_fetch(self, payload: dict) -> _Reply:
+        tickers = payload.get("tickers") or self.universe_size
+        key = ("fetch", tuple(tickers) if isinstance(tickers, list) else tickers, self.fetch_days)
+        return _Reply(200, self._cached(key, lambda: data_fetch_payload(tickers, self.fetch_days)))
+
+    def _data_export(self, payload: dict) -> _Reply:
+        records = json.loads(self._data_fetch(payload).body)["data"]
+        fmt = payload.get("format", "json")
+        if fmt == "csv":
+            lines = ["ticker,trade_date,close"] + [f"{r['ticker']},{r['trade_date']},{r['close']}" for r in records]
+            return _Reply(200, ("\n".join(lines) + "\n").encode(), content_type="text/csv")
+        if fmt == "jsonl":
+            text = "".join(json.dumps(r) + "\n" for r in records)
+            return _Reply(200, text.encode(), content_type="application/x-ndjson")
+        return {"dataset": payload.get("dataset"), "data": records}
+
+    def _data_import(self, payload: dict) -> dict:
+        return {"dataset": payload.get("dataset"), "imported": len(payload.get("data") or [])}
+
+    def _portfolio_summary(self, payload: dict, id: str) -> dict:
+        holdings = _holdings(id)
+        value = sum(h["shares"] * h["price"] for h in holdings)
+        return {"portfolio_id": id, "total_value": value, "holdings": holdings}
+
+    def _portfolio_drift(self, payload: dict, id: str) -> dict:
+        rng = random.Random(id + "drift")
+        holdings = _holdings(id)
+        return {
+            "portfolio_id": id,
+            "drift": [{"ticker": h["ticker"], "target": h["weight"],
+                       "actual": h["weight"] * rng.uniform(0.9, 1.1)} for h in holdings],
+        }
+
+    def _portfolio_pnl(self, payload: dict, id: str) -> dict:
+        rng = random.Random(id + "pnl")
+        start = date(2024, 1, 1)
+        return {
+            "portfolio_id": id,
+            "daily": [{"date": (start + timedelta(days=d)).isoformat(), "pnl": rng.gauss(0, 1e6)}
+                      for d in range(250)],
+        }
+
+    def _contracts(self, payload: dict) -> list:
+        return [{"contract_id": f"c{i}", "status": "active"} for i in range(20)]
+
+    def _contract_status(self, payload: dict, id: str) -> dict:
+        return {"contract_id": id, "status": "active"}
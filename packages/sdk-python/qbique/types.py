@@ -55,3 +55,35 @@ class OptimizationResult:
             weights=d.get("weights", {}),
             data=d,
         )
+
+
+@dataclass
+class ChunkResult:
+    """Outcome of one bulk-import chunk upload."""
+    index: int
+    offset: int
+    records: int
+    bytes: int
+    ok: bool
+    attempts: int = 0
+    error: str | None = None
+    skipped: bool = False
+
+
+@dataclass
+class BulkImportResult:
+    """Aggregated outcome of :meth:`DataResource.import_bulk`."""
+    dataset: str
+    chunks: list[ChunkResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(c.ok for c in self.chunks)
+
+    @property
+    def records_imported(self) -> int:
+        return sum(c.records for c in self.chunks if c.ok)
+
+    @property
+    def failed_chunks(self) -> list[ChunkResult]:
+        return [c for c in self.chunks if not c.ok]
@@ -0,0 +1,78 @@
+"""Tests for AsyncQbiqueClient (mocked transport via respx)."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, AuthenticationError, ConnectionError, NotFoundError, ServerError
+
+BASE = "http://test.local"
+
+
+@pytest.fixture
+def client():
+    return AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE)
+
+
+@pytest.mark.asyncio
+async def test_namespaces(client):
+    for name in ("strategy", "optimize", "backtest", "data", "portfolio", "contract", "health"):
+        assert getattr(client, name) is not None
+    assert repr(client).startswith("AsyncQbiqueClient(")
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_and_post(client):
+    respx.get(f"{BASE}/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    route = respx.post(f"{BASE}/api/cli/data/fetch").mock(
+        return_value=httpx.Response(200, json={"data": []})
+    )
+    async with client:
+        assert await client.health.check() == {"status": "ok"}
+        assert await client.data.fetch(universe="KOSPI") == {"data": []}
+    assert route.calls.last.request.headers["X-API-Key"] == "qbi_test"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fan_out(client):
+    respx.get(url__regex=rf"{BASE}/api/backtest/strategy/greedy/job-\d+$").mock(
+        side_effect=lambda req: httpx.Response(200, json={"job_id": req.url.path.rsplit("/", 1)[-1]})
+    )
+    async with client:
+        results = await asyncio.gather(
+            *(client.backtest.strategy_status(f"job-{i}") for i in range(20))
+        )
+    assert [r["job_id"] for r in results] == [f"job-{i}" for i in range(20)]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_compare(client):
+    respx.get(f"{BASE}/api/backtest/results/a").mock(return_value=httpx.Response(200, json={"id": "a"}))
+    respx.get(f"{BASE}/api/backtest/results/b").mock(return_value=httpx.Response(200, json={"id": "b"}))
+    async with client:
+        result = await client.backtest.compare("a", "b")
+    assert result == {"backtest_a": {"id": "a"}, "backtest_b": {"id": "b"}}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_error_mapping(client):
+    respx.get(f"{BASE}/api/contracts/list").mock(return_value=httpx.Response(401))
+    respx.get(f"{BASE}/api/portfolio/p1/summary").mock(return_value=httpx.Response(404))
+    respx.get(f"{BASE}/api/version/current").mock(return_value=httpx.Response(503, text="down"))
+    respx.get(f"{BASE}/health").mock(side_effect=httpx.ConnectError("refused"))
+    async with client:
+        with pytest.raises(AuthenticationError):
+            await client.contract.list()
+        with pytest.raises(NotFoundError):
+            await client.portfolio.summary("p1")
+        with pytest.raises(ServerError):
+            await client.health.version()
+        with pytest.raises(ConnectionError):
+            await client.health.check()
@@ -0,0 +1,127 @@
+"""Tests for chunked, compressed bulk import."""
+
+import gzip
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, QbiqueClient
+from qbique._bulk import iter_chunks
+
+BASE = "http://test.local"
+IMPORT = f"{BASE}/api/cli/data/import"
+
+
+def _records(n):
+    for i in range(n):
+        yield {"ticker": "005930", "trade_date": f"2024-01-{i % 28 + 1:02d}", "close": 78000 + i}
+
+
+class FakeImportServer:
+    def __init__(self, fail_first: set[int] = frozenset(), reject: set[int] = frozenset()):
+        self.received: dict[int, list[dict]] = {}
+        self.attempts: dict[int, int] = {}
+        self.fail_first = set(fail_first)
+        self.reject = reject
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        assert request.headers["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(request.content))
+        index = body["chunk"]
+        with self.lock:
+            self.attempts[index] = self.attempts.get(index, 0) + 1
+            if index in self.reject:
+                return httpx.Response(400, json={"detail": "bad chunk"})
+            if index in self.fail_first and self.attempts[index] == 1:
+                return httpx.Response(503, text="busy")
+            self.received[index] = body["data"]
+        return httpx.Response(200, json={"imported": len(body["data"])})
+
+
+def test_iter_chunks_bounds():
+    chunks = list(iter_chunks("prices", _records(25), metadata={"src": "x"}, max_records=10, max_bytes=10**6))
+    assert [c.records for c in chunks] == [10, 10, 5]
+    assert [c.offset for c in chunks] == [0, 10, 20]
+    body = json.loads(gzip.decompress(chunks[1].body))
+    assert body["dataset"] == "prices" and body["metadata"] == {"src": "x"} and body["chunk"] == 1
+    assert body["data"][0]["close"] == 78010
+
+    by_size = list(iter_chunks("prices", _records(25), metadata=None, max_records=100, max_bytes=300))
+    assert all(c.raw_bytes < 400 for c in by_size) and sum(c.records for c in by_size) == 25
+
+
+@respx.mock
+def test_import_bulk_with_retry():
+    server = FakeImportServer(fail_first={1})
+    respx.post(IMPORT).mock(side_effect=server)
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        result = client.data.import_bulk("prices", _records(95), chunk_records=10, parallelism=3,
+                                         retry_backoff=0.001)
+    assert result.ok and result.records_imported == 95
+    assert len(result.chunks) == 10
+    assert result.chunks[1].attempts == 2
+    assert sum(len(v) for v in server.received.values()) == 95
+
+
+@respx.mock
+def test_import_bulk_resume(tmp_path):
+    ckpt = tmp_path / "import.jsonl"
+    server = FakeImportServer(reject={2})
+    respx.post(IMPORT).mock(side_effect=server)
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        first = client.data.import_bulk("prices", _records(50), chunk_records=10, checkpoint=ckpt)
+        assert not first.ok
+        assert [c.index for c in first.failed_chunks] == [2]
+        assert first.failed_chunks[0].attempts == 1  # 4xx is not retried
+
+        server.reject = set()
+        server.attempts.clear()
+        second = client.data.import_bulk("prices", _records(50), chunk_records=10, checkpoint=ckpt)
+    assert second.ok
+    assert list(server.attempts) == [2]
+    assert [c.skipped for c in second.chunks] == [True, True, False, True, True]
+    header = json.loads(ckpt.read_text().splitlines()[0])
+    assert header == {"header": {"dataset": "prices", "chunk_records": 10, "max_chunk_bytes": 8 * 1024 * 1024}}
+
+
+@respx.mock
+def test_import_bulk_checkpoint_must_match(tmp_path):
+    ckpt = tmp_path / "import.jsonl"
+    limits = dict(chunk_records=100, max_chunk_bytes=300)
+    server = FakeImportServer(reject={3})
+    respx.post(IMPORT).mock(side_effect=server)
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        client.data.import_bulk("prices", _records(50), checkpoint=ckpt, **limits)
+        with pytest.raises(ValueError, match="was written for"):
+            client.data.import_bulk("prices", _records(50), chunk_records=20, checkpoint=ckpt)
+        with pytest.raises(ValueError, match="was written for"):
+            client.data.import_bulk("fundamentals", _records(50), checkpoint=ckpt, **limits)
+
+        # Longer records move the size-bounded chunk boundaries
+        changed = [dict(r, source="vendor-feed") for r in _records(50)]
+        server.reject = set()
+        with pytest.raises(ValueError, match="records changed"):
+            client.data.import_bulk("prices", changed, checkpoint=ckpt, **limits)
+
+
+def test_checkpoint_without_header_is_rejected(tmp_path):
+    ckpt = tmp_path / "old.jsonl"
+    ckpt.write_text('{"index": 0, "offset": 0, "records": 10}\n')
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        with pytest.raises(ValueError, match="no header"):
+            client.data.import_bulk("prices", _records(5), checkpoint=ckpt)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_import_bulk():
+    server = FakeImportServer(fail_first={0})
+    respx.post(IMPORT).mock(side_effect=server)
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        result = await client.data.import_bulk("prices", _records(42), chunk_records=10, retry_backoff=0.001)
+    assert result.ok and result.records_imported == 42
+    assert sorted(server.received) == [0, 1, 2, 3, 4]
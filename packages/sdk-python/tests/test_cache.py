@@ -0,0 +1,324 @@
+"""Tests for the persistent response cache and the in-memory HTTP cache."""
+
+import time
+from datetime import date, datetime
+from email.utils import formatdate
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, QbiqueClient, ServerError
+from qbique.cache import HttpCache, ResponseCache, freshness_lifetime, make_key, parse_cache_control
+from qbique.testing import FakeServer
+
+BASE = "http://test.local"
+FETCH = f"{BASE}/api/cli/data/fetch"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(tmp_path, ttl=60)
+    yield c
+    c.close()
+
+
+class TestResponseCache:
+    def test_roundtrip_and_stats(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", {"data": [1, 2, 3]})
+        assert cache.get("k") == {"data": [1, 2, 3]}
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1 and cache.size() > 0
+
+    def test_ttl_expiry(self, cache):
+        cache.set("k", {"v": 1}, ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache):
+        cache.set("a", {"n": 1})
+        cache.max_bytes = cache.size() * 2  # room for two entries of this size
+        cache.set("b", {"n": 2})
+        cache.get("a")  # a is now most recently used
+        cache.set("c", {"n": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_invalidate_and_clear(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_persistent(self, tmp_path):
+        ResponseCache(tmp_path).set("k", {"v": 1})
+        assert ResponseCache(tmp_path).get("k") == {"v": 1}
+
+    def test_key_normalization(self):
+        assert make_key(BASE, "post", "/p", {"a": 1, "b": None, "c": 2}) == make_key(
+            BASE + "/", "POST", "/p", {"c": 2, "a": 1}
+        )
+        assert make_key(BASE, "POST", "/p", {"a": 1}) != make_key(BASE, "POST", "/q", {"a": 1})
+        assert make_key(BASE, "POST", "/p", api_key="qbi_a") != make_key(BASE, "POST", "/p", api_key="qbi_b")
+
+
+class TestClientCache:
+    @respx.mock
+    def test_fetch_cached(self, cache):
+        route = respx.post(FETCH).mock(return_value=httpx.Response(200, json={"data": [1]}))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, cache=cache) as client:
+            kw = dict(universe="KOSPI", start_date="2015-01-01", end_date="2020-12-31")
+            assert client.data.fetch(**kw) == {"data": [1]}
+            assert client.data.fetch(**kw) == {"data": [1]}
+            assert route.call_count == 1
+            client.data.fetch(**kw, cache=False)
+            assert route.call_count == 2
+            client.data.fetch(**kw, refresh=True)
+            assert route.call_count == 3
+            client.data.fetch(**kw)
+            assert route.call_count == 3
+
+    @respx.mock
+    def test_keyed_by_api_key(self, cache):
+        route = respx.post(FETCH).mock(side_effect=lambda request: httpx.Response(
+            200, json={"key": request.headers["X-API-Key"]}
+        ))
+        with QbiqueClient(api_key="qbi_a", endpoint=BASE, cache=cache) as a, \
+                QbiqueClient(api_key="qbi_b", endpoint=BASE, cache=cache) as b:
+            assert a.data.fetch(universe="KOSPI", end_date="2020-12-31") == {"key": "qbi_a"}
+            assert b.data.fetch(universe="KOSPI", end_date="2020-12-31") == {"key": "qbi_b"}
+            assert a.data.fetch(universe="KOSPI", end_date="2020-12-31") == {"key": "qbi_a"}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_invalidate_cache(self, cache):
+        route = respx.post(FETCH).mock(return_value=httpx.Response(200, json={"data": [1]}))
+        payload = {"universe": "KOSPI", "end_date": "2020-12-31"}
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, cache=cache) as client:
+            client.data.fetch(**payload)
+            assert client.invalidate_cache("POST", "/api/cli/data/fetch", payload) is True
+            assert client.invalidate_cache("POST", "/api/cli/data/fetch", payload) is False
+            client.data.fetch(**payload)
+        assert route.call_count == 2
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            assert client.invalidate_cache("POST", "/api/cli/data/fetch", payload) is False
+
+    @respx.mock
+    def test_historical_range_never_expires(self, cache):
+        respx.post(FETCH).mock(return_value=httpx.Response(200, json={"data": []}))
+        cache.ttl = 0.01
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, cache=cache) as client:
+            client.data.fetch(tickers=["005930"], end_date="2020-12-31")
+            client.data.fetch(tickers=["005930"])  # open-ended: default TTL
+            time.sleep(0.02)
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize("end_date, historical", [
+        ("2020-12-31", True),
+        (date(2020, 12, 31), True),
+        (datetime(2020, 12, 31, 15, 30), True),
+        ("2020-12-31T00:00:00", True),
+        (date.today(), False),
+        ("2999-01-01", False),
+        ("12/31/2020", False),  # not ISO: treated as mutable
+        ("yesterday", False),
+        (None, False),
+    ])
+    def test_cache_policy_end_date(self, cache, end_date, historical):
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, cache=cache) as client:
+            policy = client.data._cache_policy(True, False, end_date)
+        assert policy.ttl == (None if historical else cache.ttl)
+
+    @respx.mock
+    def test_no_cache_by_default(self):
+        route = respx.post(FETCH).mock(return_value=httpx.Response(200, json={"data": []}))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            assert client.cache is None
+            client.data.fetch(universe="KOSPI")
+            client.data.fetch(universe="KOSPI")
+        assert route.call_count == 2
+
+
+SUMMARY = f"{BASE}/api/portfolio/p1/summary"
+MAX_AGE = {"Cache-Control": "max-age=60"}
+
+
+def _etag_handler(etag: str, body: dict, **headers):
+    """Serve ``body`` with ``etag``; answer a matching If-None-Match with 304."""
+
+    def handler(request):
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag, **headers})
+        return httpx.Response(200, json=body, headers={"ETag": etag, **headers})
+
+    return handler
+
+
+class TestHttpCache:
+    def test_parse_cache_control(self):
+        assert parse_cache_control('max-age=60, no-cache, private="x"') == {
+            "max-age": "60", "no-cache": None, "private": "x"
+        }
+        assert parse_cache_control(None) == {}
+
+    def test_freshness_lifetime(self):
+        now = time.time()
+        assert freshness_lifetime({"Cache-Control": "max-age=60"}, now) == 60
+        assert freshness_lifetime({"Cache-Control": "max-age=60", "Age": "15"}, now) == 45
+        assert freshness_lifetime({"Cache-Control": "max-age=60, no-cache"}, now) == 0
+        expires = {"Expires": formatdate(now + 30, usegmt=True)}
+        assert freshness_lifetime(expires, now) == pytest.approx(30, abs=1)
+        assert freshness_lifetime({"Expires": "0"}, now) == 0
+        assert freshness_lifetime({}, now) == 0
+
+    def test_store_requires_validator_or_lifetime(self):
+        cache = HttpCache()
+        cache.store("a", {}, {"v": 1}, 10)
+        cache.store("b", {"ETag": '"x"', "Cache-Control": "no-store"}, {"v": 1}, 10)
+        cache.store("c", {"ETag": '"x"'}, {"v": 1}, 10)
+        assert len(cache) == 1
+        entry, fresh = cache.lookup("c")
+        assert entry.conditional_headers() == {"If-None-Match": '"x"'}
+        assert not fresh
+
+    def test_lru_and_size_limits(self):
+        cache = HttpCache(max_entries=2, max_entry_bytes=100)
+        for key in ("a", "b", "c"):
+            cache.store(key, {"ETag": '"x"'}, key, 10)
+        cache.store("big", {"ETag": '"x"'}, "big", 101)
+        assert cache.lookup("a")[0] is None
+        assert cache.lookup("big")[0] is None
+        assert cache.stats()["entries"] == 2
+
+    @respx.mock
+    def test_revalidates_with_etag(self):
+        route = respx.get(SUMMARY).mock(side_effect=_etag_handler('"v1"', {"total_value": 1}))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            first = client.portfolio.summary("p1")
+            second = client.portfolio.summary("p1")
+            assert second == first and second is not first
+            stats = client.http_cache.stats()
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert (stats["hits"], stats["revalidated"], stats["misses"]) == (0, 1, 1)
+        assert stats["bytes_saved"] == len(route.calls[0].response.content)
+
+    @respx.mock
+    def test_mutating_results_does_not_corrupt_cache(self):
+        value = {"total_value": 1, "holdings": [{"ticker": "A", "weight": 1.0}]}
+        respx.get(SUMMARY).mock(side_effect=[
+            httpx.Response(200, json=value, headers={"ETag": '"v1"', **MAX_AGE}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            miss = client.portfolio.summary("p1")
+            miss["holdings"][0]["weight"] = 0.0
+            hit = client.portfolio.summary("p1")  # fresh
+            assert hit == value
+            hit["holdings"].clear()
+            key = client._http._http_cache_key("/api/portfolio/p1/summary", None)
+            client.http_cache._entries[key].fresh_until = 0.0
+            revalidated = client.portfolio.summary("p1")  # 304
+            assert revalidated == value
+            revalidated["total_value"] = 2
+            assert client.http_cache._entries[key].value == value
+            assert client.http_cache.stats()["revalidated"] == 1
+
+    @respx.mock
+    def test_changed_resource_replaces_entry(self):
+        route = respx.get(SUMMARY).mock(side_effect=[
+            httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"v": 2}, headers={"ETag": '"v2"'}),
+            httpx.Response(304, headers={"ETag": '"v2"'}),
+        ])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            assert [client.portfolio.summary("p1")["v"] for _ in range(3)] == [1, 2, 2]
+        assert route.calls[2].request.headers["If-None-Match"] == '"v2"'
+
+    @respx.mock
+    def test_last_modified(self):
+        stamp = "Wed, 14 Oct 2026 07:28:00 GMT"
+        route = respx.get(f"{BASE}/api/contracts/list").mock(side_effect=[
+            httpx.Response(200, json=[{"id": 1}], headers={"Last-Modified": stamp}),
+            httpx.Response(304),
+        ])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            assert client.contract.list() == client.contract.list() == [{"id": 1}]
+        assert route.calls[1].request.headers["If-Modified-Since"] == stamp
+
+    @respx.mock
+    def test_max_age_served_without_request(self):
+        route = respx.get(SUMMARY).mock(side_effect=_etag_handler('"v1"', {"v": 1}, **MAX_AGE))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            for _ in range(3):
+                client.portfolio.summary("p1")
+            assert client.http_cache.hits == 2
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_no_cache_always_revalidates(self):
+        no_cache = {"Cache-Control": "max-age=60, no-cache"}
+        route = respx.get(SUMMARY).mock(side_effect=_etag_handler('"v1"', {"v": 1}, **no_cache))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            for _ in range(3):
+                client.portfolio.summary("p1")
+            assert client.http_cache.revalidated == 2
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_keyed_by_params_and_api_key(self):
+        route = respx.get(SUMMARY).mock(side_effect=_etag_handler('"v1"', {"v": 1}, **MAX_AGE))
+        shared = HttpCache()
+        with QbiqueClient(api_key="qbi_a", endpoint=BASE, http_cache=shared) as a, \
+                QbiqueClient(api_key="qbi_b", endpoint=BASE, http_cache=shared) as b:
+            a.portfolio.summary("p1")
+            b.portfolio.summary("p1")
+            a._http.get("/api/portfolio/p1/summary", params={"ccy": "KRW"})
+        assert route.call_count == 3
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @respx.mock
+    def test_errors_not_cached_and_posts_untouched(self):
+        respx.get(SUMMARY).mock(side_effect=[
+            httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(500, text="boom"),
+        ])
+        post = respx.post(FETCH).mock(return_value=httpx.Response(200, json={}, headers={"ETag": '"p"'}))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, http_cache=True) as client:
+            client.portfolio.summary("p1")
+            with pytest.raises(ServerError):
+                client.portfolio.summary("p1")
+            client.data.fetch(universe="KOSPI")
+            client.data.fetch(universe="KOSPI")
+            assert len(client.http_cache) == 1
+        assert "If-None-Match" not in post.calls[1].request.headers
+
+    def test_disabled_by_default(self):
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            assert client.http_cache is None
+
+    def test_fake_server_revalidation(self):
+        server = FakeServer()
+        with QbiqueClient(api_key="qbi_test", transport=server.transport(), http_cache=True) as client:
+            for _ in range(5):
+                client.portfolio.summary("p1")
+                client.strategy.list()
+            snapshot = client.metrics.snapshot()
+            stats = client.http_cache.stats()
+        assert (stats["misses"], stats["revalidated"]) == (2, 8)
+        assert snapshot["GET /api/portfolio/p1/summary"]["status_codes"] == {"200": 1, "304": 4}
+
+    @pytest.mark.asyncio
+    async def test_async_revalidation(self):
+        server = FakeServer(cache_control="max-age=60")
+        transport = server.async_transport()
+        async with AsyncQbiqueClient(api_key="qbi_test", transport=transport, http_cache=True) as client:
+            first = await client.health.version()
+            second = await client.health.version()
+            assert second == first and second is not first
+            assert client.http_cache.hits == 1
+        assert server.requests["GET /api/version/current"] == 1
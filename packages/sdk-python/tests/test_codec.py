@@ -0,0 +1,68 @@
+"""Tests for the pluggable JSON codec and gzip body support."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from qbique import QbiqueClient
+from qbique._codec import JsonCodec, get_codec
+
+BASE = "http://test.local"
+PAYLOAD = {"dates": ["2024-01-02", "2024-01-03"], "values": [1.5, 2.25], "name": "삼성전자", "n": None}
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+def test_roundtrip(name):
+    if name != "stdlib":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    assert codec.name == name
+    assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+def test_non_finite_floats_encode_as_null(name):
+    if name != "stdlib":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    body = codec.dumps({"values": [1.5, float("nan"), float("inf")], "nested": {"x": (float("-inf"),)}})
+    assert json.loads(body) == {"values": [1.5, None, None], "nested": {"x": [None]}}
+
+
+def test_auto_and_errors():
+    assert get_codec("auto").name in ("orjson", "msgspec", "stdlib")
+    custom = JsonCodec("custom", lambda o: json.dumps(o).encode(), json.loads)
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@respx.mock
+def test_client_uses_codec_and_compression():
+    route = respx.post(f"{BASE}/api/cli/strategy/validate").mock(
+        return_value=httpx.Response(
+            200,
+            content=gzip.compress(json.dumps({"valid": True}).encode()),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+    )
+    spec = {"assets": [f"T{i:04d}" for i in range(500)]}
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE, json_codec="stdlib", compress_threshold=1024) as client:
+        assert client.strategy.validate(spec) == {"valid": True}
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert "gzip" in request.headers["Accept-Encoding"]
+    assert json.loads(gzip.decompress(request.content)) == spec
+
+
+@respx.mock
+def test_small_bodies_not_compressed():
+    route = respx.post(f"{BASE}/api/cli/strategy/validate").mock(return_value=httpx.Response(200, json={}))
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE, compress_threshold=1024) as client:
+        client.strategy.validate({"a": 1})
+    request = route.calls.last.request
+    assert "Content-Encoding" not in request.headers
+    assert json.loads(request.content) == {"a": 1}
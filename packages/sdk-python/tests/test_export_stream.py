@@ -0,0 +1,70 @@
+"""Tests for streaming DataResource.export_to."""
+
+import io
+import json
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, QbiqueClient, ServerError
+
+BASE = "http://test.local"
+EXPORT = f"{BASE}/api/cli/data/export"
+
+CSV = b"ticker,trade_date,close\n" + b"".join(
+    f"005930,2024-01-{d:02d},{78000 + d}\n".encode() for d in range(1, 29)
+)
+
+
+@respx.mock
+def test_export_to_path(tmp_path):
+    route = respx.post(EXPORT).mock(return_value=httpx.Response(200, content=CSV))
+    seen = []
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        out = client.data.export_to(
+            "prices", tmp_path / "prices.csv", tickers=["005930"], chunk_size=64,
+            progress=lambda done, total: seen.append((done, total)),
+        )
+    assert (tmp_path / "prices.csv").read_bytes() == CSV
+    assert out["bytes"] == len(CSV) and out["path"].endswith("prices.csv")
+    assert len(seen) > 1 and seen[-1] == (len(CSV), len(CSV))
+    request = route.calls.last.request
+    assert request.headers["Accept"] == "text/csv"
+    assert json.loads(request.content) == {"dataset": "prices", "format": "csv", "tickers": ["005930"]}
+
+
+@respx.mock
+def test_export_to_sink_jsonl():
+    body = b"".join(json.dumps({"n": i}).encode() + b"\n" for i in range(100))
+    respx.post(EXPORT).mock(return_value=httpx.Response(200, content=body))
+    sink = io.BytesIO()
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        out = client.data.export_to("signals", sink, format="jsonl")
+    assert out["path"] is None
+    assert [json.loads(line)["n"] for line in sink.getvalue().splitlines()] == list(range(100))
+
+
+@respx.mock
+def test_export_to_error_leaves_no_file(tmp_path):
+    respx.post(EXPORT).mock(return_value=httpx.Response(500, text="boom"))
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        with pytest.raises(ServerError):
+            client.data.export_to("prices", tmp_path / "out.csv")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_to_rejects_unknown_format():
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        with pytest.raises(ValueError, match="format"):
+            client.data.export_to("prices", io.BytesIO(), format="xlsx")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_export_to(tmp_path):
+    respx.post(EXPORT).mock(return_value=httpx.Response(200, content=CSV))
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        out = await client.data.export_to("prices", tmp_path / "p.csv", chunk_size=100)
+    assert out["bytes"] == len(CSV)
+    assert (tmp_path / "p.csv").read_bytes() == CSV
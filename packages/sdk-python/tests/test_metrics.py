@@ -0,0 +1,118 @@
+"""Tests for per-endpoint request metrics and hooks."""
+
+import gzip
+import io
+import json
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, MetricsCollector, QbiqueClient, ServerError
+from qbique.metrics import endpoint_template
+
+BASE = "http://test.local"
+
+
+def test_endpoint_template():
+    assert endpoint_template("/api/optimization/result/123") == "/api/optimization/result/{id}"
+    job = "3f2c9a1e-58b4-4c1d-9e7a-0b6d2f4e8c11"
+    assert endpoint_template(f"/api/backtest/strategy/greedy/{job}/result?x=1") == (
+        "/api/backtest/strategy/greedy/{id}/result"
+    )
+    assert endpoint_template("/api/jobs/5f1d7c2ab3e4f60718293a4b") == "/api/jobs/{id}"
+    # versions and other names with digits are not ids
+    assert endpoint_template("/api/v2/portfolio/p1/summary") == "/api/v2/portfolio/p1/summary"
+    assert endpoint_template("/api/s3/deadbeef") == "/api/s3/deadbeef"
+    assert endpoint_template("/health") == "/health"
+
+
+@respx.mock
+def test_latency_status_and_sizes_per_endpoint():
+    respx.get(url__regex=rf"{BASE}/api/portfolio/\d+/summary").mock(
+        return_value=httpx.Response(200, json={"total": 1})
+    )
+    respx.post(f"{BASE}/api/cli/data/fetch").mock(return_value=httpx.Response(500, text="boom"))
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        client.portfolio.summary("101")
+        client.portfolio.summary("102")
+        with pytest.raises(ServerError):
+            client.data.fetch(universe="KOSPI")
+        snap = client.metrics.snapshot()
+
+    summary = snap["GET /api/portfolio/{id}/summary"]
+    assert summary["count"] == 2 and summary["errors"] == 0
+    assert summary["status_codes"] == {"200": 2}
+    assert summary["response_bytes"] == 2 * len(b'{"total":1}')
+    assert summary["in_flight"] == 0
+    assert summary["latency"]["p50"] is not None and sum(summary["latency"]["buckets"].values()) == 2
+
+    fetch = snap["POST /api/cli/data/fetch"]
+    assert fetch["errors"] == 1 and fetch["status_codes"] == {"500": 1}
+    assert fetch["request_bytes"] > 0
+
+
+@respx.mock
+def test_hooks_and_transport_errors():
+    respx.get(f"{BASE}/health").mock(side_effect=httpx.ConnectError("refused"))
+    seen = []
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        client.on_request(lambda ev: seen.append(("req", ev.endpoint)))
+        client.on_response(lambda ev: seen.append(("resp", ev.status_code, ev.error)))
+        with pytest.raises(Exception):
+            client.health.check()
+        snap = client.metrics.snapshot()
+    assert seen == [("req", "/health"), ("resp", None, "ConnectError")]
+    assert snap["GET /health"]["status_codes"] == {"error": 1}
+
+
+@respx.mock
+def test_response_bytes_are_wire_bytes():
+    body = json.dumps({"rows": [{"ticker": "005930", "close": 78000}] * 200}).encode()
+    compressed = gzip.compress(body)
+    respx.get(f"{BASE}/health").mock(
+        return_value=httpx.Response(200, content=compressed, headers={"Content-Encoding": "gzip"})
+    )
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        assert len(client.health.check()["rows"]) == 200
+        assert client.metrics.snapshot()["GET /health"]["response_bytes"] == len(compressed) < len(body)
+
+
+@respx.mock
+def test_stream_bytes_recorded():
+    respx.post(f"{BASE}/api/cli/data/export").mock(return_value=httpx.Response(200, content=b"a,b\n" * 100))
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        client._http.stream("POST", "/api/cli/data/export", io.BytesIO(), json={"dataset": "prices"})
+        assert client.metrics.snapshot()["POST /api/cli/data/export"]["response_bytes"] == 400
+
+
+@respx.mock
+def test_shared_collector_and_exports():
+    respx.get(f"{BASE}/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    shared = MetricsCollector()
+    for _ in range(2):
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE, metrics=shared) as client:
+            client.health.check()
+    shared.record_retry("GET", "/health")
+
+    assert json.loads(shared.to_json())["GET /health"]["count"] == 2
+    text = shared.to_prometheus()
+    assert 'qbique_sdk_request_duration_seconds_count{method="GET",endpoint="/health"} 2' in text
+    assert 'qbique_sdk_requests_total{method="GET",endpoint="/health",status="200"} 2' in text
+    assert 'qbique_sdk_request_retries_total{method="GET",endpoint="/health"} 1' in text
+    assert 'le="+Inf"} 2' in text
+
+
+def test_metrics_disabled():
+    client = QbiqueClient(api_key="qbi_test", endpoint=BASE, metrics=False)
+    assert client.metrics is None
+    client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_client_metrics():
+    respx.get(f"{BASE}/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        await client.health.check()
+        assert client.metrics.snapshot()["GET /health"]["count"] == 1
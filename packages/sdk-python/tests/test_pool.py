@@ -0,0 +1,111 @@
+"""Tests for ConnectionPool sharing and pool configuration."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from qbique import AsyncQbiqueClient, ConnectionPool, QbiqueClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        body = json.dumps({"status": "ok"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_clients_share_connections(endpoint):
+    _Handler.connections.clear()
+    with ConnectionPool(max_connections=4) as pool:
+        for _ in range(5):
+            with QbiqueClient(api_key="qbi_test", endpoint=endpoint, pool=pool) as client:
+                assert client.health.check() == {"status": "ok"}
+    # one keep-alive connection reused across all five clients
+    assert len(_Handler.connections) == 1
+
+
+def test_unshared_clients_open_new_connections(endpoint):
+    _Handler.connections.clear()
+    for _ in range(3):
+        with QbiqueClient(api_key="qbi_test", endpoint=endpoint) as client:
+            client.health.check()
+    assert len(_Handler.connections) == 3
+
+
+def test_pool_limits_applied():
+    pool = ConnectionPool(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.0)
+    assert pool.limits.max_connections == 7
+    assert pool.limits.max_keepalive_connections == 3
+    assert "max_connections=7" in repr(pool)
+
+
+def test_http2_requires_h2():
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            QbiqueClient(api_key="qbi_test", http2=True)
+    else:
+        QbiqueClient(api_key="qbi_test", http2=True).close()
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_pool(endpoint):
+    _Handler.connections.clear()
+    async with ConnectionPool() as pool:
+        for _ in range(3):
+            async with AsyncQbiqueClient(api_key="qbi_test", endpoint=endpoint, pool=pool) as client:
+                assert await client.health.check() == {"status": "ok"}
+    assert len(_Handler.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_both_transports(endpoint):
+    pool = ConnectionPool()
+    with QbiqueClient(api_key="qbi_test", endpoint=endpoint, pool=pool) as client:
+        client.health.check()
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=endpoint, pool=pool) as client:
+        await client.health.check()
+    connections = pool._async_transport._pool.connections
+    assert connections
+    await pool.aclose()
+    assert pool._transport is None and pool._async_transport is None
+    assert all(c.is_closed() for c in connections)
+
+
+@pytest.mark.asyncio
+async def test_close_warns_about_open_async_transport(endpoint):
+    pool = ConnectionPool()
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=endpoint, pool=pool) as client:
+        await client.health.check()
+    with pytest.warns(ResourceWarning, match="aclose"):
+        pool.close()
+    await pool.aclose()
+
+
+def test_custom_transport():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"mock": True}))
+    with QbiqueClient(api_key="qbi_test", transport=transport) as client:
+        assert client.health.check() == {"mock": True}
@@ -0,0 +1,122 @@
+"""Tests for the incremental local price store."""
+
+import json
+from datetime import date, timedelta
+
+import httpx
+import pytest
+import respx
+
+pd = pytest.importorskip("pandas")
+
+from qbique import QbiqueClient  # noqa: E402
+from qbique.store import PriceStore, merge_spans, missing_spans  # noqa: E402
+
+BASE = "http://test.local"
+FETCH = f"{BASE}/api/cli/data/fetch"
+
+
+class FakePriceServer:
+    """Serves one close per business day per ticker; records requested ranges."""
+
+    def __init__(self, universe=("A", "B")):
+        self.universe = list(universe)
+        self.requests: list[dict] = []
+        self.until: str | None = None  # no rows after this date (not yet published)
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.requests.append(body)
+        tickers = body.get("tickers") or self.universe
+        days = pd.bdate_range(body["start_date"], min(body["end_date"], self.until or body["end_date"]))
+        data = [
+            {"ticker": t, "trade_date": d.date().isoformat(), "close": 100.0 + i}
+            for i, d in enumerate(days)
+            for t in tickers
+        ]
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.fixture
+def server():
+    with respx.mock:
+        fake = FakePriceServer()
+        respx.post(FETCH).mock(side_effect=fake)
+        yield fake
+
+
+@pytest.fixture
+def store(tmp_path):
+    client = QbiqueClient(api_key="qbi_test", endpoint=BASE)
+    yield PriceStore(client, tmp_path)
+    client.close()
+
+
+def test_span_helpers():
+    d = date.fromisoformat
+    assert merge_spans([(d("2024-01-05"), d("2024-01-10")), (d("2024-01-01"), d("2024-01-04"))]) == [
+        (d("2024-01-01"), d("2024-01-10"))
+    ]
+    held = [(d("2024-01-01"), d("2024-01-10")), (d("2024-01-20"), d("2024-01-31"))]
+    assert missing_spans(held, d("2023-12-30"), d("2024-02-02")) == [
+        (d("2023-12-30"), d("2023-12-31")),
+        (d("2024-01-11"), d("2024-01-19")),
+        (d("2024-02-01"), d("2024-02-02")),
+    ]
+    assert missing_spans(held, d("2024-01-02"), d("2024-01-09")) == []
+
+
+def test_universe_gap_only(server, store):
+    first = store.fetch(universe="KOSPI", start_date="2024-01-01", end_date="2024-03-29")
+    assert list(first.columns) == ["A", "B"]
+    assert isinstance(first.index, pd.DatetimeIndex)
+
+    store.fetch(universe="KOSPI", start_date="2024-01-01", end_date="2024-03-29")
+    assert len(server.requests) == 1
+
+    extended = store.fetch(universe="KOSPI", start_date="2024-01-01", end_date="2024-04-05")
+    assert server.requests[-1]["start_date"] == "2024-03-30"
+    assert server.requests[-1]["end_date"] == "2024-04-05"
+    assert extended.index[-1] == pd.Timestamp("2024-04-05")
+    assert store.spans(universe="KOSPI") == [("2024-01-01", "2024-04-05")]
+
+
+def test_persisted_across_instances(server, store, tmp_path):
+    store.fetch(universe="US", start_date="2024-01-01", end_date="2024-01-31")
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        again = PriceStore(client, tmp_path).fetch(universe="US", start_date="2024-01-10", end_date="2024-01-20")
+    assert len(server.requests) == 1
+    assert again.index[0] >= pd.Timestamp("2024-01-10")
+
+
+def test_tickers_per_ticker_spans(server, store):
+    store.fetch(tickers=["A"], start_date="2024-01-01", end_date="2024-01-31")
+    df = store.fetch(tickers=["A", "C"], start_date="2024-01-01", end_date="2024-01-31")
+    assert server.requests[-1]["tickers"] == ["C"]
+    assert list(df.columns) == ["A", "C"]
+
+
+def test_today_not_marked_settled(server, store):
+    today = date.today()
+    store.fetch(universe="KOSPI", start_date=today - timedelta(days=10), end_date=today)
+    store.fetch(universe="KOSPI", start_date=today - timedelta(days=10), end_date=today)
+    assert len(server.requests) == 2
+    # refetched from the day after the last business day before today
+    assert today - timedelta(days=3) < date.fromisoformat(server.requests[-1]["start_date"]) <= today
+
+
+def test_empty_tail_not_marked_held(server, store):
+    server.until = "2024-03-27"
+    store.fetch(universe="KOSPI", start_date="2024-03-01", end_date="2024-03-29")
+    assert store.spans(universe="KOSPI") == [("2024-03-01", "2024-03-27")]
+
+    server.until = None
+    df = store.fetch(universe="KOSPI", start_date="2024-03-01", end_date="2024-03-29")
+    assert server.requests[-1]["start_date"] == "2024-03-28"
+    assert df.index[-1] == pd.Timestamp("2024-03-29")
+    assert store.spans(universe="KOSPI") == [("2024-03-01", "2024-03-29")]
+
+
+def test_requires_selection(store):
+    with pytest.raises(ValueError):
+        store.fetch(start_date="2024-01-01")
@@ -0,0 +1,201 @@
+"""Tests for parameter sweeps over BacktestResource.strategy."""
+
+import itertools
+import json
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, QbiqueClient
+from qbique.sweep import SweepCheckpoint, expand_grid, to_dataframe
+
+BASE = "http://test.local"
+GREEDY = f"{BASE}/api/backtest/strategy/greedy"
+FAST = dict(poll_interval=0.001, max_interval=0.005)
+
+
+class FakeGreedyServer:
+    """Submit -> job-N; each job completes on its second status check (``stuck`` jobs never do).
+
+    Submit number N in ``reject`` answers 422; status checks of ``missing`` jobs answer 404.
+    """
+
+    def __init__(
+        self,
+        fail: set[str] = frozenset(),
+        stuck: set[str] = frozenset(),
+        reject: set[int] = frozenset(),
+        missing: set[str] = frozenset(),
+    ):
+        self.counter = itertools.count(1)
+        self.submitted: list[dict] = []
+        self.polls: dict[str, int] = {}
+        self.fail = fail
+        self.stuck = set(stuck)
+        self.reject = reject
+        self.missing = missing
+
+    def install(self) -> None:
+        respx.post(GREEDY).mock(side_effect=self.submit)
+        respx.get(url__regex=rf"{GREEDY}/[^/]+/result$").mock(side_effect=self.result)
+        respx.get(url__regex=rf"{GREEDY}/[^/]+$").mock(side_effect=self.status)
+
+    def submit(self, request):
+        body = json.loads(request.content)
+        self.submitted.append(body)
+        n = next(self.counter)
+        if n in self.reject:
+            return httpx.Response(422, json={"detail": "invalid combination"})
+        return httpx.Response(200, json={"job_id": f"job-{n}", "status": "queued"})
+
+    def status(self, request):
+        job_id = request.url.path.rsplit("/", 1)[-1]
+        self.polls[job_id] = self.polls.get(job_id, 0) + 1
+        if job_id in self.missing:
+            return httpx.Response(404)
+        if job_id in self.fail:
+            return httpx.Response(200, json={"status": "failed", "message": "no data"})
+        done = self.polls[job_id] >= 2 and job_id not in self.stuck
+        return httpx.Response(200, json={"status": "completed" if done else "running"})
+
+    def result(self, request):
+        job_id = request.url.path.split("/")[-2]
+        return httpx.Response(200, json={"sharpe_ratio": float(job_id.split("-")[1]), "final_value": 1.0})
+
+
+GRID = {"portfolio_strategy": ["max_sharpe", "hrp"], "rebalance_freq": ["monthly", "quarterly"]}
+
+
+def test_expand_grid():
+    combos = expand_grid(GRID)
+    assert len(combos) == 4
+    assert combos[0] == {"portfolio_strategy": "max_sharpe", "rebalance_freq": "monthly"}
+    with pytest.raises(TypeError):
+        expand_grid({"universe": "US"})
+
+
+@respx.mock
+def test_sweep_rows():
+    server = FakeGreedyServer(fail={"job-3"})
+    server.install()
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = list(client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                          universe="US", concurrency=2, **FAST))
+    assert len(rows) == 4 and len(server.submitted) == 4
+    assert all(body["universe"] == "US" for body in server.submitted)
+    failed = [r for r in rows if r["status"] == "failed"]
+    assert len(failed) == 1 and failed[0]["error"] == "no data"
+    ok = [r for r in rows if r["status"] == "completed"]
+    assert {"portfolio_strategy", "rebalance_freq", "job_id", "sharpe_ratio"} <= set(ok[0])
+
+
+def test_to_dataframe():
+    pytest.importorskip("pandas")
+    df = to_dataframe([{"a": 1, "sharpe_ratio": 0.5}, {"a": 2, "sharpe_ratio": 0.7}])
+    assert list(df.columns) == ["a", "sharpe_ratio"] and len(df) == 2
+
+
+def test_sweep_rejects_unknown_param():
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        with pytest.raises(ValueError, match="lookback"):
+            list(client.backtest.sweep({"lookback": [1]}, start="2020-01-01", end="2024-12-31"))
+
+
+@respx.mock
+def test_sweep_resume(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    server = FakeGreedyServer()
+    server.install()
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        gen = client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                    concurrency=4, checkpoint=path, **FAST)
+        first = next(gen)
+        gen.close()  # simulated crash: one row done, three jobs in flight
+        assert len(server.submitted) == 4
+
+        ckpt = SweepCheckpoint(path)
+        assert len(ckpt.rows) == 1 and len(ckpt.submitted) == 4
+
+        rows = list(client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                          concurrency=4, checkpoint=path, **FAST))
+    assert len(server.submitted) == 4  # nothing resubmitted
+    assert rows[0] == first
+    assert sorted(r["job_id"] for r in rows) == ["job-1", "job-2", "job-3", "job-4"]
+
+
+@respx.mock
+def test_sweep_request_errors_become_failed_rows(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    server = FakeGreedyServer(reject={1}, missing={"job-3"})
+    server.install()
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = list(client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31", concurrency=2,
+                                          checkpoint=path, **FAST))
+    assert len(rows) == 4 and len(server.submitted) == 4
+    errors = {r["job_id"]: r["error"] for r in rows if r["status"] == "failed"}
+    assert set(errors) == {None, "job-3"}
+    assert errors[None].startswith("ValidationError")
+    assert errors["job-3"].startswith("NotFoundError")
+    assert sorted(r["status"] for r in SweepCheckpoint(path).rows.values()) == ["completed"] * 2 + ["failed"] * 2
+
+
+@respx.mock
+def test_sweep_job_timeout_is_resumable(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    server = FakeGreedyServer(stuck={"job-2"})
+    server.install()
+    with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = list(client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31", concurrency=4,
+                                          checkpoint=path, timeout=0.05, **FAST))
+        timed_out = [r for r in rows if r["status"] == "timeout"]
+        assert len(rows) == 4 and [r["job_id"] for r in timed_out] == ["job-2"]
+        assert timed_out[0]["error"] == "Job still running after 0.05s"
+        assert timed_out[0]["sharpe_ratio"] is None
+        assert "job-2" not in {r["job_id"] for r in SweepCheckpoint(path).rows.values()}
+
+        server.stuck.clear()
+        rows = list(client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31", concurrency=4,
+                                          checkpoint=path, timeout=5, **FAST))
+    assert len(server.submitted) == 4  # job-2 was polled again, not resubmitted
+    assert all(r["status"] == "completed" for r in rows)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_sweep_job_timeout(tmp_path):
+    server = FakeGreedyServer(stuck={"job-1"})
+    server.install()
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = [r async for r in client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                                       concurrency=4, checkpoint=tmp_path / "s.jsonl",
+                                                       timeout=0.05, **FAST)]
+    assert sorted(r["status"] for r in rows) == ["completed"] * 3 + ["timeout"]
+    assert len(SweepCheckpoint(tmp_path / "s.jsonl").rows) == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_sweep(tmp_path):
+    server = FakeGreedyServer()
+    server.install()
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = [r async for r in client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                                       concurrency=2, checkpoint=tmp_path / "s.jsonl",
+                                                       **FAST)]
+    assert len(rows) == 4 and all(r["status"] == "completed" for r in rows)
+    assert len(SweepCheckpoint(tmp_path / "s.jsonl").rows) == 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_sweep_request_errors_become_failed_rows(tmp_path):
+    server = FakeGreedyServer(reject={1}, missing={"job-3"})
+    server.install()
+    async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+        rows = [r async for r in client.backtest.sweep(GRID, start="2020-01-01", end="2024-12-31",
+                                                       concurrency=2, checkpoint=tmp_path / "s.jsonl",
+                                                       **FAST)]
+    errors = {r["job_id"]: r["error"] for r in rows if r["status"] == "failed"}
+    assert set(errors) == {None, "job-3"}
+    assert len(SweepCheckpoint(tmp_path / "s.jsonl").rows) == 4
@@ -0,0 +1,190 @@
+"""Tests for qbique.testing.FakeServer (mock transport and localhost server)."""
+
+import io
+import random
+import time
+
+import pytest
+
+from qbique import (
+    AsyncQbiqueClient,
+    AuthenticationError,
+    JobFailedError,
+    NotFoundError,
+    QbiqueClient,
+    ServerError,
+)
+from qbique.testing import FakeServer, fixed, lognormal, uniform
+
+FAST = dict(poll_interval=0.001, max_interval=0.01)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def small_server(**kwargs) -> FakeServer:
+    return FakeServer(assets=5, result_days=30, universe_size=3, fetch_days=5, **kwargs)
+
+
+def test_every_resource_route():
+    server = small_server()
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        assert c.health.check() == {"status": "ok"}
+        assert "version" in c.health.version()
+        assert c.strategy.list()["methods"]
+        assert c.strategy.show(1)["problem_id"] == "1"
+        assert c.strategy.create({"name": "s"})["spec"] == {"name": "s"}
+        assert c.strategy.validate({"name": "s"})["valid"]
+        assert c.strategy.push("s", "yaml", {})["name"] == "s"
+        assert len(c.strategy.versions(7)["versions"]) == 3
+        assert len(c.optimize.run(1)["weights"]) == 5
+        assert c.optimize.run(1, greedy=True)["status"] == "completed"
+        assert c.optimize.status("r1")["status"] == "completed"
+        assert len(c.optimize.frontier("r1", n_points=10)["points"]) == 10
+        job = c.backtest.run(tickers=["005930"], start="2023-01-01", end="2024-12-31")
+        assert c.backtest.status(job["job_id"])["status"] == "completed"
+        assert len(c.backtest.results(job["job_id"])["portfolio_values"]) == 30
+        assert "start_date" in c.backtest.available_range()
+        assert len(c.data.search("kb", limit=3)["results"]) == 3
+        assert c.data.validate(["A"])["valid"] == ["A"]
+        assert len(c.data.fetch()["data"]) == 3 * 5
+        assert {r["ticker"] for r in c.data.fetch(tickers=["X", "Y"])["data"]} == {"X", "Y"}
+        assert len(c.data.export("prices", tickers=["X"])["data"]) == 5
+        sink = io.BytesIO()
+        c.data.export_to("prices", sink, tickers=["X"])
+        assert sink.getvalue().startswith(b"ticker,trade_date,close\n")
+        assert c.data.import_data("prices", [{"a": 1}, {"a": 2}])["imported"] == 2
+        assert c.data.import_bulk("prices", [{"a": i} for i in range(10)], chunk_records=4).ok
+        assert len(c.portfolio.summary("p1")["holdings"]) == 30
+        assert c.portfolio.drift("p1")["drift"]
+        assert len(c.portfolio.pnl("p1")["daily"]) == 250
+        assert len(c.contract.list()) == 20
+        assert c.contract.status("c1")["status"] == "active"
+    assert server.requests["GET /api/portfolio/{id}/summary"] == 1
+    assert server.requests["POST /api/cli/data/import"] == 4  # 1 + 3 bulk chunks
+
+
+def test_unknown_route_and_missing_key():
+    server = small_server()
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        with pytest.raises(NotFoundError):
+            c._http.get("/api/nope")
+    with QbiqueClient(api_key="", transport=server.transport()) as c:
+        with pytest.raises(AuthenticationError):
+            c.health.check()
+
+
+def test_error_injection():
+    server = small_server(error_rate=1.0, error_statuses=(503,))
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        with pytest.raises(ServerError) as exc:
+            c.health.check()
+    assert exc.value.status_code == 503
+    assert server.injected_errors == 1
+    assert c.metrics.snapshot()["GET /health"]["status_codes"] == {"503": 1}
+
+
+def test_error_rate_is_sampled():
+    server = small_server(error_rate=0.3, seed=1)
+    failures = 0
+    with QbiqueClient(api_key="qbi_test", transport=server.transport(), metrics=False) as c:
+        for _ in range(500):
+            try:
+                c.health.check()
+            except ServerError:
+                failures += 1
+    assert failures == server.injected_errors
+    assert 100 < failures < 200
+
+
+def test_latency_distributions():
+    rng = random.Random(0)
+    assert fixed(0.5)(rng) == 0.5
+    assert all(0.1 <= uniform(0.1, 0.2)(rng) <= 0.2 for _ in range(100))
+    samples = sorted(lognormal(0.02, 0.5)(rng) for _ in range(2001))
+    assert samples[1000] == pytest.approx(0.02, rel=0.1)
+    assert samples[-20] > 2 * samples[1000]
+
+
+def test_route_latency():
+    server = small_server(latency=0.0, route_latency={"GET /api/contracts/list": 0.05})
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        t0 = time.perf_counter()
+        c.health.check()
+        fast = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        c.contract.list()
+        slow = time.perf_counter() - t0
+    assert slow >= 0.05 > fast
+
+
+def test_slow_job_progress():
+    clock = FakeClock()
+    server = small_server(job_duration=10.0, clock=clock)
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        job_id = c.backtest.strategy(start="2020-01-01", end="2024-12-31")["job_id"]
+        clock.now = 2.5
+        assert c.backtest.strategy_status(job_id) == {"job_id": job_id, "status": "running", "progress": 0.25}
+        clock.now = 10.0
+        assert c.backtest.strategy_status(job_id)["status"] == "completed"
+        assert len(c.backtest.strategy_result(job_id)["rebalances"]) == 2
+        with pytest.raises(NotFoundError):
+            c.backtest.strategy_status("job-missing")
+
+
+def test_wait_on_slow_jobs():
+    server = small_server(job_duration=uniform(0.01, 0.05))
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        jobs = [c.backtest.strategy(start="2020-01-01", end="2024-12-31")["job_id"] for _ in range(3)]
+        done = dict(c.backtest.wait_many(jobs, timeout=5, **FAST))
+    assert sorted(done) == sorted(jobs)
+    assert server.requests["GET /api/backtest/strategy/greedy/{id}"] > 3
+
+
+def test_job_failure_injection():
+    server = small_server(job_failure_rate=1.0)
+    with QbiqueClient(api_key="qbi_test", transport=server.transport()) as c:
+        job_id = c.backtest.strategy(start="2020-01-01", end="2024-12-31")["job_id"]
+        with pytest.raises(JobFailedError, match="did not converge"):
+            c.backtest.wait(job_id, **FAST)
+
+
+def test_gzip_request_bodies():
+    server = small_server()
+    with QbiqueClient(api_key="qbi_test", transport=server.transport(), compress_threshold=1) as c:
+        assert c.data.validate(["A", "B"])["valid"] == ["A", "B"]
+
+
+def test_invalid_rates():
+    with pytest.raises(ValueError):
+        FakeServer(error_rate=1.5)
+
+
+@pytest.mark.asyncio
+async def test_async_transport():
+    server = small_server(latency=0.02, job_duration=0.02)
+    async with AsyncQbiqueClient(api_key="qbi_test", transport=server.async_transport()) as c:
+        t0 = time.perf_counter()
+        health = await c.health.check()
+        job = await c.backtest.strategy(start="2020-01-01", end="2024-12-31")
+        result = await c.backtest.wait(job["job_id"], **FAST)
+    assert health == {"status": "ok"}
+    assert result["job_id"] == "bench"
+    assert time.perf_counter() - t0 >= 0.04
+
+
+def test_serve_over_http():
+    server = small_server()
+    with server.serve() as endpoint:
+        assert endpoint.startswith("http://127.0.0.1:")
+        with QbiqueClient(api_key="qbi_test", endpoint=endpoint) as c:
+            assert c.health.check() == {"status": "ok"}
+            assert len(c.data.fetch(tickers=["X"])["data"]) == 5
+            with pytest.raises(NotFoundError):
+                c._http.get("/api/nope")
+    assert server.requests["POST /api/cli/data/fetch"] == 1
@@ -0,0 +1,117 @@
+"""Tests for BacktestResource.wait / wait_many (sync and async)."""
+
+import httpx
+import pytest
+import respx
+
+from qbique import AsyncQbiqueClient, JobFailedError, JobTimeoutError, QbiqueClient
+from qbique._waiter import PollSchedule
+
+BASE = "http://test.local"
+GREEDY = f"{BASE}/api/backtest/strategy/greedy"
+
+
+def _mock_job(job_id: str, statuses: list[dict], result: dict | None = None) -> None:
+    respx.get(f"{GREEDY}/{job_id}").mock(
+        side_effect=[httpx.Response(200, json=s) for s in statuses]
+    )
+    respx.get(f"{GREEDY}/{job_id}/result").mock(
+        return_value=httpx.Response(200, json=result or {"job_id": job_id})
+    )
+
+
+FAST = dict(poll_interval=0.001, max_interval=0.01)
+
+
+class TestPollSchedule:
+    def test_backoff_grows_to_cap(self):
+        sched = PollSchedule(1.0, 4.0, 2.0)
+        delays = [sched.next_delay({"status": "running"}, float(t)) for t in range(5)]
+        assert delays == [1.0, 2.0, 4.0, 4.0, 4.0]
+
+    def test_progress_eta(self):
+        sched = PollSchedule(0.5, 30.0, 2.0)
+        sched.next_delay({"status": "running", "progress": 0.2}, 0.0)
+        # 0.2 -> 0.4 in 10s => 0.6 remaining at 0.02/s = 30s, capped at max
+        assert sched.next_delay({"status": "running", "progress": 0.4}, 10.0) == 30.0
+        # 0.4 -> 0.9 in 5s => 0.1 remaining at 0.1/s = 1s
+        assert sched.next_delay({"status": "running", "progress": 0.9}, 15.0) == pytest.approx(1.0)
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            PollSchedule(0, 1.0, 1.5)
+
+
+class TestSyncWaiter:
+    @respx.mock
+    def test_wait(self):
+        _mock_job("j1", [{"status": "running"}, {"status": "running"}, {"status": "completed"}],
+                  {"sharpe_ratio": 1.2})
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            assert client.backtest.wait("j1", **FAST) == {"sharpe_ratio": 1.2}
+
+    @respx.mock
+    def test_wait_many_completion_order(self):
+        _mock_job("slow", [{"status": "running"}] * 4 + [{"status": "completed"}])
+        _mock_job("fast", [{"status": "running"}, {"status": "completed"}])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            done = [job_id for job_id, _ in client.backtest.wait_many(["slow", "fast"], **FAST)]
+        assert done == ["fast", "slow"]
+
+    @respx.mock
+    def test_failed_job(self):
+        _mock_job("bad", [{"status": "failed", "message": "boom"}])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            with pytest.raises(JobFailedError, match="boom") as exc:
+                client.backtest.wait("bad", **FAST)
+        assert exc.value.job_id == "bad"
+
+    @respx.mock
+    def test_failed_job_yielded(self):
+        _mock_job("bad", [{"status": "failed"}])
+        _mock_job("ok", [{"status": "completed"}])
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            out = dict(client.backtest.wait_many(["bad", "ok"], raise_on_failure=False, **FAST))
+        assert out["bad"]["status"] == "failed"
+        assert out["ok"] == {"job_id": "ok"}
+
+    @respx.mock
+    def test_timeout(self):
+        respx.get(f"{GREEDY}/stuck").mock(return_value=httpx.Response(200, json={"status": "running"}))
+        with QbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            with pytest.raises(JobTimeoutError) as exc:
+                client.backtest.wait("stuck", timeout=0.05, **FAST)
+        assert exc.value.job_ids == ["stuck"]
+
+
+class TestAsyncWaiter:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_wait_many(self):
+        _mock_job("slow", [{"status": "queued"}] * 4 + [{"status": "completed"}])
+        _mock_job("fast", [{"status": "completed"}])
+        async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            done = [job_id async for job_id, _ in client.backtest.wait_many(["slow", "fast"], **FAST)]
+        assert done == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_wait_and_timeout(self):
+        _mock_job("j1", [{"status": "running"}, {"status": "completed"}], {"total_return": 0.1})
+        respx.get(f"{GREEDY}/stuck").mock(return_value=httpx.Response(200, json={"status": "running"}))
+        async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            assert await client.backtest.wait("j1", **FAST) == {"total_return": 0.1}
+            with pytest.raises(JobTimeoutError):
+                await client.backtest.wait("stuck", timeout=0.05, **FAST)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_timeout_lists_only_unfinished_jobs(self):
+        respx.get(f"{GREEDY}/stuck").mock(return_value=httpx.Response(200, json={"status": "running"}))
+        _mock_job("bad", [{"status": "failed", "message": "boom"}])
+        _mock_job("done", [{"status": "completed"}])
+        async with AsyncQbiqueClient(api_key="qbi_test", endpoint=BASE) as client:
+            with pytest.raises(JobTimeoutError) as exc:
+                async for _ in client.backtest.wait_many(["stuck", "bad", "done"], timeout=0, **FAST):
+                    pass
+        assert exc.value.job_ids == ["stuck"]
@@ -0,0 +1,90 @@
+"""signals_to_weights 벤치마크 — 5,000개 시그널 입력.
+
+packages/strategy-base에서 실행::
+
+    python benchmarks/bench_allocation.py [--signals 5000] [--repeat 20]
+
+비교 대상 ``iterative``는 dict 기반 반복 재배분(water-filling) 구현으로,
+vectorized 구현과 같은 규칙(``min_weight`` 처리 제외)을 따른다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from qbique_strategy import Signal, SignalBatch, signals_to_weights  # noqa: E402
+from qbique_strategy.allocation import allocate  # noqa: E402
+
+CONSTRAINTS = {
+    "none": {},
+    "max_weight": {"max_weight": 0.00025},
+    "all": {"max_weight": 0.002, "min_weight": 0.0001, "max_positions": 2000},
+}
+
+
+def iterative(signals: List[Signal], constraints: Dict) -> Dict[str, float]:
+    """기준 구현: 종목 dict를 돌며 한도 초과분을 반복 재배분"""
+    cap = constraints.get("max_weight", 1.0)
+    ranked = sorted(signals, key=lambda s: s.score, reverse=True)[: constraints.get("max_positions")]
+    scores = {s.ticker: max(s.score, 0.0) for s in ranked}
+    total = sum(scores.values())
+    weights = {t: v / total for t, v in scores.items()}
+    capped: set = set()
+    while True:
+        over = [t for t, w in weights.items() if t not in capped and w > cap]
+        if not over:
+            return weights
+        excess = sum(weights[t] - cap for t in over)
+        for t in over:
+            weights[t] = cap
+            capped.add(t)
+        free = {t: w for t, w in weights.items() if t not in capped}
+        free_total = sum(free.values())
+        if free_total <= 0:
+            return weights
+        for t, w in free.items():
+            weights[t] = w + excess * w / free_total
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signals", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tickers = [f"{i:06d}" for i in range(args.signals)]
+    scores = rng.lognormal(0.0, 1.0, args.signals)
+    signals = [Signal(ticker=t, score=float(s)) for t, s in zip(tickers, scores)]
+    batch = SignalBatch(tickers, np.arange(args.signals), scores)
+
+    print(f"{args.signals} signals, best of {args.repeat} (ms)")
+    print(f"{'constraints':<12}{'iterative':>12}{'list':>12}{'batch':>12}{'allocate':>12}")
+    for name, constraints in CONSTRAINTS.items():
+        row = [
+            timeit(lambda: iterative(signals, constraints), max(1, args.repeat // 5)),
+            timeit(lambda: signals_to_weights(signals, constraints), args.repeat),
+            timeit(lambda: signals_to_weights(batch, constraints), args.repeat),
+            timeit(lambda: allocate(scores, None, constraints), args.repeat),
+        ]
+        print(f"{name:<12}" + "".join(f"{t * 1e3:>12.2f}" for t in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""qbique_strategy 벤치마크 스위트 — 저장된 기준값(baseline) 대비 회귀 보고.
+
+packages/strategy-base에서 실행::
+
+    python benchmarks/suite.py                      # 전체 (100 / 1,000 / 5,000 종목)
+    python benchmarks/suite.py --sizes 100 -k examples
+    python benchmarks/suite.py --save               # 현재 결과를 기준값으로 저장
+
+10년(2,520 거래일) 합성 가격 행렬(종목의 10%는 늦게 상장, 1%는 중간 거래정지)
+위에서 다음을 잰다 (각 케이스 best-of ``--repeat``, 초):
+
+    marketdata/<N>/...   MarketData 생성 / returns / *_all 지표 /
+                         월말 as_of view 조회 / 종목별 calculate_* 루프
+    examples/<N>/...     examples/의 전략을 월간 리밸런싱으로 Backtester 실행
+    validator/...        대형 전략 파일 검증 (캐시 없음 / 캐시 적중 / 200개 일괄)
+
+기준값은 ``benchmarks/baseline.json``에 케이스별 시간과 측정 환경을 함께
+저장한다. 기준값보다 ``--tolerance``(기본 25%) 이상 느린 케이스는 REGRESSION으로
+표시하고 종료 코드 1을 반환한다. 기준값은 측정한 머신 기준이므로 다른
+머신에서는 ``--save``로 먼저 갱신할 것.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+sys.path.insert(0, os.path.join(HERE, "..", "examples"))
+
+from qbique_strategy import Backtester, MarketData, validate_files, validate_strategy_code  # noqa: E402
+from qbique_strategy import validator  # noqa: E402
+
+from mean_reversion import MeanReversionStrategy  # noqa: E402
+from momentum import MomentumStrategy  # noqa: E402
+
+BASELINE = os.path.join(HERE, "baseline.json")
+DAYS = 2520
+
+Case = Tuple[str, Callable[[], object]]
+
+
+# ── 입력 데이터 ──
+
+
+def synthetic_prices(tickers: int, days: int = DAYS, seed: int = 0) -> pd.DataFrame:
+    """로그정규 가격 경로. 10%는 늦게 상장, 1%는 중간 20일 거래정지"""
+    rng = np.random.default_rng(seed)
+    rets = rng.normal(0.0003, 0.02, (days, tickers))
+    values = 100.0 * np.exp(np.cumsum(rets, axis=0))
+    late = rng.choice(tickers, max(1, tickers // 10), replace=False)
+    for j in late:
+        values[: rng.integers(1, days // 2), j] = np.nan
+    halted = rng.choice(tickers, max(1, tickers // 100), replace=False)
+    for j in halted:
+        start = rng.integers(days // 2, days - 20)
+        values[start : start + 20, j] = np.nan
+    index = pd.bdate_range("2015-01-01", periods=days)
+    return pd.DataFrame(values, index=index, columns=[f"{j:06d}" for j in range(tickers)])
+
+
+def large_strategy_source(helpers: int = 2000) -> str:
+    """헬퍼 메서드가 많은 대형 전략 파일 (~10 lines x helpers)"""
+    lines = [
+        "import numpy as np",
+        "import pandas as pd",
+        "from qbique_strategy import BaseStrategy, Signal, SignalBatch",
+        "",
+        "class Large(BaseStrategy):",
+        "    def generate_signals(self, market_data, rebalance_date):",
+        "        scores = market_data.momentum_all(20)",
+        "        for ticker in market_data.tickers:",
+        "            value = market_data.calculate_volatility(ticker, 20)",
+        "        return SignalBatch.from_series(scores[scores > 0])",
+        "",
+    ]
+    for i in range(helpers):
+        lines += [
+            f"    def helper_{i}(self, market_data, period={i % 60 + 1}):",
+            f"        frame = market_data.prices.iloc[-period:]",
+            f"        rets = frame.pct_change().dropna()",
+            f"        score = (rets.mean() / rets.std()).fillna(0.0)",
+            f"        ranked = score.sort_values(ascending=False)",
+            f"        picks = [t for t in ranked.index[:{i % 20 + 5}] if score[t] > 0]",
+            f"        weights = {{t: 1.0 / len(picks) for t in picks}} if picks else {{}}",
+            f"        return [Signal(ticker=t, score=w) for t, w in weights.items()]",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+# ── 케이스 ──
+
+
+def marketdata_cases(n: int, prices: pd.DataFrame) -> List[Case]:
+    month_ends = prices.groupby(prices.index.to_period("M")).tail(1).index
+    shared = MarketData(prices)
+    one_view = shared.as_of(prices.index[-1])
+    one_view.momentum_all(20)  # 엔진 테이블 준비 (calculate 루프만 측정)
+
+    def indicators_all():
+        md = MarketData(prices)
+        md.momentum_all(20)
+        md.volatility_all(60)
+        md.ma_deviation_all(50)
+
+    def views_monthly():
+        md = MarketData(prices)
+        for when in month_ends:
+            view = md.as_of(when)
+            view.momentum_all(20)
+            view.volatility_all(60)
+
+    def calculate_loop():
+        for ticker in one_view.tickers:
+            one_view.calculate_momentum(ticker, 20)
+
+    return [
+        (f"marketdata/{n}/construct", lambda: MarketData(prices)),
+        (f"marketdata/{n}/returns", lambda: MarketData(prices).returns),
+        (f"marketdata/{n}/indicators_all", indicators_all),
+        (f"marketdata/{n}/views_monthly", views_monthly),
+        (f"marketdata/{n}/calculate_loop", calculate_loop),
+    ]
+
+
+def example_cases(n: int, prices: pd.DataFrame) -> List[Case]:
+    return [
+        (
+            f"examples/{n}/momentum",
+            lambda: Backtester(MomentumStrategy({"period": 20}), prices, rebalance="M").run(),
+        ),
+        (
+            f"examples/{n}/mean_reversion",
+            lambda: Backtester(MeanReversionStrategy({"ma_period": 50}), prices, rebalance="M").run(),
+        ),
+    ]
+
+
+def validator_cases(workdir: str) -> List[Case]:
+    source = large_strategy_source()
+    paths = []
+    for i in range(200):
+        path = os.path.join(workdir, f"strategy_{i}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(large_strategy_source(10 + i % 40))
+        paths.append(path)
+
+    def uncached():
+        validator.clear_cache()
+        validate_strategy_code(source, perf_lint=True)
+
+    def batch():
+        validator.clear_cache()
+        validate_files(paths, perf_lint=True)
+
+    validate_strategy_code(source)
+    return [
+        (f"validator/large_file_{len(source) // 1024}kb", uncached),
+        ("validator/large_file_cached", lambda: validate_strategy_code(source, perf_lint=True)),
+        ("validator/batch_200_files", batch),
+    ]
+
+
+# ── 실행 / 기준값 비교 ──
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def machine() -> Dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def load_baseline(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {"machine": None, "results": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: Dict[str, float], baseline: Dict, tolerance: float, noise: float = 1e-3) -> List[str]:
+    """결과 표를 출력하고 회귀한 케이스 이름을 반환 (차이가 ``noise``초 미만이면 무시)"""
+    base = baseline.get("results", {})
+    regressions = []
+    print(f"{'case':<40} {'seconds':>10} {'baseline':>10} {'ratio':>7}  status")
+    for name, seconds in results.items():
+        ref = base.get(name)
+        if ref is None:
+            print(f"{name:<40} {seconds:>10.4f} {'-':>10} {'-':>7}  new")
+            continue
+        ratio = seconds / ref if ref > 0 else float("inf")
+        status = "ok"
+        if abs(seconds - ref) < noise:
+            pass
+        elif ratio > 1.0 + tolerance:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1.0 / (1.0 + tolerance):
+            status = "faster"
+        print(f"{name:<40} {seconds:>10.4f} {ref:>10.4f} {ratio:>6.2f}x  {status}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,5000", help="종목 수 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-k", dest="keyword", default="", help="이름에 이 문자열이 들어간 케이스만")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀로 볼 느려짐 비율")
+    parser.add_argument("--save", action="store_true", help="결과를 기준값 파일에 병합 저장")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    if baseline.get("machine") and baseline["machine"] != machine():
+        print(f"note: baseline was recorded on {baseline['machine']}")
+
+    results: Dict[str, float] = {}
+
+    def run(cases: List[Case]) -> None:
+        for name, fn in cases:
+            if args.keyword in name:
+                results[name] = best_of(fn, args.repeat)
+
+    for n in (int(s) for s in args.sizes.split(",") if s):
+        prices = synthetic_prices(n)
+        run(marketdata_cases(n, prices))
+        run(example_cases(n, prices))
+    with tempfile.TemporaryDirectory() as workdir:
+        run(validator_cases(workdir))
+
+    regressions = compare(results, baseline, args.tolerance)
+    if args.save:
+        merged = {**baseline.get("results", {}), **{k: round(v, 6) for k, v in results.items()}}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine(), "results": dict(sorted(merged.items()))}, f, indent=2)
+            f.write("\n")
+        print(f"saved {len(results)} results to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,6 @@ Mean Reversion Strategy Example
 from datetime import date
 from typing import List
 
-import numpy as np
-
 from qbique_strategy import BaseStrategy, MarketData, Signal, SignalDirection
 
 
@@ -20,26 +18,18 @@ class MeanReversionStrategy(BaseStrategy):
         threshold = self.params.get("threshold", -0.05)  # -5% 이하면 매수
         signals: List[Signal] = []
 
-        for ticker in market_data.tickers:
-            prices = market_data.prices[ticker].dropna()
-            if len(prices) < ma_period + 1:
-                continue
-
-            ma = prices.iloc[-ma_period:].mean()
-            current_price = prices.iloc[-1]
-            deviation = (current_price - ma) / ma
-
-            if deviation < threshold:
-                # 괴리도가 클수록 높은 점수
-                score = abs(deviation)
-                signals.append(
-                    Signal(
-                        ticker=ticker,
-                        score=score,
-                        direction=SignalDirection.LONG,
-                        metadata={"deviation": float(deviation), "ma": float(ma)},
-                    )
+        deviation = market_data.ma_deviation_all(ma_period)
+        ma = market_data.moving_average_all(ma_period)
+        for ticker, dev in deviation[deviation < threshold].items():
+            # 괴리도가 클수록 높은 점수
+            signals.append(
+                Signal(
+                    ticker=ticker,
+                    score=abs(dev),
+                    direction=SignalDirection.LONG,
+                    metadata={"deviation": float(dev), "ma": float(ma[ticker])},
                 )
+            )
 
         return signals
 
@@ -16,17 +16,16 @@ class MomentumStrategy(BaseStrategy):
         period = self.params.get("period", 20)
         signals: List[Signal] = []
 
-        for ticker in market_data.tickers:
-            mom = market_data.calculate_momentum(ticker, period)
-            if mom > 0:
-                signals.append(
-                    Signal(
-                        ticker=ticker,
-                        score=mom,
-                        direction=SignalDirection.LONG,
-                        metadata={"momentum": mom, "period": period},
-                    )
+        momentum = market_data.momentum_all(period)
+        for ticker, mom in momentum[momentum > 0].items():
+            signals.append(
+                Signal(
+                    ticker=ticker,
+                    score=float(mom),
+                    direction=SignalDirection.LONG,
+                    metadata={"momentum": float(mom), "period": period},
                 )
+            )
 
         return signals
 
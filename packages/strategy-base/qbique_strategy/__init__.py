@@ -15,17 +15,33 @@ Usage::
             return signals
 """
 
+from .allocation import signals_to_weights
+from .backtest import Backtester, BacktestResult
 from .base import BaseStrategy
 from .data import MarketData
-from .signal import Signal, SignalDirection
-from .validator import ValidationResult, validate_strategy_code, detect_class_name
+from .indicators import RollingIndicators
+from .signal import Signal, SignalBatch, SignalDirection
+from .validator import (
+    BatchValidationResult,
+    ValidationResult,
+    detect_class_name,
+    validate_files,
+    validate_strategy_code,
+)
 
 __all__ = [
     "BaseStrategy",
+    "Backtester",
+    "BacktestResult",
+    "signals_to_weights",
     "MarketData",
+    "RollingIndicators",
     "Signal",
+    "SignalBatch",
     "SignalDirection",
     "ValidationResult",
+    "BatchValidationResult",
     "validate_strategy_code",
     "detect_class_name",
+    "validate_files",
 ]
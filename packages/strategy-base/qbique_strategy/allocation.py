@@ -0,0 +1,161 @@
+"""
+allocation — Signal 리스트를 risk_constraints()를 지키는 비중으로 변환
+
+반복 재배분 루프 없이 정렬 한 번과 누적합으로 계산하는 closed-form NumPy
+구현이다. ``max_weight`` 한도 재배분의 해는 ``w_i = min(max_weight, λ·raw_i)``
+꼴이므로 정렬된 raw 비중의 breakpoint에서 λ를 바로 구한다.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from .signal import DIRECTION_CODES, Signal, SignalBatch, SignalDirection
+
+_LONG = DIRECTION_CODES[SignalDirection.LONG]
+_EPS = 1e-12
+
+
+def signals_to_weights(
+    signals: Union[Iterable[Signal], SignalBatch],
+    constraints: Optional[Dict] = None,
+) -> Dict[str, float]:
+    """
+    시그널을 롱 온리 목표 비중으로 변환한다.
+
+    규칙:
+        - LONG 시그널만 사용 (SHORT / NEUTRAL은 무시), 종목당 마지막 시그널
+        - ``max_positions``: score 상위 N개 종목만 편입
+        - 명시적 ``weight``가 있으면 그대로 사용하고, 남은 비중을
+          나머지 종목에 양수 score 비례로 배분 (모두 0 이하이면 동일 비중)
+        - ``max_weight`` 초과분은 한도 미만 종목에 비례 재배분.
+          한도 때문에 전부 배분할 수 없으면 남는 비중은 현금
+        - ``min_weight``: 모든 편입 종목이 하한 이상이 되는 최대 상위
+          종목 집합만 남기고 재배분
+
+    Args:
+        signals: 전략이 생성한 시그널 (Signal 리스트 또는 SignalBatch)
+        constraints: ``max_weight`` / ``min_weight`` / ``max_positions``
+
+    Returns:
+        종목별 비중 (합계 ≤ 1)
+    """
+    batch = signals if isinstance(signals, SignalBatch) else SignalBatch.from_signals(signals)
+    batch = _last_long_per_ticker(batch)
+    weights = allocate(batch.score, batch.weight, constraints)
+    held = np.flatnonzero(weights > 0.0)
+    return {batch.tickers[i]: float(w) for i, w in zip(batch.index[held].tolist(), weights[held])}
+
+
+def allocate(
+    score: np.ndarray,
+    weight: Optional[np.ndarray] = None,
+    constraints: Optional[Dict] = None,
+) -> np.ndarray:
+    """
+    배열 기반 비중 계산 (종목 중복 없는 LONG 시그널).
+
+    Args:
+        score: 시그널 강도
+        weight: 명시적 비중 (NaN이면 score 기반), None이면 전부 score 기반
+        constraints: ``max_weight`` / ``min_weight`` / ``max_positions``
+
+    Returns:
+        입력과 같은 순서의 비중 배열 (편입되지 않은 종목은 0)
+    """
+    constraints = constraints or {}
+    cap = float(constraints.get("max_weight", 1.0))
+    floor = float(constraints.get("min_weight", 0.0))
+    max_positions = constraints.get("max_positions")
+
+    score = np.asarray(score, dtype=np.float64)
+    n = len(score)
+    out = np.zeros(n)
+    if n == 0:
+        return out
+    weight = np.full(n, np.nan) if weight is None else np.asarray(weight, dtype=np.float64)
+
+    # score 내림차순 상위 N개 (동점은 입력 순서)
+    ranked = np.argsort(-score, kind="stable")
+    if max_positions is not None:
+        ranked = ranked[: int(max_positions)]
+
+    raw = _raw_weights(score[ranked], weight[ranked])
+    if raw is None:
+        return out
+
+    # raw 비중 내림차순으로 정렬하면 한도/하한 처리 후에도 순서가 유지된다
+    order = np.argsort(-raw, kind="stable")
+    result = _capped_prefix(raw[order], cap, floor)
+    out[ranked[order]] = result
+    return out
+
+
+def _last_long_per_ticker(batch: SignalBatch) -> SignalBatch:
+    """LONG 시그널만, 종목당 마지막 시그널 (첫 등장 순서 유지)"""
+    batch = batch.select(batch.direction == _LONG)
+    index = batch.index
+    if len(np.unique(index)) == len(index):
+        return batch
+    # 역순 첫 등장 = 마지막 시그널
+    _, first = np.unique(index, return_index=True)
+    _, last_rev = np.unique(index[::-1], return_index=True)
+    last = len(index) - 1 - last_rev
+    keep = last[np.argsort(first, kind="stable")]
+    return batch.select(keep)
+
+
+def _raw_weights(score: np.ndarray, weight: np.ndarray) -> Optional[np.ndarray]:
+    """명시적 비중 + score 비례 비중 (합계 1). 배분할 비중이 없으면 None"""
+    explicit = ~np.isnan(weight)
+    fixed = float(weight[explicit].sum())
+    rest = ~explicit
+    if fixed >= 1.0 or not rest.any():
+        if fixed <= 0.0:
+            return None
+        return np.where(explicit, weight, 0.0) / fixed
+
+    positive = np.where(rest, np.maximum(score, 0.0), 0.0)
+    total = positive.sum()
+    if total <= 0.0:
+        positive, total = rest.astype(np.float64), float(rest.sum())
+    return np.where(explicit, weight, (1.0 - fixed) * positive / total)
+
+
+def _capped_prefix(w: np.ndarray, cap: float, floor: float) -> np.ndarray:
+    """
+    내림차순 raw 비중 ``w``에 대해, 상위 k개를 합계 1(또는 k·cap)로 재배분한
+    ``min(cap, λ_k·w_i)``가 모두 ``floor`` 이상인 최대 k를 찾아 그 배분을 반환.
+
+    상위 k개 중 한도에 걸리는 종목 수 j_k는
+    ``g_j = (1 - j·cap)·w_j + cap·P_j <= cap·P_k``를 만족하는 최소 j
+    (P는 누적합)이므로, g의 누적 최솟값에 대한 searchsorted로 모든 k에 대해
+    한 번에 구한다.
+    """
+    result = np.zeros(len(w))
+    n = int(np.count_nonzero(w > 0.0))  # raw 비중 0인 종목은 편입하지 않음
+    w = w[:n]
+    prefix = np.concatenate(([0.0], np.cumsum(w)))  # P_0..P_n
+    j = np.arange(n)
+    g = (1.0 - j * cap) * w + cap * prefix[:-1]
+    g_min = np.minimum.accumulate(g)
+
+    k = np.arange(1, n + 1)
+    all_capped = k * cap <= 1.0 + _EPS
+    capped = np.searchsorted(-g_min, -cap * prefix[1:] - _EPS, side="left")
+    capped = np.minimum(capped, k - 1)
+    denom = prefix[1:] - prefix[capped]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lam = np.where(denom > 0.0, (1.0 - capped * cap) / denom, 0.0)
+    smallest = np.where(all_capped, cap, np.minimum(cap, lam * w))
+
+    feasible = np.flatnonzero(smallest >= floor - _EPS)
+    if len(feasible) == 0:
+        return result
+    size = int(feasible[-1]) + 1
+    if all_capped[size - 1]:
+        result[:size] = cap
+    else:
+        result[:size] = np.minimum(cap, lam[size - 1] * w[:size])
+    return result
@@ -0,0 +1,256 @@
+"""
+Backtester — BaseStrategy를 서버 없이 로컬에서 실행하는 벡터화 백테스트 엔진
+
+사용 예시::
+
+    from qbique_strategy import Backtester
+
+    bt = Backtester(MomentumStrategy({"period": 20}), prices, rebalance="M")
+    result = bt.run(start="2020-01-01")
+    result.equity.plot()
+    print(result.stats())
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .allocation import signals_to_weights
+from .base import BaseStrategy
+from .data import MarketData
+from .signal import SignalBatch
+
+if TYPE_CHECKING:
+    from .profiler import StrategyProfiler
+
+RebalanceSpec = Union[str, Sequence]
+
+_FREQUENCIES = {"D": "D", "W": "W", "M": "M", "Q": "Q", "Y": "Y"}
+
+
+@dataclass
+class BacktestResult:
+    """
+    백테스트 결과.
+
+    Attributes:
+        equity: 일별 포트폴리오 가치 (index=dates)
+        weights: 리밸런싱 시점별 목표 비중 (index=rebalance dates, columns=tickers)
+        turnover: 리밸런싱 시점별 회전율 (매수+매도 비중 합)
+        costs: 리밸런싱 시점별 거래비용 (금액)
+    """
+    equity: pd.Series
+    weights: pd.DataFrame
+    turnover: pd.Series
+    costs: pd.Series
+
+    @property
+    def returns(self) -> pd.Series:
+        """일일 포트폴리오 수익률"""
+        return self.equity.pct_change().dropna()
+
+    def stats(self, periods_per_year: int = 252) -> Dict[str, float]:
+        """총수익률 / CAGR / 연율화 변동성 / 샤프 / 최대 낙폭"""
+        values = self.equity.to_numpy(dtype=float)
+        rets = np.diff(values) / values[:-1] if len(values) > 1 else np.empty(0)
+        years = len(rets) / periods_per_year
+        total = values[-1] / values[0] - 1.0
+        vol = float(rets.std(ddof=1) * np.sqrt(periods_per_year)) if len(rets) > 1 else 0.0
+        mean = float(rets.mean() * periods_per_year) if len(rets) else 0.0
+        drawdown = values / np.maximum.accumulate(values) - 1.0
+        return {
+            "total_return": float(total),
+            "cagr": float((1.0 + total) ** (1.0 / years) - 1.0) if years > 0 else 0.0,
+            "volatility": vol,
+            "sharpe": mean / vol if vol > 0 else 0.0,
+            "max_drawdown": float(drawdown.min()),
+            "avg_turnover": float(self.turnover.mean()) if len(self.turnover) else 0.0,
+        }
+
+
+class Backtester:
+    """
+    리밸런싱 날짜를 순회하며 전략을 로컬에서 실행한다.
+
+    각 리밸런싱 날짜 t에서:
+        1. t 종가까지의 MarketData view를 전략에 전달 (미래 데이터 없음,
+           전체 가격 버퍼를 공유하므로 복사 없음)
+        2. Signal 리스트를 ``risk_constraints()``를 지키는 비중으로 변환
+           (t 시점 가격이 없는 종목은 제외)
+        3. t 종가에 리밸런싱, 거래비용 차감 후 ``on_rebalance_complete()`` 호출
+        4. 다음 리밸런싱까지 보유 (비중은 가격에 따라 drift), 가치 평가는
+           구간별 NumPy 행렬 연산 한 번으로 처리
+
+    Args:
+        strategy: 실행할 전략
+        prices: 종가 DataFrame (index=DatetimeIndex, columns=tickers)
+        rebalance: 리밸런싱 주기 ("D" / "W" / "M" / "Q" / "Y", 각 기간의
+            마지막 거래일) 또는 날짜 리스트 (해당일 이전 마지막 거래일)
+        initial_capital: 초기 자본
+        transaction_cost: 회전율 대비 거래비용 비율 (예: 0.001 = 10bp)
+        lookback: 전략에 전달할 최대 과거 거래일 수 (None이면 전체)
+        profiler: 지정 시 ``run()`` 동안 전략 훅과 MarketData 호출을 기록
+            (:class:`~qbique_strategy.profiler.StrategyProfiler`)
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        prices: pd.DataFrame,
+        rebalance: RebalanceSpec = "M",
+        initial_capital: float = 1.0,
+        transaction_cost: float = 0.0,
+        lookback: Optional[int] = None,
+        profiler: Optional["StrategyProfiler"] = None,
+    ) -> None:
+        if prices.empty:
+            raise ValueError("prices DataFrame must not be empty")
+        if not isinstance(prices.index, pd.DatetimeIndex):
+            raise TypeError("prices index must be a DatetimeIndex")
+        self.strategy = strategy
+        self.prices = prices if prices.index.is_monotonic_increasing else prices.sort_index()
+        self.rebalance = rebalance
+        self.initial_capital = float(initial_capital)
+        self.transaction_cost = float(transaction_cost)
+        self.lookback = lookback
+        self.profiler = profiler
+
+    def rebalance_positions(
+        self, start: Optional[Union[str, date]] = None, end: Optional[Union[str, date]] = None
+    ) -> np.ndarray:
+        """리밸런싱 날짜의 행 위치 (오름차순, 중복 없음)"""
+        index = self.prices.index
+        if isinstance(self.rebalance, str):
+            freq = _FREQUENCIES.get(self.rebalance.upper())
+            if freq is None:
+                raise ValueError(
+                    f"Unknown rebalance frequency {self.rebalance!r}; expected one of {list(_FREQUENCIES)}"
+                )
+            periods = index.to_period(freq).asi8
+            last_of_period = np.flatnonzero(np.append(periods[1:] != periods[:-1], True))
+            positions = last_of_period
+        else:
+            when = pd.DatetimeIndex(pd.to_datetime(list(self.rebalance)))
+            positions = index.searchsorted(when, side="right") - 1
+            positions = np.unique(positions[positions >= 0])
+
+        lo = index.searchsorted(pd.Timestamp(start)) if start is not None else 0
+        hi = index.searchsorted(pd.Timestamp(end), side="right") if end is not None else len(index)
+        return positions[(positions >= lo) & (positions < hi)]
+
+    def run(
+        self,
+        start: Optional[Union[str, date]] = None,
+        end: Optional[Union[str, date]] = None,
+    ) -> BacktestResult:
+        """
+        백테스트 실행.
+
+        Args:
+            start: 첫 리밸런싱 가능일 (None이면 데이터 시작일)
+            end: 평가 종료일 (None이면 데이터 종료일)
+
+        Returns:
+            BacktestResult
+        """
+        if self.profiler is not None:
+            with self.profiler.instrument():
+                return self._run(self.profiler.wrap(self.strategy), start, end)
+        return self._run(self.strategy, start, end)
+
+    def _run(self, strategy: BaseStrategy, start, end) -> BacktestResult:
+        prices = self.prices
+        if end is not None:
+            prices = prices.loc[: pd.Timestamp(end)]
+        tickers = list(prices.columns)
+        master = MarketData(prices)  # 리밸런싱마다 이 버퍼를 공유하는 view 생성
+        raw = master.values
+        # 결측 가격은 직전 가격으로 평가 (결측이 없으면 복사 없이 그대로 사용)
+        valued = prices.ffill().to_numpy(dtype=float) if np.isnan(raw).any() else raw
+        positions = self.rebalance_positions(start, end)
+        if len(positions) == 0:
+            raise ValueError("No rebalance dates in the requested range")
+
+        constraints = strategy.risk_constraints()
+        column = {t: j for j, t in enumerate(tickers)}
+        n_dates = len(prices)
+        first = int(positions[0])
+
+        equity = np.full(n_dates, np.nan)
+        equity[first] = self.initial_capital
+        held = np.zeros(len(tickers))  # 현재 보유 비중 (drift 반영)
+        targets: List[np.ndarray] = []
+        turnovers: List[float] = []
+        costs: List[float] = []
+
+        bounds = np.append(positions, n_dates - 1)
+        for k, pos in enumerate(positions):
+            pos = int(pos)
+            value = float(equity[pos])
+            rebalance_date = prices.index[pos].date()
+
+            lo = 0 if self.lookback is None else max(0, pos + 1 - self.lookback)
+            market_data = MarketData._view(master, lo, pos + 1)
+            signals = strategy.generate_signals(market_data, rebalance_date)
+            if isinstance(signals, SignalBatch):
+                cols = _batch_columns(signals, tickers, column)
+                tradable = signals.select(~np.isnan(raw[pos, cols]))
+            else:
+                unknown = {s.ticker for s in signals} - column.keys()
+                if unknown:
+                    raise KeyError(f"Signals for unknown tickers: {sorted(unknown)}")
+                tradable = [s for s in signals if not np.isnan(raw[pos, column[s.ticker]])]
+            weights = signals_to_weights(tradable, constraints)
+
+            target = np.zeros(len(tickers))
+            for t, w in weights.items():
+                target[column[t]] = w
+            turnover = float(np.abs(target - held).sum())
+            cost = value * turnover * self.transaction_cost
+            value -= cost
+            equity[pos] = value
+
+            targets.append(target)
+            turnovers.append(turnover)
+            costs.append(cost)
+            strategy.on_rebalance_complete(rebalance_date, weights, value)
+
+            # 다음 리밸런싱까지 buy-and-hold 평가 (구간 전체를 한 번의 행렬 연산으로)
+            stop = int(bounds[k + 1])
+            if stop > pos:
+                base = valued[pos]
+                invested = target > 0
+                rel = valued[pos + 1 : stop + 1][:, invested] / base[invested]
+                cash = 1.0 - target.sum()
+                growth = rel @ target[invested] + cash
+                equity[pos + 1 : stop + 1] = value * growth
+                held = np.zeros(len(tickers))
+                if growth[-1] > 0:
+                    held[invested] = target[invested] * rel[-1] / growth[-1]
+            else:
+                held = target
+
+        index = prices.index
+        rebalance_index = index[positions]
+        return BacktestResult(
+            equity=pd.Series(equity[first:], index=index[first:], name="equity"),
+            weights=pd.DataFrame(np.vstack(targets), index=rebalance_index, columns=tickers),
+            turnover=pd.Series(turnovers, index=rebalance_index, name="turnover"),
+            costs=pd.Series(costs, index=rebalance_index, name="costs"),
+        )
+
+
+def _batch_columns(batch: SignalBatch, tickers: List[str], column: Dict[str, int]) -> np.ndarray:
+    """SignalBatch의 시그널별 가격 행렬 열 위치"""
+    if batch.tickers is tickers or list(batch.tickers) == tickers:
+        return batch.index
+    lookup = np.array([column.get(t, -1) for t in batch.tickers], dtype=np.int64)
+    cols = lookup[batch.index]
+    if (cols < 0).any():
+        unknown = {batch.tickers[i] for i in batch.index[cols < 0].tolist()}
+        raise KeyError(f"Signals for unknown tickers: {sorted(unknown)}")
+    return cols
@@ -5,10 +5,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from .data import MarketData
-from .signal import Signal
+from .signal import Signal, SignalBatch
 
 
 class BaseStrategy(ABC):
@@ -35,16 +35,19 @@ class BaseStrategy(ABC):
     @abstractmethod
     def generate_signals(
         self, market_data: MarketData, rebalance_date: date
-    ) -> List[Signal]:
+    ) -> Union[List[Signal], SignalBatch]:
         """
         시장 데이터를 기반으로 투자 시그널을 생성한다.
 
+        종목 수가 많으면 ``List[Signal]`` 대신 ``SignalBatch``를 반환해
+        시그널 객체 생성 비용을 줄일 수 있다.
+
         Args:
             market_data: 리밸런싱 시점까지의 시장 데이터
             rebalance_date: 리밸런싱 날짜
 
         Returns:
-            종목별 시그널 리스트
+            종목별 시그널 리스트 또는 SignalBatch
         """
         ...
 
@@ -3,18 +3,31 @@ MarketData — 전략에 전달되는 시장 데이터 래퍼
 """
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import date
-from typing import List
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from .indicators import RollingIndicators, window_length
+
 
 class MarketData:
     """
     전략에 전달되는 시장 데이터.
 
     Backtester가 리밸런싱 시점마다 생성하여 strategy.generate_signals()에 전달.
+    전체 기간의 MarketData 하나를 만든 뒤 ``as_of()`` / ``window()``로
+    같은 버퍼를 공유하는 view를 얻을 수 있다.
+
+    수익률 / 로그 수익률 / 종목별 정제 시계열 등 파생 데이터는 최초 요청 시
+    한 번 계산해 ``cache_bytes`` 한도의 LRU 캐시에 보관한다 (``clear_cache()``).
+    캐시된 객체는 공유되므로 읽기 전용 배열 위에 만들어진다 (수정 시 ``ValueError``).
+
+    view에서의 ``calculate_*`` / ``*_all`` 호출은 원본이 가진
+    :class:`~qbique_strategy.indicators.RollingIndicators` 테이블을 행
+    인덱싱으로 조회한다. 윈도우 안에 결측이 있는 종목만 직접 계산한다.
 
     Attributes:
         prices: 종가 DataFrame (index=dates, columns=tickers)
@@ -23,21 +36,172 @@ class MarketData:
         end_date: 데이터 종료일
     """
 
-    def __init__(self, prices: pd.DataFrame) -> None:
+    DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, prices: pd.DataFrame, cache_bytes: int = DEFAULT_CACHE_BYTES) -> None:
         if prices.empty:
             raise ValueError("prices DataFrame must not be empty")
 
-        self.prices: pd.DataFrame = prices
+        self._prices: Optional[pd.DataFrame] = prices
+        self._values: np.ndarray = prices.to_numpy(dtype=np.float64)
+        self._index: pd.Index = prices.index
         self.tickers: List[str] = list(prices.columns)
+        self._set_dates()
+        self._init_cache(cache_bytes)
+        self._root: MarketData = self
+        self._offset = 0
+        self._engine: Optional[RollingIndicators] = None
+        self._columns: Optional[Dict[str, int]] = None
 
-        idx = prices.index
+    @classmethod
+    def _view(cls, parent: "MarketData", lo: int, hi: int) -> "MarketData":
+        """parent의 [lo, hi) 행 구간을 공유하는 view (복사 없음)"""
+        if hi <= lo:
+            raise ValueError("prices DataFrame must not be empty")
+        view = cls.__new__(cls)
+        view._prices = None
+        view._values = parent._values[lo:hi]
+        view._values.flags.writeable = False
+        view._index = parent._index[lo:hi]
+        view.tickers = list(parent.tickers)
+        view._set_dates()
+        view._init_cache(parent.cache_bytes)
+        view._root = parent._root
+        view._offset = parent._offset + lo
+        view._engine = None
+        view._columns = None
+        return view
+
+    def _set_dates(self) -> None:
+        idx = self._index
         self.start_date: date = idx[0].date() if hasattr(idx[0], "date") else idx[0]
         self.end_date: date = idx[-1].date() if hasattr(idx[-1], "date") else idx[-1]
 
+    @property
+    def prices(self) -> pd.DataFrame:
+        """종가 DataFrame. view에서는 최초 접근 시 공유 버퍼 위에 생성 (복사 없음)"""
+        if self._prices is None:
+            self._prices = pd.DataFrame(self._values, index=self._index, columns=self.tickers, copy=False)
+        return self._prices
+
+    @property
+    def values(self) -> np.ndarray:
+        """종가 행렬 (dates x tickers, float64). view에서는 읽기 전용"""
+        return self._values
+
+    def as_of(self, when, lookback: Optional[int] = None) -> "MarketData":
+        """
+        ``when`` 이전(포함) 데이터만 담은 view.
+
+        원본과 같은 NumPy 버퍼를 공유하므로 리밸런싱마다 O(1) 메모리로
+        생성된다.
+
+        Args:
+            when: 기준일 (date / str / Timestamp)
+            lookback: 최근 N 거래일로 제한 (None이면 처음부터)
+        """
+        hi = self._searchsorted(when, "right")
+        lo = 0 if lookback is None else max(0, hi - lookback)
+        return MarketData._view(self, lo, hi)
+
+    def window(self, start=None, end=None) -> "MarketData":
+        """``[start, end]`` 구간 (양 끝 포함) view. None이면 해당 방향 끝까지"""
+        lo = 0 if start is None else self._searchsorted(start, "left")
+        hi = len(self._index) if end is None else self._searchsorted(end, "right")
+        return MarketData._view(self, lo, hi)
+
+    def _searchsorted(self, when, side: str) -> int:
+        if not self._index.is_monotonic_increasing:
+            raise ValueError("as_of / window require a sorted prices index")
+        if isinstance(self._index, pd.DatetimeIndex):
+            when = pd.Timestamp(when)
+        return int(self._index.searchsorted(when, side=side))
+
+    # ── 롤링 지표 엔진 ──
+
+    @property
+    def indicators(self) -> RollingIndicators:
+        """전체 이력 롤링 지표 엔진 (원본과 모든 view가 공유)"""
+        root = self._root
+        if root._engine is None:
+            root._engine = RollingIndicators(root._values)
+        return root._engine
+
+    def _uses_engine(self) -> bool:
+        # 원본 자체는 직접 계산 (한 번 조회에 전체 테이블을 만드는 건 손해),
+        # view이거나 엔진을 이미 만든 경우에만 테이블 조회
+        return self._root is not self or self._engine is not None
+
+    def _engine_value(self, kind: str, period: int, ticker: str) -> Optional[float]:
+        """엔진 조회 값. 엔진 미사용이거나 윈도우에 결측이 있으면 None"""
+        if not self._uses_engine():
+            return None
+        root = self._root
+        if root._columns is None:
+            root._columns = {t: j for j, t in enumerate(root.tickers)}
+        row = self._offset + len(self._index) - 1
+        value = self.indicators.lookup(kind, period, row, self._offset, column=root._columns[ticker])
+        return None if np.isnan(value) else value
+
+    # ── 파생 데이터 캐시 ──
+
+    def _init_cache(self, cache_bytes: int) -> None:
+        self.cache_bytes = cache_bytes
+        self._cache: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._cache_used = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """``key``의 값을 캐시에서 반환하거나 계산 후 저장 (LRU, 바이트 한도)"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return entry[0]
+        self._cache_misses += 1
+        value = _read_only(compute())
+        size = _nbytes(value)
+        if size > self.cache_bytes:
+            return value
+        self._cache[key] = (value, size)
+        self._cache_used += size
+        while self._cache_used > self.cache_bytes:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self._cache_used -= evicted
+        return value
+
+    def clear_cache(self) -> None:
+        """파생 데이터 캐시 비우기"""
+        self._cache.clear()
+        self._cache_used = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """캐시 통계: hits / misses / entries / bytes"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "entries": len(self._cache),
+            "bytes": self._cache_used,
+        }
+
     @property
     def returns(self) -> pd.DataFrame:
         """일일 단순 수익률"""
-        return self.prices.pct_change().dropna()
+        return self._memo("returns", lambda: self.prices.pct_change().dropna())
+
+    @property
+    def log_returns(self) -> pd.DataFrame:
+        """일일 로그 수익률"""
+        return self._memo("log_returns", lambda: np.log(self.prices / self.prices.shift(1)).dropna())
+
+    def clean_prices(self, ticker: str) -> pd.Series:
+        """결측을 제거한 단일 종목 가격 시계열"""
+        return self._memo(("clean", ticker), lambda: self.prices[ticker].dropna())
+
+    def ticker_returns(self, ticker: str) -> pd.Series:
+        """단일 종목 일일 수익률 (연속된 유효 관측치 간 수익률, 결측 제외)"""
+        return self._memo(("returns", ticker), lambda: self.clean_prices(ticker).pct_change().dropna())
 
     @property
     def volumes(self) -> pd.DataFrame:
@@ -48,7 +212,7 @@ class MarketData:
         """단일 종목의 가격/수익률 DataFrame"""
         if ticker not in self.tickers:
             raise KeyError(f"Ticker '{ticker}' not found. Available: {self.tickers}")
-        price = self.prices[ticker].dropna()
+        price = self.clean_prices(ticker)
         ret = price.pct_change().dropna()
         return pd.DataFrame({"price": price, "return": ret})
 
@@ -63,7 +227,10 @@ class MarketData:
         Returns:
             기간 수익률
         """
-        prices = self.prices[ticker].dropna()
+        value = self._engine_value("momentum", period, ticker)
+        if value is not None:
+            return value
+        prices = self.clean_prices(ticker)
         if len(prices) < period + 1:
             return 0.0
         return float((prices.iloc[-1] / prices.iloc[-period - 1]) - 1.0)
@@ -79,7 +246,10 @@ class MarketData:
         Returns:
             연율화 변동성
         """
-        rets = self.prices[ticker].pct_change().dropna()
+        value = self._engine_value("volatility", period, ticker)
+        if value is not None:
+            return value
+        rets = self.ticker_returns(ticker)
         if len(rets) < period:
             return 0.0
         return float(rets.iloc[-period:].std() * np.sqrt(252))
@@ -95,7 +265,125 @@ class MarketData:
         Returns:
             평균 일일 수익률
         """
-        rets = self.prices[ticker].pct_change().dropna()
+        value = self._engine_value("mean_return", period, ticker)
+        if value is not None:
+            return value
+        rets = self.ticker_returns(ticker)
         if len(rets) < period:
             return 0.0
         return float(rets.iloc[-period:].mean())
+
+    # ── 전 종목 일괄 계산 (cross-sectional) ──
+    #
+    # 각 종목의 유효(결측 아닌) 관측치 기준으로 가격 행렬을 한 번에 처리하고
+    # tickers 순서의 Series를 반환한다. 이력이 부족한 종목은 0.0.
+
+    def momentum_all(self, period: int = 20) -> pd.Series:
+        """전 종목 단순 모멘텀 (calculate_momentum의 벡터화 버전)"""
+        return self._indicator_all("momentum", period)
+
+    def volatility_all(self, period: int = 20) -> pd.Series:
+        """전 종목 연율화 변동성 (calculate_volatility의 벡터화 버전)"""
+        return self._indicator_all("volatility", period)
+
+    def mean_return_all(self, period: int = 20) -> pd.Series:
+        """전 종목 평균 일일 수익률 (calculate_mean_return의 벡터화 버전)"""
+        return self._indicator_all("mean_return", period)
+
+    def moving_average_all(self, period: int = 20) -> pd.Series:
+        """전 종목 최근 ``period``개 가격의 단순 이동평균"""
+        return self._indicator_all("moving_average", period)
+
+    def ma_deviation_all(self, period: int = 20) -> pd.Series:
+        """전 종목 이동평균 대비 괴리도 ``(현재가 - MA) / MA``"""
+        return self._indicator_all("ma_deviation", period)
+
+    def _indicator_all(self, kind: str, period: int) -> pd.Series:
+        m = window_length(kind, period)
+        if not self._uses_engine():
+            return self._series(_from_tail(kind, self._tail(m)))
+        row = self._offset + len(self._index) - 1
+        values = self.indicators.lookup(kind, period, row, self._offset)
+        fallback = np.flatnonzero(np.isnan(values))
+        if len(fallback):
+            # 윈도우에 결측이 있는 종목만 유효 관측치 기준으로 직접 계산
+            values[fallback] = _from_tail(kind, self._compute_tail(m, fallback))
+        return self._series(values)
+
+    def _series(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(np.nan_to_num(values, nan=0.0), index=self.tickers, dtype=np.float64)
+
+    def _tail(self, m: int) -> np.ndarray:
+        return self._memo(("tail", m), lambda: self._compute_tail(m))
+
+    def _compute_tail(self, m: int, columns: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        종목별 마지막 ``m``개 유효 가격 (m x tickers, ``columns`` 지정 시 해당
+        종목만). 유효 관측치가 m개 미만인 종목의 열은 전부 NaN.
+        """
+        if m < 1:
+            raise ValueError(f"period must be positive, got {m}")
+        values = self._values if columns is None else self._values[:, columns]
+        n_rows, n_cols = values.shape
+        tail = np.full((m, n_cols), np.nan)
+        if n_rows < m:
+            return tail
+        recent = values[-m:]
+        gaps = np.isnan(recent).any(axis=0)
+        tail[:, ~gaps] = recent[:, ~gaps]
+        if not gaps.any():
+            return tail
+
+        # 최근 구간에 결측이 있는 종목만 전체 이력에서 마지막 m개 유효값을 모음
+        cols = np.flatnonzero(gaps)
+        sub = values[:, cols]
+        valid = ~np.isnan(sub)
+        from_end = np.cumsum(valid[::-1], axis=0)[::-1]  # 해당 행 이후 유효 관측치 수
+        enough = from_end[0] >= m
+        rows, k = np.nonzero(valid & (from_end <= m) & enough)
+        tail[m - from_end[rows, k], cols[k]] = sub[rows, k]
+        return tail
+
+
+def _read_only(value: Any) -> Any:
+    """캐시에 넣을 배열 / 단일 dtype DataFrame / Series를 읽기 전용 버퍼 기반으로 바꾼다"""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, pd.Series):
+        values = value.to_numpy(copy=True)
+        values.flags.writeable = False
+        value = pd.Series(values, index=value.index, name=value.name, copy=False)
+    elif isinstance(value, pd.DataFrame) and value.dtypes.nunique() == 1:
+        values = value.to_numpy(copy=True)
+        values.flags.writeable = False
+        value = pd.DataFrame(values, index=value.index, columns=value.columns, copy=False)
+    return value
+
+
+def _nbytes(value: Any) -> int:
+    """캐시 항목의 대략적인 메모리 크기"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    return 64
+
+
+def _from_tail(kind: str, tail: np.ndarray) -> np.ndarray:
+    """마지막 유효 가격 행렬(_tail)로 지표 계산"""
+    if kind == "momentum":
+        return tail[-1] / tail[0] - 1.0
+    if kind in ("volatility", "mean_return"):
+        rets = tail[1:] / tail[:-1] - 1.0
+        return _nanless_std(rets) * np.sqrt(252) if kind == "volatility" else rets.mean(axis=0)
+    ma = tail.mean(axis=0)
+    return ma if kind == "moving_average" else (tail[-1] - ma) / ma
+
+
+def _nanless_std(x: np.ndarray) -> np.ndarray:
+    """열별 표본표준편차 (ddof=1). NaN 열은 NaN 유지"""
+    if x.shape[0] < 2:
+        return np.full(x.shape[1], np.nan)
+    return x.std(axis=0, ddof=1)
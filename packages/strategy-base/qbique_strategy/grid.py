@@ -0,0 +1,170 @@
+"""
+run_grid — 로컬 전략 파라미터 그리드를 모든 코어에서 병렬 백테스트
+
+사용 예시::
+
+    from qbique_strategy.grid import run_grid
+
+    table = run_grid(
+        MomentumStrategy,
+        prices,
+        {"period": [10, 20, 60], "max_weight": [0.1, 0.2]},
+        metric="sharpe",
+        rebalance="M",
+    )
+
+가격 행렬은 ``multiprocessing.shared_memory``에 한 번만 복사한다. 각 워커
+프로세스는 시작 시 한 번 공유 메모리에 붙어 그 버퍼 위에 DataFrame을 만들고
+(복사 없음), 작업마다 전달되는 것은 전략 클래스 참조와 파라미터 dict뿐이다.
+전략 클래스는 pickle 가능해야 한다 (모듈 최상위에 정의).
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from .backtest import Backtester
+from .base import BaseStrategy
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """파라미터 그리드의 데카르트 곱 (키 순서 유지)"""
+    keys = list(grid)
+    for key in keys:
+        if isinstance(grid[key], (str, bytes)) or not isinstance(grid[key], Iterable):
+            raise TypeError(f"grid values must be sequences, got {type(grid[key]).__name__} for {key!r}")
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+class SharedPrices:
+    """
+    가격 DataFrame을 공유 메모리 블록 하나에 올린다.
+
+    ``spec``(이름 / shape / index / columns)만 다른 프로세스에 넘기면
+    :func:`attach_prices`로 같은 버퍼 위의 DataFrame을 얻는다.
+    with 블록을 벗어나면 블록을 해제한다.
+    """
+
+    def __init__(self, prices: pd.DataFrame) -> None:
+        values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        buffer = np.ndarray(values.shape, dtype=np.float64, buffer=self._shm.buf)
+        buffer[:] = values
+        self.spec: Dict[str, Any] = {
+            "name": self._shm.name,
+            "shape": values.shape,
+            "index": prices.index.to_numpy(),
+            "columns": list(prices.columns),
+        }
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedPrices":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def attach_prices(spec: Dict[str, Any]) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+    """
+    공유 메모리의 가격 행렬에 붙어 DataFrame을 만든다 (복사 없음, 읽기 전용).
+
+    반환된 SharedMemory 객체는 DataFrame을 쓰는 동안 살아 있어야 한다.
+    """
+    # 워커는 생성 프로세스의 resource tracker를 공유하므로 (POSIX) 여기서 추적을
+    # 해제하면 생성 측의 unlink 기록과 어긋난다. 3.13+에서는 아예 등록하지 않는다.
+    kwargs = {"track": False} if sys.version_info >= (3, 13) else {}
+    shm = shared_memory.SharedMemory(name=spec["name"], **kwargs)
+    values = np.ndarray(spec["shape"], dtype=np.float64, buffer=shm.buf)
+    values.flags.writeable = False
+    frame = pd.DataFrame(values, index=pd.Index(spec["index"]), columns=spec["columns"], copy=False)
+    return frame, shm
+
+
+# ── 워커 프로세스 상태 (initializer에서 한 번 설정) ──
+
+_worker_prices: Optional[pd.DataFrame] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(spec: Dict[str, Any]) -> None:
+    global _worker_prices, _worker_shm
+    _worker_prices, _worker_shm = attach_prices(spec)
+
+
+def _run_one(
+    strategy_cls: Type[BaseStrategy],
+    params: Dict[str, Any],
+    backtest_kwargs: Dict[str, Any],
+    run_kwargs: Dict[str, Any],
+    prices: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
+    prices = _worker_prices if prices is None else prices
+    try:
+        result = Backtester(strategy_cls(dict(params)), prices, **backtest_kwargs).run(**run_kwargs)
+        return {**result.stats(), "error": None}
+    except Exception as e:  # 조합 하나의 실패가 그리드 전체를 멈추지 않도록 기록
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def run_grid(
+    strategy_cls: Type[BaseStrategy],
+    prices: pd.DataFrame,
+    grid: Mapping[str, Sequence[Any]],
+    *,
+    metric: str = "sharpe",
+    ascending: bool = False,
+    processes: Optional[int] = None,
+    base_params: Optional[Dict[str, Any]] = None,
+    start=None,
+    end=None,
+    **backtest_kwargs,
+) -> pd.DataFrame:
+    """
+    파라미터 그리드 전체를 로컬 백테스트하고 ``metric`` 기준으로 정렬한 표를 반환한다.
+
+    Args:
+        strategy_cls: BaseStrategy 하위 클래스 (``strategy_cls(params)``로 생성)
+        prices: 종가 DataFrame (index=DatetimeIndex, columns=tickers)
+        grid: 파라미터 이름 → 후보 값 리스트
+        metric: 정렬 기준 (``BacktestResult.stats()`` 키, 예: sharpe / cagr / max_drawdown)
+        ascending: True면 오름차순 (예: volatility)
+        processes: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        base_params: 모든 조합에 공통으로 들어가는 파라미터
+        start, end: ``Backtester.run()`` 구간
+        **backtest_kwargs: ``Backtester`` 인자 (rebalance, transaction_cost, lookback 등)
+
+    Returns:
+        조합별 파라미터 + 성과 지표 + ``error`` 컬럼 DataFrame (실패 조합은 맨 뒤)
+    """
+    combos = [{**(base_params or {}), **combo} for combo in expand_grid(grid)]
+    run_kwargs = {"start": start, "end": end}
+    workers = min(processes or os.cpu_count() or 1, len(combos)) or 1
+
+    if workers == 1:
+        rows = [_run_one(strategy_cls, c, backtest_kwargs, run_kwargs, prices) for c in combos]
+    else:
+        with SharedPrices(prices) as shared:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(shared.spec,)) as pool:
+                futures = [
+                    pool.submit(_run_one, strategy_cls, c, backtest_kwargs, run_kwargs) for c in combos
+                ]
+                rows = [f.result() for f in futures]
+
+    succeeded = [r for r in rows if r["error"] is None]
+    if succeeded and metric not in succeeded[0]:
+        raise KeyError(f"Unknown metric {metric!r}; available: {sorted(set(succeeded[0]) - {'error'})}")
+    table = pd.DataFrame([{**c, **r} for c, r in zip(combos, rows)])
+    if metric in table.columns:
+        table = table.sort_values(metric, ascending=ascending, na_position="last", kind="stable")
+    return table.reset_index(drop=True)
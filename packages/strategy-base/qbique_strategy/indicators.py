@@ -0,0 +1,133 @@
+"""
+RollingIndicators — 전체 이력에 대해 한 번에 계산하는 롤링 지표 엔진
+
+모멘텀 / 변동성 / 평균 수익률 / 이동평균 / 이동평균 괴리도를 지표·기간별로
+전체 가격 행렬(dates x tickers)에 대해 한 번만 계산해 두고, 리밸런싱 시점의
+값은 행 인덱싱으로 조회한다 (O(tickers)).
+
+MarketData의 ``as_of()`` / ``window()`` view는 원본의 엔진을 공유하므로
+Backtester 안에서 ``calculate_*`` / ``*_all`` 호출이 자동으로 이 경로를 탄다.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+KINDS = ("momentum", "volatility", "mean_return", "moving_average", "ma_deviation")
+
+
+def window_length(kind: str, period: int) -> int:
+    """지표 한 값을 계산하는 데 필요한 가격 관측치 수"""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown indicator {kind!r}; expected one of {KINDS}")
+    if period < 1:
+        raise ValueError(f"period must be positive, got {period}")
+    return period + 1 if kind in ("momentum", "volatility", "mean_return") else period
+
+
+class RollingIndicators:
+    """
+    가격 행렬 전체에 대한 롤링 지표 테이블.
+
+    값은 행 기준 윈도우로 계산된다. ``lookup()``은 윈도우 안에 결측이 있거나
+    윈도우가 조회 구간 ``[lo, row]``를 벗어나는 종목에 NaN을 반환하므로,
+    호출 측은 해당 종목만 유효 관측치 기준 직접 계산으로 대체하면 된다.
+
+    Args:
+        values: 종가 행렬 (dates x tickers, float64)
+        max_tables: 메모리에 유지할 (지표, 기간) 테이블 수 (LRU)
+    """
+
+    def __init__(self, values: np.ndarray, max_tables: int = 16) -> None:
+        self.values = values
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._nan_cum: Optional[np.ndarray] = None
+        self._returns: Optional[np.ndarray] = None
+
+    def precompute(self, specs: Iterable[Tuple[str, int]]) -> None:
+        """``[("momentum", 20), ("volatility", 60), ...]`` 테이블을 미리 계산"""
+        for kind, period in specs:
+            self.table(kind, period)
+
+    def table(self, kind: str, period: int) -> np.ndarray:
+        """(지표, 기간)의 전체 이력 테이블 (dates x tickers). 윈도우가 부족한 행은 NaN"""
+        window_length(kind, period)
+        key = (kind, period)
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            return table
+        table = self._compute(kind, period)
+        table.flags.writeable = False
+        self._tables[key] = table
+        while len(self._tables) > self.max_tables:
+            self._tables.popitem(last=False)
+        return table
+
+    def lookup(
+        self, kind: str, period: int, row: int, lo: int = 0, column: Optional[int] = None
+    ):
+        """
+        ``row`` 시점의 지표 값.
+
+        Args:
+            kind: 지표 이름 (KINDS)
+            period: 기간 (거래일 수)
+            row: 조회 행 (원본 행렬 기준)
+            lo: 조회 구간의 첫 행. 윈도우가 이보다 앞으로 나가면 NaN
+            column: 지정 시 해당 종목의 float, 아니면 전 종목 배열
+
+        Returns:
+            값. 윈도우에 결측이 있거나 구간을 벗어나면 NaN
+        """
+        need = window_length(kind, period)
+        start = row + 1 - need
+        if start < lo:
+            return np.nan if column is not None else np.full(self.values.shape[1], np.nan)
+        table = self.table(kind, period)
+        nan_cum = self._nan_counts()
+        if column is not None:
+            if nan_cum[row + 1, column] != nan_cum[start, column]:
+                return np.nan
+            return float(table[row, column])
+        out = table[row].copy()
+        out[nan_cum[row + 1] != nan_cum[start]] = np.nan
+        return out
+
+    # ── 내부 계산 ──
+
+    def _nan_counts(self) -> np.ndarray:
+        """행 누적 결측 수 (rows+1 x tickers) — 윈도우 내 결측 여부를 O(1)로 판정"""
+        if self._nan_cum is None:
+            nan_cum = np.zeros((self.values.shape[0] + 1, self.values.shape[1]), dtype=np.int32)
+            np.cumsum(np.isnan(self.values), axis=0, out=nan_cum[1:])
+            self._nan_cum = nan_cum
+        return self._nan_cum
+
+    def _daily_returns(self) -> np.ndarray:
+        if self._returns is None:
+            rets = np.full(self.values.shape, np.nan)
+            rets[1:] = self.values[1:] / self.values[:-1] - 1.0
+            self._returns = rets
+        return self._returns
+
+    def _compute(self, kind: str, period: int) -> np.ndarray:
+        values = self.values
+        if kind == "momentum":
+            out = np.full(values.shape, np.nan)
+            if period < len(values):
+                out[period:] = values[period:] / values[:-period] - 1.0
+            return out
+        if kind == "volatility":
+            rolling = pd.DataFrame(self._daily_returns()).rolling(period)
+            return rolling.std(ddof=1).to_numpy() * np.sqrt(252)
+        if kind == "mean_return":
+            return pd.DataFrame(self._daily_returns()).rolling(period).mean().to_numpy()
+        if kind == "moving_average":
+            return pd.DataFrame(values).rolling(period).mean().to_numpy()
+        ma = self.table("moving_average", period)
+        return (values - ma) / ma
@@ -0,0 +1,316 @@
+"""
+StrategyProfiler — 백테스트 전체 구간에서 전략 훅과 MarketData 호출을 프로파일링
+
+사용 예시::
+
+    from qbique_strategy import Backtester
+    from qbique_strategy.profiler import StrategyProfiler
+
+    profiler = StrategyProfiler()
+    Backtester(MomentumStrategy(), prices, profiler=profiler).run()
+    print(profiler.report())
+    profiler.to_json("profile.json")
+    profiler.to_collapsed("profile.folded")  # flamegraph.pl / speedscope 입력
+
+리밸런싱 날짜마다 ``generate_signals()`` / ``on_rebalance_complete()``의
+wall 시간 / CPU 시간 / 최대 할당량(tracemalloc)을 기록하고, 프로파일링 중에는
+MarketData 공개 메서드를 계측해 호출 횟수와 누적(inclusive) / 자기(self)
+시간을 모은다. 호출 스택(전략 → 훅 → MarketData 메서드 중첩)별 자기 시간은
+collapsed-stack 형식으로 내보낼 수 있다.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .base import BaseStrategy
+from .data import MarketData
+
+# 계측 대상 MarketData 메서드 / 프로퍼티
+PROFILED_METHODS = (
+    "as_of", "window", "clean_prices", "ticker_returns", "get_ticker_data",
+    "calculate_momentum", "calculate_volatility", "calculate_mean_return",
+    "momentum_all", "volatility_all", "mean_return_all",
+    "moving_average_all", "ma_deviation_all",
+)
+PROFILED_PROPERTIES = ("returns", "log_returns", "volumes")
+
+_active: Optional["StrategyProfiler"] = None  # MarketData를 계측 중인 프로파일러
+
+
+@dataclass
+class RebalanceProfile:
+    """리밸런싱 날짜 한 개의 훅 실행 기록 (시간은 초, 할당량은 bytes)"""
+    date: date
+    signals_wall: float = 0.0
+    signals_cpu: float = 0.0
+    signals_peak_bytes: int = 0
+    complete_wall: float = 0.0
+    complete_cpu: float = 0.0
+    n_signals: int = 0
+
+
+@dataclass
+class CallStats:
+    """이름별 호출 통계 (시간은 초)"""
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+
+    @property
+    def per_call(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class StrategyProfiler:
+    """
+    전략 훅과 MarketData 호출 프로파일러.
+
+    ``Backtester(..., profiler=profiler)``로 넘기면 ``run()`` 동안 자동으로
+    ``wrap()`` / ``instrument()``가 적용된다. 여러 번 실행하면 결과가 누적된다
+    (``reset()``으로 초기화).
+
+    Args:
+        memory: tracemalloc으로 ``generate_signals()``의 최대 할당량 기록
+            (할당이 많은 코드는 눈에 띄게 느려진다)
+    """
+
+    def __init__(self, memory: bool = True) -> None:
+        self.memory = memory
+        self.reset()
+
+    def reset(self) -> None:
+        """기록 초기화"""
+        self.strategy_name: Optional[str] = None
+        self.rebalances: List[RebalanceProfile] = []
+        self.calls: Dict[str, CallStats] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+        # 실행 중 프레임: [이름, 시작 시각, 자식 누적 시간]
+        self._frames: List[List[Any]] = []
+
+    # ── 적용 ──
+
+    def wrap(self, strategy: BaseStrategy) -> BaseStrategy:
+        """훅 실행을 기록하는 전략 래퍼"""
+        self.strategy_name = type(strategy).__name__
+        return _ProfiledStrategy(strategy, self)
+
+    @contextmanager
+    def instrument(self) -> Iterator["StrategyProfiler"]:
+        """with 블록 동안 MarketData 메서드 계측 (종료 시 원래 메서드 복원)"""
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another StrategyProfiler is already instrumenting MarketData")
+        originals = {name: MarketData.__dict__[name] for name in (*PROFILED_METHODS, *PROFILED_PROPERTIES)}
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        _active = self
+        try:
+            for name in PROFILED_METHODS:
+                setattr(MarketData, name, _timed(f"MarketData.{name}", originals[name]))
+            for name in PROFILED_PROPERTIES:
+                prop = originals[name]
+                setattr(MarketData, name, property(_timed(f"MarketData.{name}", prop.fget), doc=prop.__doc__))
+            if started_tracing:
+                tracemalloc.start()
+            yield self
+        finally:
+            for name, original in originals.items():
+                setattr(MarketData, name, original)
+            if started_tracing:
+                tracemalloc.stop()
+            _active = None
+
+    # ── 기록 ──
+
+    def _enter(self, name: str) -> None:
+        self._frames.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self) -> float:
+        name, started, children = self._frames[-1]
+        elapsed = time.perf_counter() - started
+        stack = tuple(frame[0] for frame in self._frames)
+        self._frames.pop()
+        stats = self.calls.get(name)
+        if stats is None:
+            stats = self.calls[name] = CallStats()
+        stats.calls += 1
+        stats.self_time += elapsed - children
+        # 재귀 호출은 가장 바깥 호출만 누적 시간에 더한다
+        if name not in stack[:-1]:
+            stats.total += elapsed
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + (elapsed - children)
+        if self._frames:
+            self._frames[-1][2] += elapsed
+        return elapsed
+
+    def _run_hook(self, hook: str, fn: Callable, *args) -> Tuple[Any, float, float, int]:
+        tracing = self.memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        cpu_started = time.process_time()
+        self._enter(self.strategy_name or "strategy")
+        self._enter(hook)
+        try:
+            result = fn(*args)
+        finally:
+            wall = self._exit()
+            self._exit()
+        cpu = time.process_time() - cpu_started
+        peak = tracemalloc.get_traced_memory()[1] - baseline if tracing else 0
+        return result, wall, cpu, max(peak, 0)
+
+    def _record_signals(self, rebalance_date: date, fn: Callable, *args) -> Any:
+        signals, wall, cpu, peak = self._run_hook("generate_signals", fn, *args)
+        self.rebalances.append(RebalanceProfile(
+            date=rebalance_date,
+            signals_wall=wall,
+            signals_cpu=cpu,
+            signals_peak_bytes=peak,
+            n_signals=len(signals),
+        ))
+        return signals
+
+    def _record_complete(self, rebalance_date: date, fn: Callable, *args) -> None:
+        _, wall, cpu, _ = self._run_hook("on_rebalance_complete", fn, *args)
+        if self.rebalances and self.rebalances[-1].date == rebalance_date:
+            self.rebalances[-1].complete_wall = wall
+            self.rebalances[-1].complete_cpu = cpu
+
+    # ── 보고서 ──
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 요약 (합계 / 평균 / 최대)"""
+        walls = [r.signals_wall for r in self.rebalances]
+        slowest = max(self.rebalances, key=lambda r: r.signals_wall, default=None)
+        return {
+            "strategy": self.strategy_name,
+            "rebalances": len(self.rebalances),
+            "signals_wall": sum(walls),
+            "signals_cpu": sum(r.signals_cpu for r in self.rebalances),
+            "signals_wall_mean": sum(walls) / len(walls) if walls else 0.0,
+            "signals_wall_max": slowest.signals_wall if slowest else 0.0,
+            "slowest_date": slowest.date.isoformat() if slowest else None,
+            "complete_wall": sum(r.complete_wall for r in self.rebalances),
+            "peak_bytes": max((r.signals_peak_bytes for r in self.rebalances), default=0),
+        }
+
+    def ranked(self) -> List[Tuple[str, CallStats]]:
+        """이름별 통계를 누적 시간 내림차순으로"""
+        return sorted(self.calls.items(), key=lambda item: item[1].total, reverse=True)
+
+    def report(self, top: int = 15) -> str:
+        """누적 시간 순 텍스트 보고서"""
+        s = self.summary()
+        lines = [
+            f"Profile: {s['strategy']} — {s['rebalances']} rebalances",
+            f"  generate_signals: {s['signals_wall']:.3f}s wall, {s['signals_cpu']:.3f}s cpu, "
+            f"mean {s['signals_wall_mean'] * 1e3:.2f}ms, max {s['signals_wall_max'] * 1e3:.2f}ms "
+            f"on {s['slowest_date']}",
+            f"  on_rebalance_complete: {s['complete_wall']:.3f}s wall",
+        ]
+        if self.memory:
+            lines.append(f"  peak allocation per call: {s['peak_bytes'] / 1024 ** 2:.2f} MB")
+        lines += ["", f"  {'calls':>8} {'total s':>9} {'self s':>9} {'per call ms':>12}  name"]
+        for name, stats in self.ranked()[:top]:
+            lines.append(
+                f"  {stats.calls:>8} {stats.total:>9.4f} {stats.self_time:>9.4f} "
+                f"{stats.per_call * 1e3:>12.4f}  {name}"
+            )
+        slowest = sorted(self.rebalances, key=lambda r: r.signals_wall, reverse=True)[:5]
+        if slowest:
+            lines += ["", "  slowest rebalances:"]
+            lines += [
+                f"    {r.date.isoformat()}  {r.signals_wall * 1e3:8.2f}ms  "
+                f"{r.signals_peak_bytes / 1024:10.1f} KiB  {r.n_signals} signals"
+                for r in slowest
+            ]
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "calls": {
+                name: {"calls": st.calls, "total": st.total, "self": st.self_time}
+                for name, st in self.ranked()
+            },
+            "rebalances": [
+                {**asdict(r), "date": r.date.isoformat()} for r in self.rebalances
+            ],
+        }
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """JSON 문자열 (path를 주면 파일로도 저장)"""
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def to_collapsed(self, path: Optional[str] = None) -> str:
+        """
+        collapsed-stack 형식 (``frame;frame;frame <microseconds>``).
+
+        값은 각 스택의 자기 시간(µs)이며 flamegraph.pl / speedscope /
+        inferno에 그대로 넣을 수 있다.
+        """
+        lines = [
+            f"{';'.join(stack)} {round(seconds * 1e6)}"
+            for stack, seconds in sorted(self.stacks.items())
+            if round(seconds * 1e6) > 0
+        ]
+        text = "\n".join(lines) + ("\n" if lines else "")
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+
+def _timed(name: str, fn: Callable) -> Callable:
+    """훅 실행 중일 때만 호출을 기록하는 래퍼"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profiler = _active
+        if profiler is None or not profiler._frames:
+            return fn(*args, **kwargs)
+        profiler._enter(name)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler._exit()
+
+    return wrapper
+
+
+class _ProfiledStrategy(BaseStrategy):
+    """전략 훅을 StrategyProfiler로 감싸는 래퍼 (나머지 속성은 원 전략에 위임)"""
+
+    def __init__(self, strategy: BaseStrategy, profiler: StrategyProfiler) -> None:
+        self._strategy = strategy
+        self._profiler = profiler
+        self.params = strategy.params
+
+    def generate_signals(self, market_data, rebalance_date):
+        return self._profiler._record_signals(
+            rebalance_date, self._strategy.generate_signals, market_data, rebalance_date
+        )
+
+    def risk_constraints(self) -> Dict:
+        return self._strategy.risk_constraints()
+
+    def on_rebalance_complete(self, rebalance_date, weights, portfolio_value) -> None:
+        self._profiler._record_complete(
+            rebalance_date, self._strategy.on_rebalance_complete, rebalance_date, weights, portfolio_value
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._strategy, name)
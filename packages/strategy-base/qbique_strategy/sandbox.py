@@ -0,0 +1,494 @@
+"""
+SandboxPool — 검증된 사용자 전략을 미리 띄워 둔 제한 워커에서 실행
+
+사용 예시::
+
+    from qbique_strategy.sandbox import SandboxPool
+
+    with SandboxPool(processes=8, cpu_seconds=5, memory_mb=1024) as pool:
+        results = pool.run_batch(sources, prices, rebalance_date="2024-06-28")
+    for r in results:
+        print(r.class_name, r.error or len(r.signals))
+
+워커는 pandas / numpy / qbique_strategy를 import한 상태로 미리 fork되어
+(POSIX에서는 forkserver) 전략마다 인터프리터를 새로 띄우는 비용이 없다.
+각 워커에는 CPU 시간(실행 1회당)과 주소 공간 한도를 걸고, ``max_runs``번
+실행하거나 한도 초과 / 예외 / 타임아웃이 나면 새 워커로 교체한다.
+
+가격 행렬은 배치마다 공유 메모리에 한 번만 올리고 (``grid.SharedPrices``),
+워커는 같은 버퍼 위의 MarketData를 배치 동안 재사용하므로 롤링 지표
+테이블도 전략들이 공유한다. 소스는 실행 전에
+``validate_strategy_code(sandbox=True)``로 검사하며, 통과하지 못한 소스는
+워커로 보내지 않는다. 격리 수준은 ``SandboxPool`` docstring 참고.
+"""
+from __future__ import annotations
+
+import builtins
+import ctypes
+import errno
+import hashlib
+import math
+import multiprocessing
+import os
+import signal as _signal
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import date
+from multiprocessing.connection import Connection, wait
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .data import MarketData
+from .grid import SharedPrices, attach_prices
+from .signal import Signal, SignalBatch
+from .validator import sandbox_import_error, validate_strategy_code
+
+try:  # POSIX 전용
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+Signals = Union[List[Signal], SignalBatch]
+
+
+@dataclass
+class SandboxResult:
+    """
+    전략 한 개의 실행 결과.
+
+    Attributes:
+        signals: ``generate_signals()`` 반환값 (실패 시 None)
+        error: 실패 사유 (검증 실패 / 예외 / 한도 초과 / 타임아웃)
+        class_name: 실행한 전략 클래스명
+        cpu_time: 워커에서 소비한 CPU 시간 (초)
+        wall_time: 워커에서의 실행 시간 (초)
+    """
+    signals: Optional[Signals] = None
+    error: Optional[str] = None
+    class_name: Optional[str] = None
+    cpu_time: float = 0.0
+    wall_time: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SandboxPool:
+    """
+    미리 띄워 둔 전략 실행 워커 풀.
+
+    격리 범위 (이것 이상은 보장하지 않는다):
+
+    - 소스는 ``validate_strategy_code(sandbox=True)``를 통과해야 한다.
+      허용 모듈 밖의 import, pandas / numpy 파일 I/O (``read_*``, ``to_*``,
+      ``fromfile``, ``load``, ``save``, ``tofile`` 등), dunder / ``getattr``
+      리플렉션을 정적으로 거부한다.
+    - 전략 코드는 ``open`` / ``eval`` / ``exec`` / ``compile`` / ``getattr``
+      등이 빠진 제한된 ``__builtins__``로 실행되고, ``__import__``는 같은
+      허용 목록을 다시 검사한다.
+    - 워커에는 CPU 시간 / 주소 공간 한도와 ``RLIMIT_FSIZE=0`` (파일 쓰기
+      불가)이 걸린다. Linux에서 권한이 있으면 (root 또는 비특권 user
+      namespace 허용) 워커를 새 network namespace로 분리해 네트워크를 끊는다.
+      ``network_isolated``로 확인할 수 있다.
+
+    파일 읽기는 OS 수준에서 막지 않는다 (chroot / 권한 하강 없음). 정적
+    검사를 우회하는 방법이 남아 있을 수 있으므로 신뢰할 수 없는 코드는
+    컨테이너 / seccomp 등 OS 격리 안에서 이 풀을 실행해야 한다.
+
+    Args:
+        processes: 워커 수 (None이면 CPU 수)
+        cpu_seconds: 실행 1회당 CPU 시간 한도 (초과 시 워커가 SIGXCPU로 종료)
+        memory_mb: 워커 주소 공간 한도 (MB, None이면 제한 없음)
+        max_runs: 워커 한 개가 실행할 최대 횟수. 이후 새 워커로 교체
+        timeout: 실행 1회당 wall-clock 한도 (초, None이면 제한 없음)
+        start_method: multiprocessing 시작 방식 (None이면 forkserver, 없으면 spawn)
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        cpu_seconds: float = 10.0,
+        memory_mb: Optional[int] = 2048,
+        max_runs: int = 200,
+        timeout: Optional[float] = 60.0,
+        start_method: Optional[str] = None,
+    ) -> None:
+        if max_runs < 1:
+            raise ValueError(f"max_runs must be positive, got {max_runs}")
+        self.processes = processes or multiprocessing.cpu_count()
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.max_runs = max_runs
+        self.timeout = timeout
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in methods else "spawn"
+        self._ctx = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            # forkserver가 pandas / numpy까지 import한 뒤 워커를 fork
+            self._ctx.set_forkserver_preload([__name__])
+        self._workers: List[_Worker] = []
+        self.recycled = 0
+        self.network_isolated: Optional[bool] = None  # 첫 워커가 보고
+
+    # ── 수명 주기 ──
+
+    def start(self) -> "SandboxPool":
+        """워커를 미리 띄운다 (첫 실행 시 자동 호출)"""
+        while len(self._workers) < self.processes:
+            self._workers.append(self._spawn())
+        return self
+
+    def close(self) -> None:
+        """모든 워커 종료"""
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def __enter__(self) -> "SandboxPool":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # ── 실행 ──
+
+    def run(
+        self,
+        source: str,
+        prices: Union[pd.DataFrame, MarketData],
+        rebalance_date: Optional[Union[str, date]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        lookback: Optional[int] = None,
+    ) -> SandboxResult:
+        """전략 한 개 실행 (``run_batch``의 단건 버전)"""
+        return self.run_batch([source], prices, rebalance_date, [params or {}], lookback)[0]
+
+    def run_batch(
+        self,
+        sources: Sequence[str],
+        prices: Union[pd.DataFrame, MarketData],
+        rebalance_date: Optional[Union[str, date]] = None,
+        params: Optional[Union[Dict[str, Any], Sequence[Dict[str, Any]]]] = None,
+        lookback: Optional[int] = None,
+    ) -> List[SandboxResult]:
+        """
+        여러 전략을 같은 시장 데이터로 병렬 실행한다.
+
+        Args:
+            sources: 전략 소스 코드 목록
+            prices: 종가 DataFrame 또는 MarketData
+            rebalance_date: 기준일. 이 날짜까지의 데이터만 전달 (None이면 전체)
+            params: 모든 전략에 같은 dict, 또는 소스별 dict 목록
+            lookback: 전달할 최대 과거 거래일 수
+
+        Returns:
+            입력 순서의 SandboxResult 목록
+        """
+        if isinstance(params, dict) or params is None:
+            params = [dict(params or {})] * len(sources)
+        if len(params) != len(sources):
+            raise ValueError(f"Got {len(params)} params for {len(sources)} sources")
+        frame = prices.prices if isinstance(prices, MarketData) else prices
+        when = None if rebalance_date is None else pd.Timestamp(rebalance_date)
+
+        results: List[Optional[SandboxResult]] = [None] * len(sources)
+        pending: Deque[Tuple[int, str, str]] = deque()
+        for i, source in enumerate(sources):
+            validation = validate_strategy_code(source, sandbox=True)
+            if validation.valid:
+                pending.append((i, source, validation.class_name))
+            else:
+                results[i] = SandboxResult(error="; ".join(validation.errors))
+        if not pending:
+            return results  # type: ignore[return-value]
+
+        self.start()
+        with SharedPrices(frame) as shared:
+            try:
+                self._dispatch(pending, results, params, shared.spec, when, lookback)
+            finally:
+                for worker in self._workers:
+                    worker.release()
+        return results  # type: ignore[return-value]
+
+    def _dispatch(self, pending, results, params, spec, when, lookback) -> None:
+        busy: Dict[Connection, Tuple[_Worker, int, str, Optional[float]]] = {}
+        idle = list(self._workers)
+        while pending or busy:
+            while pending and idle:
+                worker = idle.pop()
+                i, source, class_name = pending.popleft()
+                message = ("run", source, class_name, params[i], spec, when, lookback, self.cpu_seconds)
+                try:
+                    worker.send(message)
+                except OSError:  # 대기 중에 죽은 워커 — 새 워커로 한 번만 다시 보낸다
+                    worker = self._replace(worker)
+                    try:
+                        worker.send(message)
+                    except OSError:
+                        results[i] = SandboxResult(error=self._crash_reason(worker), class_name=class_name)
+                        idle.append(self._replace(worker))
+                        continue
+                deadline = None if self.timeout is None else time.monotonic() + self.timeout
+                busy[worker.conn] = (worker, i, class_name, deadline)
+
+            deadlines = [d for *_, d in busy.values() if d is not None]
+            wait_for = None if not deadlines else max(0.0, min(deadlines) - time.monotonic())
+            for conn in wait(list(busy), timeout=wait_for):
+                worker, i, class_name, _ = busy.pop(conn)
+                try:
+                    status, payload, cpu, wall = conn.recv()
+                except (EOFError, OSError):
+                    results[i] = SandboxResult(error=self._crash_reason(worker), class_name=class_name)
+                    idle.append(self._replace(worker))
+                    continue
+                worker.runs += 1
+                if status == "ok":
+                    results[i] = SandboxResult(payload, None, class_name, cpu, wall)
+                else:
+                    results[i] = SandboxResult(None, payload, class_name, cpu, wall)
+                recycle = status != "ok" and payload.startswith("MemoryError")
+                idle.append(self._replace(worker) if recycle or worker.runs >= self.max_runs else worker)
+
+            now = time.monotonic()
+            for conn, (worker, i, class_name, deadline) in list(busy.items()):
+                if deadline is not None and now >= deadline:
+                    del busy[conn]
+                    results[i] = SandboxResult(
+                        error=f"Timed out after {self.timeout:g}s", class_name=class_name
+                    )
+                    idle.append(self._replace(worker))
+
+    # ── 워커 관리 ──
+
+    def _spawn(self) -> "_Worker":
+        limits = {"memory_mb": self.memory_mb}
+        worker = _Worker(self._ctx, limits)
+        self.network_isolated = worker.network_isolated
+        return worker
+
+    def _replace(self, worker: "_Worker") -> "_Worker":
+        worker.stop()
+        fresh = self._spawn()
+        self._workers[self._workers.index(worker)] = fresh
+        self.recycled += 1
+        return fresh
+
+    def _crash_reason(self, worker: "_Worker") -> str:
+        worker.process.join(timeout=1.0)
+        code = worker.process.exitcode
+        if code is not None and code == -getattr(_signal, "SIGXCPU", 0):
+            return f"CPU time limit exceeded ({self.cpu_seconds:g}s)"
+        if code is not None and code < 0:
+            return f"Worker killed by signal {-code}"
+        return f"Worker exited unexpectedly (exit code {code})"
+
+
+class _Worker:
+    """부모 프로세스 쪽 워커 핸들 (프로세스 + 파이프)"""
+
+    def __init__(self, ctx, limits: Dict[str, Any]) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, limits), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.runs = 0
+        try:  # 워커가 준비되면 network namespace 분리 여부를 먼저 보낸다
+            self.network_isolated: bool = bool(self.conn.recv())
+        except (EOFError, OSError):
+            self.network_isolated = False
+
+    def send(self, message: Tuple) -> None:
+        self.conn.send(message)
+
+    def release(self) -> None:
+        """배치가 끝나 공유 메모리 참조 해제 요청 (응답 없음)"""
+        try:
+            self.conn.send(("release",))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+# ── 워커 프로세스 ──
+
+
+class _WorkerState:
+    """워커가 배치 동안 유지하는 공유 가격 / 컴파일 캐시"""
+
+    MAX_CODE = 256
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.shm = None
+        self.market_data: Optional[MarketData] = None
+        self.code: "OrderedDict[str, Any]" = OrderedDict()
+
+    def attach(self, spec: Dict[str, Any]) -> MarketData:
+        if spec["name"] != self.name:
+            self.release()
+            frame, self.shm = attach_prices(spec)
+            self.market_data = MarketData(frame)
+            self.name = spec["name"]
+        return self.market_data  # type: ignore[return-value]
+
+    def release(self) -> None:
+        self.market_data = None
+        self.name = None
+        if self.shm is not None:
+            try:
+                self.shm.close()
+            except BufferError:  # 전략이 참조를 남긴 경우 — 워커 교체 시 해제
+                pass
+            self.shm = None
+
+    def compile(self, source: str):
+        key = hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+        code = self.code.get(key)
+        if code is None:
+            code = compile(source, "<strategy>", "exec")
+            self.code[key] = code
+            while len(self.code) > self.MAX_CODE:
+                self.code.popitem(last=False)
+        return code
+
+
+# 전략 코드에 주지 않는 builtin (파일 / 코드 평가 / 리플렉션 / 대화형)
+_HIDDEN_BUILTINS = frozenset({
+    "open", "eval", "exec", "compile", "breakpoint", "input", "__import__",
+    "getattr", "setattr", "delattr", "globals", "locals", "vars",
+    "help", "exit", "quit", "copyright", "credits", "license", "__loader__", "__spec__",
+})
+
+
+def _guarded_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """허용 목록(``validator.sandbox_import_error``)을 통과한 import만 수행"""
+    reason = sandbox_import_error(name, fromlist or (), level)
+    if reason is not None:
+        raise ImportError(f"Import of '{name}' is not allowed in the sandbox: {reason}")
+    return builtins.__import__(name, globals, locals, fromlist, level)
+
+
+def _sandbox_builtins() -> Dict[str, Any]:
+    namespace = {k: v for k, v in vars(builtins).items() if k not in _HIDDEN_BUILTINS}
+    namespace["__import__"] = _guarded_import
+    return namespace
+
+
+_SANDBOX_BUILTINS = _sandbox_builtins()
+
+
+def _isolate_network() -> bool:
+    """
+    새 network namespace로 분리 (루프백도 내려간 상태).
+
+    특권이 없으면 user namespace와 함께 시도한다. 둘 다 안 되면 False.
+    """
+    if not hasattr(os, "fork") or not os.path.exists("/proc/self/ns/net"):
+        return False
+    clone_newnet, clone_newuser = 0x40000000, 0x10000000
+    unshare = getattr(os, "unshare", None)
+    if unshare is None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+        except OSError:
+            return False
+
+        def unshare(flags: int) -> None:
+            if libc.unshare(flags) != 0:
+                code = ctypes.get_errno()
+                raise OSError(code, os.strerror(code))
+
+    for flags in (clone_newnet, clone_newnet | clone_newuser):
+        try:
+            unshare(flags)
+            return True
+        except OSError as e:
+            if e.errno not in (errno.EPERM, errno.EINVAL, errno.ENOSPC, errno.EUSERS):
+                return False
+    return False
+
+
+def _apply_limits(limits: Dict[str, Any]) -> None:
+    if resource is None:
+        return
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    # 일반 파일 쓰기 금지 (파이프 / 공유 메모리 mmap은 영향 없음). SIGXFSZ 대신 EFBIG 에러
+    _signal.signal(_signal.SIGXFSZ, _signal.SIG_IGN)
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+    memory_mb = limits.get("memory_mb")
+    if memory_mb is not None:
+        size = int(memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+
+
+def _set_cpu_budget(seconds: float) -> None:
+    """지금까지 쓴 CPU 시간 + ``seconds``에서 SIGXCPU가 오도록 soft limit 설정"""
+    if resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + seconds)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _execute(state: _WorkerState, message: Tuple) -> Signals:
+    _, source, class_name, params, spec, when, lookback, _ = message
+    root = state.attach(spec)
+    # 실행마다 새 view — tickers 리스트와 파생 데이터 캐시를 전략끼리 공유하지 않는다
+    hi = len(root.values) if when is None else root._searchsorted(when, "right")
+    market_data = MarketData._view(root, 0 if lookback is None else max(0, hi - lookback), hi)
+    namespace: Dict[str, Any] = {"__name__": "__strategy__", "__builtins__": dict(_SANDBOX_BUILTINS)}
+    exec(state.compile(source), namespace)
+    strategy = namespace[class_name](dict(params))
+    try:
+        return strategy.generate_signals(market_data, market_data.end_date)
+    finally:
+        # 공유 지표 엔진의 가격 행렬을 바꿔 놓았으면 다음 실행 전에 버린다
+        if root._engine is not None and root._engine.values is not root.values:
+            root._engine = None
+
+
+def _worker_main(conn: Connection, limits: Dict[str, Any]) -> None:
+    conn.send(_isolate_network())
+    _apply_limits(limits)
+    state = _WorkerState()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        if message[0] == "release":
+            state.release()
+            continue
+
+        _set_cpu_budget(message[-1])
+        started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            reply = ("ok", _execute(state, message))
+        except (Exception, SystemExit) as e:  # 사용자 코드의 예외는 결과로 돌려준다
+            reply = ("error", f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)
+        elapsed = (time.process_time() - cpu_started, time.perf_counter() - started)
+        try:
+            conn.send((*reply, *elapsed))
+        except Exception as e:  # 반환값을 pickle할 수 없는 경우
+            conn.send(("error", f"Cannot return signals: {type(e).__name__}: {e}", *elapsed))
+    state.release()
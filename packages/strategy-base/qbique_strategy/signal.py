@@ -1,11 +1,14 @@
 """
-Signal — 전략이 생성하는 투자 시그널 데이터 클래스
+Signal / SignalBatch — 전략이 생성하는 투자 시그널
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 
 
 class SignalDirection(Enum):
@@ -38,3 +41,134 @@ class Signal:
             raise ValueError(f"weight must be between 0 and 1, got {self.weight}")
         if not self.ticker:
             raise ValueError("ticker must not be empty")
+
+
+_DIRECTIONS = (SignalDirection.LONG, SignalDirection.SHORT, SignalDirection.NEUTRAL)
+DIRECTION_CODES = {d: i for i, d in enumerate(_DIRECTIONS)}
+
+
+class SignalBatch:
+    """
+    Signal 리스트의 struct-of-arrays 표현.
+
+    종목 수가 많을 때 ``List[Signal]`` 대신 ``generate_signals()``에서 반환할
+    수 있다. 검증은 배열 단위로 한 번에 수행한다.
+
+    사용 예시::
+
+        mom = market_data.momentum_all(20)
+        return SignalBatch.from_series(mom[mom > 0])
+
+    Attributes:
+        tickers: 종목 코드 목록 (index가 가리키는 대상, 보통 market_data.tickers)
+        index: 시그널별 tickers 위치 (int64)
+        score: 시그널 강도 (float64)
+        direction: 방향 코드 (int8, DIRECTION_CODES: LONG=0 / SHORT=1 / NEUTRAL=2)
+        weight: 명시적 비중 (float64, NaN이면 score 기반 자동 계산)
+    """
+
+    __slots__ = ("tickers", "index", "score", "direction", "weight")
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        index,
+        score,
+        direction=None,
+        weight=None,
+    ) -> None:
+        n = len(index)
+        self.tickers: Sequence[str] = tickers
+        self.index = np.asarray(index, dtype=np.int64)
+        self.score = np.asarray(score, dtype=np.float64)
+        if direction is None:
+            self.direction = np.zeros(n, dtype=np.int8)
+        elif isinstance(direction, SignalDirection):
+            self.direction = np.full(n, DIRECTION_CODES[direction], dtype=np.int8)
+        else:
+            self.direction = np.asarray(direction, dtype=np.int8)
+        self.weight = np.full(n, np.nan) if weight is None else np.asarray(weight, dtype=np.float64)
+        self._validate()
+
+    def _validate(self) -> None:
+        n = len(self.index)
+        for name in ("score", "direction", "weight"):
+            if getattr(self, name).shape != (n,):
+                raise ValueError(f"{name} must have the same length as index ({n})")
+        if n and (self.index.min() < 0 or self.index.max() >= len(self.tickers)):
+            raise ValueError("index out of range for tickers")
+        if n and (self.direction.min() < 0 or self.direction.max() >= len(_DIRECTIONS)):
+            raise ValueError("direction codes must be 0 (LONG), 1 (SHORT) or 2 (NEUTRAL)")
+        if not np.isfinite(self.score).all():
+            bad = self.score[~np.isfinite(self.score)][0]
+            raise ValueError(f"score must be finite, got {bad}")
+        explicit = self.weight[~np.isnan(self.weight)]
+        if explicit.size and (explicit.min() < 0.0 or explicit.max() > 1.0):
+            bad = explicit[(explicit < 0.0) | (explicit > 1.0)][0]
+            raise ValueError(f"weight must be between 0 and 1, got {bad}")
+        if n and not all(self.tickers[i] for i in np.unique(self.index)):
+            raise ValueError("ticker must not be empty")
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Signal], tickers: Optional[Sequence[str]] = None) -> "SignalBatch":
+        """Signal 리스트 → SignalBatch. ``tickers`` 생략 시 시그널 순서대로 구성 (metadata는 버림)"""
+        signals = list(signals)
+        if tickers is None:
+            tickers = list(dict.fromkeys(s.ticker for s in signals))
+        position = {t: i for i, t in enumerate(tickers)}
+        try:
+            index = [position[s.ticker] for s in signals]
+        except KeyError as e:
+            raise KeyError(f"Ticker {e.args[0]!r} not in tickers") from None
+        return cls(
+            tickers,
+            index,
+            [s.score for s in signals],
+            [DIRECTION_CODES[s.direction] for s in signals],
+            [np.nan if s.weight is None else s.weight for s in signals],
+        )
+
+    @classmethod
+    def from_series(
+        cls,
+        scores: pd.Series,
+        direction: SignalDirection = SignalDirection.LONG,
+        weight: Optional[pd.Series] = None,
+    ) -> "SignalBatch":
+        """종목 코드 index의 score Series (예: ``momentum_all()`` 결과) → SignalBatch"""
+        tickers = list(scores.index)
+        weights = None if weight is None else weight.reindex(scores.index).to_numpy(dtype=np.float64)
+        return cls(tickers, np.arange(len(tickers)), scores.to_numpy(dtype=np.float64), direction, weights)
+
+    def to_signals(self) -> List[Signal]:
+        """SignalBatch → Signal 리스트"""
+        return [
+            Signal(
+                ticker=self.tickers[i],
+                score=float(score),
+                direction=_DIRECTIONS[d],
+                weight=None if np.isnan(w) else float(w),
+            )
+            for i, score, d, w in zip(self.index.tolist(), self.score, self.direction.tolist(), self.weight)
+        ]
+
+    def select(self, mask) -> "SignalBatch":
+        """boolean mask / 위치 배열로 일부 시그널만 선택 (검증 생략)"""
+        batch = SignalBatch.__new__(SignalBatch)
+        batch.tickers = self.tickers
+        batch.index = self.index[mask]
+        batch.score = self.score[mask]
+        batch.direction = self.direction[mask]
+        batch.weight = self.weight[mask]
+        return batch
+
+    @property
+    def ticker_labels(self) -> List[str]:
+        """시그널별 종목 코드"""
+        return [self.tickers[i] for i in self.index.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"SignalBatch(n={len(self)}, universe={len(self.tickers)})"
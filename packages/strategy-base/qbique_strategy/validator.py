@@ -1,11 +1,28 @@
 """
 AST 기반 Python 전략 파일 검증기
+
+소스를 한 번 파싱하고 한 번의 visitor 순회로 금지 import / 금지 호출 /
+전략 클래스를 모두 수집한다. 분석 결과는 소스 내용의 해시로 캐시되므로
+같은 파일을 다시 검증하거나 ``detect_class_name()``을 이어 호출해도
+재파싱하지 않는다. 여러 파일은 ``validate_files()``로 프로세스 풀에서
+병렬 검증한다.
+
+``perf_lint=True``를 주면 같은 순회에서 수집한 ``generate_signals()``의
+느린 패턴 경고(벡터화 대안 포함)를 ``ValidationResult.warnings``에 더한다.
+``sandbox=True``는 ``SandboxPool``에서 실행할 소스용 규칙(허용 모듈 목록,
+파일 I/O 속성 / 리플렉션 차단)을 추가로 적용한다.
 """
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 
 # 보안상 금지되는 모듈
@@ -14,7 +31,7 @@ FORBIDDEN_MODULES = frozenset({
     "http", "shutil", "pathlib", "sys", "importlib",
     "ctypes", "multiprocessing", "threading", "signal",
     "pickle", "shelve", "tempfile", "glob", "fnmatch",
-    "webbrowser", "smtplib", "ftplib", "telnetlib",
+    "webbrowser", "smtplib", "ftplib", "telnetlib", "resource",
 })
 
 # 금지되는 builtin 호출
@@ -23,6 +40,66 @@ FORBIDDEN_BUILTINS = frozenset({
     "open", "input",
 })
 
+# ── sandbox 규칙 (SandboxPool에서 실행하는 소스) ──
+
+# import를 허용하는 최상위 모듈
+SANDBOX_MODULES = frozenset({
+    "__future__", "numpy", "pandas", "math", "statistics", "datetime", "time",
+    "collections", "itertools", "functools", "typing", "dataclasses", "heapq",
+    "bisect", "operator", "decimal", "fractions", "random", "enum", "abc", "copy",
+    "re", "qbique_strategy",
+})
+
+# qbique_strategy에서 import할 수 있는 이름 (서브모듈 / 파일 경로를 받는 함수 제외)
+SANDBOX_PACKAGE_NAMES = frozenset({
+    "BaseStrategy", "MarketData", "RollingIndicators", "Signal", "SignalBatch",
+    "SignalDirection", "signals_to_weights",
+})
+
+# 파일 / 네트워크 I/O, 문자열 코드 평가, 인터프리터 내부로 이어지는 속성.
+# ``read_*`` / ``to_*`` (pandas I/O)는 접두어로 따로 막는다.
+SANDBOX_FORBIDDEN_ATTRIBUTES = frozenset({
+    "fromfile", "tofile", "load", "loads", "save", "savez", "savez_compressed",
+    "savetxt", "loadtxt", "genfromtxt", "fromregex", "memmap", "open_memmap",
+    "DataSource", "dump", "dumps", "ExcelWriter", "ExcelFile", "HDFStore",
+    "io", "lib", "ctypeslib", "testing", "f2py", "distutils", "builtins",
+    "query", "get_type_hints", "ForwardRef", "attrgetter", "methodcaller",
+}) | FORBIDDEN_MODULES | FORBIDDEN_BUILTINS
+
+# frame / code 객체와 인터프리터 내부를 훑는 모듈로 이어지는 속성.
+# frame의 ``f_globals``에서 ``__builtins__``를 꺼내는 탈출을 막는다
+# (``co_*``는 접두어로 따로 막는다).
+SANDBOX_INTROSPECTION_ATTRIBUTES = frozenset({
+    "f_back", "f_globals", "f_locals", "f_builtins", "f_code", "f_trace",
+    "gi_frame", "gi_code", "cr_frame", "cr_code", "ag_frame", "ag_code",
+    "tb_frame", "tb_next", "currentframe", "stack", "getframeinfo",
+    "inspect", "gc", "get_objects", "get_referrers", "get_referents", "types",
+    "weakref", "traceback", "linecache", "tokenize", "marshal", "pkgutil",
+    "posix", "nt", "posixpath", "ntpath", "asyncio",
+    "FileIO", "TextIOWrapper", "GzipFile", "ZipFile", "TarFile", "BZ2File",
+    "LZMAFile",
+})
+
+# ``to_`` 접두어지만 I/O가 아닌 변환
+SANDBOX_SAFE_CONVERSIONS = frozenset({
+    "to_numpy", "to_list", "to_dict", "to_frame", "to_records", "to_period",
+    "to_timestamp", "to_datetime", "to_timedelta", "to_numeric", "to_pydatetime",
+    "to_flat_index", "to_offset",
+})
+
+# 속성 / 이름을 우회하는 builtin 호출
+SANDBOX_FORBIDDEN_BUILTINS = frozenset({
+    "getattr", "setattr", "delattr", "globals", "locals", "vars",
+})
+
+# sandbox에서 허용하는 dunder 속성 / 이름 (그 밖의 ``_`` 접두어 속성은 모두 차단)
+_SANDBOX_DUNDERS = frozenset({"__init__", "__name__", "__doc__"})
+
+_DUNDER = re.compile(r"__\w+__")
+
+# 분석 결과 캐시에 유지할 최대 소스 수 (LRU)
+DEFAULT_CACHE_SIZE = 4096
+
 
 @dataclass
 class ValidationResult:
@@ -33,7 +110,40 @@ class ValidationResult:
     class_name: Optional[str] = None
 
 
-def validate_strategy_code(source_code: str) -> ValidationResult:
+@dataclass
+class BatchValidationResult:
+    """
+    여러 파일의 검증 결과.
+
+    Attributes:
+        results: 파일 경로별 ValidationResult (입력 순서)
+    """
+    results: Dict[str, ValidationResult] = field(default_factory=dict)
+
+    @property
+    def valid(self) -> bool:
+        """모든 파일이 통과했는지"""
+        return all(r.valid for r in self.results.values())
+
+    @property
+    def passed(self) -> List[str]:
+        return [path for path, r in self.results.items() if r.valid]
+
+    @property
+    def failed(self) -> List[str]:
+        return [path for path, r in self.results.items() if not r.valid]
+
+    def errors(self) -> Dict[str, List[str]]:
+        """실패한 파일별 에러 메시지"""
+        return {path: list(r.errors) for path, r in self.results.items() if not r.valid}
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+def validate_strategy_code(
+    source_code: str, perf_lint: bool = False, sandbox: bool = False
+) -> ValidationResult:
     """
     Python 전략 코드를 AST로 파싱하여 검증한다.
 
@@ -44,84 +154,528 @@ def validate_strategy_code(source_code: str) -> ValidationResult:
     4. 금지 import 차단
     5. exec/eval/compile 호출 차단
 
+    ``perf_lint=True``이면 ``generate_signals()``의 알려진 느린 패턴
+    (종목별 ``calculate_*`` 루프, 루프 안 ``.iloc`` / ``dropna()``, 반복되는
+    ``market_data.returns`` 접근, 행 단위 DataFrame 생성 등)을 벡터화 대안과
+    함께 ``warnings``에 추가한다. 경고는 ``valid``에 영향을 주지 않는다.
+
+    ``sandbox=True``이면 ``SandboxPool``용 규칙도 적용한다:
+
+    - ``SANDBOX_MODULES`` 밖의 import, 상대 import 차단
+      (``qbique_strategy``는 ``SANDBOX_PACKAGE_NAMES``만 from-import 가능)
+    - pandas / numpy 파일 I/O 속성 차단 (``read_*``, ``to_*``, ``fromfile``,
+      ``load``, ``save``, ``tofile`` 등 — ``SANDBOX_FORBIDDEN_ATTRIBUTES``)
+    - ``_`` 접두어 속성(``_core`` 등 비공개 모듈 / 속성 포함), dunder 이름 /
+      문자열과 ``getattr`` 등 리플렉션 호출 차단
+    - frame / code 객체 속성(``f_back``, ``f_globals``, ``co_*`` 등)과
+      ``inspect`` / ``gc`` 등 인터프리터 내부 접근 차단
+      (``SANDBOX_INTROSPECTION_ATTRIBUTES``)
+
+    정적 검사이므로 우회가 불가능하다고 보장하지는 않는다. 실행 시 제한은
+    ``SandboxPool`` 참고.
+
     Args:
         source_code: Python 소스 코드 문자열
+        perf_lint: 성능 lint 경고 포함 여부
+        sandbox: sandbox 규칙 적용 여부
 
     Returns:
         ValidationResult
     """
-    errors: List[str] = []
-    warnings: List[str] = []
+    return _to_result(_analyze(source_code), perf_lint, sandbox)
+
+
+def detect_class_name(source_code: str) -> Optional[str]:
+    """
+    전략 코드에서 BaseStrategy 상속 클래스명을 감지한다.
+
+    Args:
+        source_code: Python 소스 코드
+
+    Returns:
+        클래스명 또는 None
+    """
+    classes = _analyze(source_code).classes
+    return classes[0].name if classes else None
+
+
+def validate_files(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+    perf_lint: bool = False,
+    sandbox: bool = False,
+) -> BatchValidationResult:
+    """
+    전략 파일 여러 개를 프로세스 풀에서 검증한다.
 
-    # 1. 파싱
+    파일 읽기와 해시 계산은 호출 프로세스에서 하고, 캐시에 없는 고유 소스만
+    워커로 보낸다 (내용이 같은 파일은 한 번만 분석).
+
+    Args:
+        paths: 전략 파일 경로
+        processes: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        chunksize: 워커 호출 한 번에 묶어 보낼 소스 수
+        perf_lint: 성능 lint 경고 포함 여부 (``validate_strategy_code`` 참고)
+        sandbox: sandbox 규칙 적용 여부 (``validate_strategy_code`` 참고)
+
+    Returns:
+        BatchValidationResult
+    """
+    order: List[str] = []
+    unreadable: Dict[str, ValidationResult] = {}
+    digests: Dict[str, str] = {}
+    analyses: Dict[str, _Analysis] = {}  # digest -> 분석 결과
+    pending: Dict[str, str] = {}  # digest -> 캐시에 없는 소스
+
+    for path in paths:
+        key = os.fspath(path)
+        order.append(key)
+        try:
+            with open(key, encoding="utf-8") as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            unreadable[key] = ValidationResult(valid=False, errors=[f"Cannot read file: {e}"])
+            continue
+        digest = digests[key] = _digest(source)
+        if digest in analyses or digest in pending:
+            continue
+        cached = _cache_get(digest)
+        if cached is None:
+            pending[digest] = source
+        else:
+            analyses[digest] = cached
+
+    if pending:
+        sources = list(pending.values())
+        workers = min(processes or os.cpu_count() or 1, len(sources))
+        if workers <= 1:
+            parsed = [_parse(s) for s in sources]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(_parse, sources, chunksize=max(1, chunksize)))
+        for digest, analysis in zip(pending, parsed):
+            analyses[digest] = analysis
+            _cache_put(digest, analysis)
+
+    batch = BatchValidationResult()
+    for key in order:
+        batch.results[key] = unreadable[key] if key in unreadable else _to_result(
+            analyses[digests[key]], perf_lint, sandbox
+        )
+    return batch
+
+
+def clear_cache() -> None:
+    """분석 결과 캐시 비우기"""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _CACHE_STATS["hits"] = _CACHE_STATS["misses"] = 0
+
+
+def cache_info() -> Dict[str, int]:
+    """캐시 상태 (entries / hits / misses)"""
+    with _CACHE_LOCK:
+        return {"entries": len(_CACHE), **_CACHE_STATS}
+
+
+def sandbox_import_error(module: str, names: Iterable[str] = (), level: int = 0) -> Optional[str]:
+    """
+    sandbox에서 허용되지 않는 import면 사유, 허용되면 None.
+
+    ``import a.b``는 ``module="a.b"``, ``from a import x, y``는
+    ``module="a", names=["x", "y"]``로 호출한다. 검증기와 ``SandboxPool``
+    워커의 ``__import__``가 같은 규칙을 쓴다.
+    """
+    names = list(names)
+    parts = module.split(".") if module else []
+    if level or not parts:
+        return "relative imports are not allowed"
+    if parts[0] not in SANDBOX_MODULES:
+        return f"module '{parts[0]}' is not in the sandbox allowlist"
+    if parts[0] == "qbique_strategy":
+        if len(parts) > 1 or not names:
+            return "only 'from qbique_strategy import ...' is allowed"
+        blocked = [n for n in names if n not in SANDBOX_PACKAGE_NAMES]
+        return f"'{blocked[0]}' cannot be imported from qbique_strategy" if blocked else None
+    blocked = [n for n in [*parts[1:], *names] if is_sandbox_forbidden_attribute(n)]
+    return f"'{blocked[0]}' gives file or interpreter access" if blocked else None
+
+
+def is_sandbox_forbidden_attribute(name: str) -> bool:
+    """sandbox에서 접근할 수 없는 속성 이름인지 (I/O, 모듈 탈출, ``_`` 접두어, frame)"""
+    if name.startswith("_"):
+        return name not in _SANDBOX_DUNDERS
+    if name.startswith(("read_", "co_")):
+        return True
+    if name.startswith("to_"):
+        return name not in SANDBOX_SAFE_CONVERSIONS
+    return name in SANDBOX_FORBIDDEN_ATTRIBUTES or name in SANDBOX_INTROSPECTION_ATTRIBUTES
+
+
+# ── 분석 ──
+
+
+@dataclass(frozen=True)
+class _StrategyClass:
+    """BaseStrategy 상속 클래스 한 개의 분석 결과"""
+    name: str
+    has_generate_signals: bool
+    perf_warnings: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _Analysis:
+    """소스 한 개의 분석 결과 (불변, 캐시 저장용)"""
+    syntax_error: Optional[str] = None
+    import_errors: Tuple[str, ...] = ()
+    call_errors: Tuple[str, ...] = ()
+    # sandbox=True일 때만 에러로 보고 (캐시는 공유)
+    sandbox_errors: Tuple[str, ...] = ()
+    # ast.walk와 같은 너비 우선 순서
+    classes: Tuple[_StrategyClass, ...] = ()
+
+
+# 종목 하나씩 계산하는 MarketData 메서드 → 전 종목 벡터화 대안
+_PER_TICKER_METHODS = {
+    "calculate_momentum": "market_data.momentum_all(period)",
+    "calculate_volatility": "market_data.volatility_all(period)",
+    "calculate_mean_return": "market_data.mean_return_all(period)",
+    "ticker_returns": "market_data.returns",
+    "clean_prices": "market_data.prices",
+    "get_ticker_data": "market_data.prices / market_data.returns",
+}
+
+# 루프 안에서 호출하면 DataFrame을 행 단위로 다시 만드는 생성자
+_FRAME_BUILDERS = frozenset({"DataFrame", "Series", "concat"})
+
+_SIGNAL_BATCH_HINT = "return SignalBatch.from_series(scores) built from an *_all() Series"
+
+
+class _StrategyVisitor(ast.NodeVisitor):
+    """
+    금지 import / 금지 호출 / BaseStrategy 상속 클래스를 한 번의 순회로 수집.
+    sandbox 규칙 위반은 항상 따로 모아 두고 ``_to_result``에서 선택적으로 보고한다.
+
+    같은 순회에서 전략 클래스의 ``generate_signals()`` 본문에 대해 알려진 느린
+    패턴(성능 lint)도 기록한다. 루프는 for / while / comprehension이며,
+    반복마다 평가되지 않는 부분(for의 iter, 첫 comprehension의 iter)은 루프
+    밖으로 본다.
+    """
+
+    def __init__(self) -> None:
+        self.import_errors: List[str] = []
+        self.call_errors: List[str] = []
+        self.sandbox_errors: List[str] = []
+        # (depth, 순번, 클래스)
+        self.classes: List[Tuple[int, int, _StrategyClass]] = []
+        self._depth = 0
+        self._scopes: List[bool] = []  # 클래스/함수 중첩 (True = 전략 클래스 본문)
+        # 성능 lint 상태: 현재 전략 클래스의 (line, message) 목록과 generate_signals 내부 여부
+        self._findings: List[Tuple[int, str]] = []
+        self._linting = False
+        self._loops: List[bool] = []  # 현재 루프들이 market_data.tickers를 도는지
+        self._returns_lines: List[int] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        self._depth += 1
+        super().generic_visit(node)
+        self._depth -= 1
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.split(".")[0] in FORBIDDEN_MODULES:
+                self.import_errors.append(f"Forbidden import '{alias.name}' at line {node.lineno}")
+            else:
+                self._check_sandbox_import(node, alias.name)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module and node.module.split(".")[0] in FORBIDDEN_MODULES:
+            self.import_errors.append(
+                f"Forbidden import from '{node.module}' at line {node.lineno}"
+            )
+        else:
+            self._check_sandbox_import(node, node.module or "", [a.name for a in node.names], node.level)
+        self.generic_visit(node)
+
+    def _check_sandbox_import(self, node, module: str, names: Iterable[str] = (), level: int = 0) -> None:
+        reason = sandbox_import_error(module, names, level)
+        if reason is not None:
+            target = "." * level + module
+            self.sandbox_errors.append(
+                f"Import '{target}' is not allowed in the sandbox at line {node.lineno}: {reason}"
+            )
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func_name = _get_call_name(node)
+        if func_name in FORBIDDEN_BUILTINS:
+            self.call_errors.append(f"Forbidden call '{func_name}()' at line {node.lineno}")
+        if func_name in SANDBOX_FORBIDDEN_BUILTINS and isinstance(node.func, ast.Name):
+            self.sandbox_errors.append(
+                f"Call '{func_name}()' is not allowed in the sandbox at line {node.lineno}"
+            )
+        if self._linting and self._loops:
+            self._lint_call(node, func_name)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        is_strategy = any("BaseStrategy" in (_get_base_name(base) or "") for base in node.bases)
+        if not is_strategy:
+            self._scopes.append(False)
+            self.generic_visit(node)
+            self._scopes.pop()
+            return
+
+        has_generate_signals = any(
+            isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and item.name == "generate_signals"
+            for item in node.body
+        )
+        depth, order = self._depth, len(self.classes)
+        self.classes.append((depth, order, _StrategyClass(node.name, has_generate_signals)))
+        outer = self._findings, self._linting
+        self._findings, self._linting = [], False
+        self._scopes.append(True)
+        self.generic_visit(node)
+        self._scopes.pop()
+        found = self._findings
+        self._findings, self._linting = outer
+        warnings = tuple(dict.fromkeys(msg for _, msg in sorted(found, key=lambda w: w[0])))
+        self.classes[order] = (depth, order, _StrategyClass(node.name, has_generate_signals, warnings))
+
+    # ── 성능 lint ──
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def _visit_function(self, node) -> None:
+        in_strategy_body = self._scopes[-1:] == [True]
+        outer_linting = self._linting
+        if in_strategy_body:
+            # 전략 클래스의 메서드 중 generate_signals만 lint (중첩 함수는 바깥 상태를 따름)
+            self._linting = node.name == "generate_signals"
+        self._scopes.append(False)
+        if in_strategy_body and self._linting:
+            outer_loops, self._loops = self._loops, []
+            self._returns_lines = []
+            self.generic_visit(node)
+            self._loops = outer_loops
+            self._check_returns()
+        else:
+            self.generic_visit(node)
+        self._scopes.pop()
+        self._linting = outer_linting
+
+    def _check_returns(self) -> None:
+        lines = self._returns_lines
+        if len(lines) > 1:
+            self._findings.append((
+                lines[1],
+                f"Performance: market_data.returns is accessed {len(lines)} times in "
+                f"generate_signals() (lines {', '.join(map(str, lines))}); "
+                "assign it to a local once and reuse it",
+            ))
+
+    def visit_For(self, node: ast.For) -> None:
+        self._visit_for(node)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self._visit_for(node)
+
+    def _visit_for(self, node) -> None:
+        self._depth += 1
+        self.visit(node.target)
+        self.visit(node.iter)
+        self._in_loop(_iterates_tickers(node.iter), node.body)
+        for stmt in node.orelse:
+            self.visit(stmt)
+        self._depth -= 1
+
+    def visit_While(self, node: ast.While) -> None:
+        self._depth += 1
+        self._in_loop(False, [node.test, *node.body])
+        for stmt in node.orelse:
+            self.visit(stmt)
+        self._depth -= 1
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        self._visit_comprehension(node, [node.elt])
+
+    def visit_SetComp(self, node: ast.SetComp) -> None:
+        self._visit_comprehension(node, [node.elt])
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
+        self._visit_comprehension(node, [node.elt])
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:
+        self._visit_comprehension(node, [node.key, node.value])
+
+    def _visit_comprehension(self, node, results: List[ast.AST]) -> None:
+        self._depth += 1
+        first, *rest = node.generators
+        self._depth += 1
+        self.visit(first.iter)
+        self._depth -= 1
+        inner: List[ast.AST] = [first.target, *first.ifs]
+        for gen in rest:
+            inner.extend([gen.target, gen.iter, *gen.ifs])
+        self._in_loop(_iterates_tickers(first.iter), [*inner, *results])
+        self._depth -= 1
+
+    def _in_loop(self, over_tickers: bool, nodes: List[ast.AST]) -> None:
+        self._loops.append(over_tickers)
+        for child in nodes:
+            self.visit(child)
+        self._loops.pop()
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if _DUNDER.fullmatch(node.id) and node.id not in _SANDBOX_DUNDERS:
+            self.sandbox_errors.append(f"Name '{node.id}' is not allowed in the sandbox at line {node.lineno}")
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        # attrgetter("__class__"), Series.apply("__...__") 같은 문자열 우회
+        if isinstance(node.value, str) and any(
+            m not in _SANDBOX_DUNDERS for m in _DUNDER.findall(node.value)
+        ):
+            self.sandbox_errors.append(
+                f"String containing a dunder name is not allowed in the sandbox at line {node.lineno}"
+            )
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if is_sandbox_forbidden_attribute(node.attr):
+            self.sandbox_errors.append(
+                f"Attribute '.{node.attr}' is not allowed in the sandbox at line {node.lineno} "
+                "(file I/O or interpreter internals)"
+            )
+        if (
+            self._linting
+            and node.attr == "returns"
+            and isinstance(node.ctx, ast.Load)
+            and isinstance(node.value, ast.Name)
+            and node.value.id != "self"
+        ):
+            if self._loops:
+                self._findings.append((
+                    node.lineno,
+                    f"Performance: market_data.returns accessed inside a loop at line {node.lineno}; "
+                    "read it once before the loop and index the whole frame",
+                ))
+            else:
+                self._returns_lines.append(node.lineno)
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        if self._linting and self._loops and isinstance(node.value, ast.Attribute):
+            accessor = node.value.attr
+            if accessor in ("iloc", "iat") and isinstance(node.ctx, ast.Load):
+                self._findings.append((
+                    node.lineno,
+                    f"Performance: .{accessor}[] indexing inside a loop at line {node.lineno}; "
+                    "convert once with .to_numpy() or use a whole-column operation "
+                    "(e.g. market_data.momentum_all())",
+                ))
+            elif accessor in ("loc", "iloc", "at") and isinstance(node.ctx, ast.Store):
+                self._findings.append((
+                    node.lineno,
+                    f"Performance: DataFrame built row by row (.{accessor}[] assignment) inside a loop "
+                    f"at line {node.lineno}; collect values and build the frame once, or "
+                    + _SIGNAL_BATCH_HINT,
+                ))
+        self.generic_visit(node)
+
+    def _lint_call(self, node: ast.Call, func_name: Optional[str]) -> None:
+        line = node.lineno
+        findings = self._findings
+        is_method = isinstance(node.func, ast.Attribute)
+        if is_method and func_name in _PER_TICKER_METHODS:
+            where = "per-ticker loop over market_data.tickers" if any(self._loops) else "loop"
+            findings.append((
+                line,
+                f"Performance: {func_name}() called in a {where} at line {line}; "
+                f"use {_PER_TICKER_METHODS[func_name]} to compute every ticker in one vectorized call",
+            ))
+        elif is_method and func_name == "dropna":
+            findings.append((
+                line,
+                f"Performance: dropna() inside a loop at line {line}; drop missing values once on "
+                "the whole frame, or use the *_all() methods which skip gaps per ticker",
+            ))
+        elif func_name in _FRAME_BUILDERS:
+            findings.append((
+                line,
+                f"Performance: {func_name}() inside a loop at line {line} builds data row by row; "
+                "collect values and build it once after the loop, or " + _SIGNAL_BATCH_HINT,
+            ))
+        elif func_name == "Signal" and any(self._loops):
+            findings.append((
+                line,
+                f"Performance: Signal objects created per ticker at line {line}; "
+                + _SIGNAL_BATCH_HINT,
+            ))
+
+
+def _iterates_tickers(node: ast.AST) -> bool:
+    """``for t in market_data.tickers`` 꼴인지 (enumerate/sorted 등으로 감싼 경우 포함)"""
+    if isinstance(node, ast.Attribute):
+        return node.attr == "tickers"
+    if isinstance(node, ast.Call) and node.args:
+        return _iterates_tickers(node.args[0])
+    return False
+
+
+def _parse(source_code: str) -> _Analysis:
+    """파싱 + 단일 visitor 순회 (캐시 없음, 워커 프로세스에서도 사용)"""
     try:
         tree = ast.parse(source_code)
     except SyntaxError as e:
-        return ValidationResult(
-            valid=False,
-            errors=[f"Syntax error at line {e.lineno}: {e.msg}"],
-        )
+        return _Analysis(syntax_error=f"Syntax error at line {e.lineno}: {e.msg}")
+    visitor = _StrategyVisitor()
+    visitor.visit(tree)
+    classes = tuple(cls for _, _, cls in sorted(visitor.classes, key=lambda c: c[:2]))
+    return _Analysis(
+        import_errors=tuple(visitor.import_errors),
+        call_errors=tuple(visitor.call_errors),
+        sandbox_errors=tuple(visitor.sandbox_errors),
+        classes=classes,
+    )
+
+
+def _to_result(analysis: _Analysis, perf_lint: bool = False, sandbox: bool = False) -> ValidationResult:
+    """캐시된 분석 결과로 새 ValidationResult 생성 (호출자가 수정해도 캐시는 안전)"""
+    if analysis.syntax_error is not None:
+        return ValidationResult(valid=False, errors=[analysis.syntax_error])
 
-    # 2. 금지 import 검사
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                root_module = alias.name.split(".")[0]
-                if root_module in FORBIDDEN_MODULES:
-                    errors.append(
-                        f"Forbidden import '{alias.name}' at line {node.lineno}"
-                    )
-
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                root_module = node.module.split(".")[0]
-                if root_module in FORBIDDEN_MODULES:
-                    errors.append(
-                        f"Forbidden import from '{node.module}' at line {node.lineno}"
-                    )
-
-    # 3. 금지 builtin 호출 검사
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            func_name = _get_call_name(node)
-            if func_name in FORBIDDEN_BUILTINS:
-                errors.append(
-                    f"Forbidden call '{func_name}()' at line {node.lineno}"
-                )
-
-    # 4. BaseStrategy 상속 클래스 검사
-    strategy_classes = _find_strategy_classes(tree)
-
-    if not strategy_classes:
+    errors = [*analysis.import_errors, *analysis.call_errors]
+    if sandbox:
+        errors.extend(analysis.sandbox_errors)
+    warnings: List[str] = []
+    if not analysis.classes:
         errors.append(
             "No class inheriting from BaseStrategy found. "
             "Your strategy must subclass BaseStrategy."
         )
         return ValidationResult(valid=False, errors=errors, warnings=warnings)
 
-    if len(strategy_classes) > 1:
+    if len(analysis.classes) > 1:
+        names = [cls.name for cls in analysis.classes]
         warnings.append(
-            f"Multiple strategy classes found: {[c.name for c in strategy_classes]}. "
-            f"Using first: {strategy_classes[0].name}"
+            f"Multiple strategy classes found: {names}. "
+            f"Using first: {names[0]}"
         )
 
-    cls = strategy_classes[0]
-
-    # 5. generate_signals 메서드 존재 확인
-    has_generate_signals = False
-    for item in cls.body:
-        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if item.name == "generate_signals":
-                has_generate_signals = True
-                break
-
-    if not has_generate_signals:
-        errors.append(
-            f"Class '{cls.name}' must implement generate_signals() method"
-        )
+    cls = analysis.classes[0]
+    if not cls.has_generate_signals:
+        errors.append(f"Class '{cls.name}' must implement generate_signals() method")
+    if perf_lint:
+        warnings.extend(cls.perf_warnings)
 
     valid = len(errors) == 0
-
     return ValidationResult(
         valid=valid,
         errors=errors,
@@ -130,36 +684,43 @@ def validate_strategy_code(source_code: str) -> ValidationResult:
     )
 
 
-def detect_class_name(source_code: str) -> Optional[str]:
-    """
-    전략 코드에서 BaseStrategy 상속 클래스명을 감지한다.
+# ── 내용 해시 캐시 ──
 
-    Args:
-        source_code: Python 소스 코드
+_CACHE: "OrderedDict[str, _Analysis]" = OrderedDict()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+_CACHE_LOCK = threading.Lock()
 
-    Returns:
-        클래스명 또는 None
-    """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return None
 
-    classes = _find_strategy_classes(tree)
-    return classes[0].name if classes else None
+def _digest(source_code: str) -> str:
+    return hashlib.sha256(source_code.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _cache_get(digest: str) -> Optional[_Analysis]:
+    with _CACHE_LOCK:
+        analysis = _CACHE.get(digest)
+        if analysis is None:
+            _CACHE_STATS["misses"] += 1
+            return None
+        _CACHE.move_to_end(digest)
+        _CACHE_STATS["hits"] += 1
+        return analysis
+
+
+def _cache_put(digest: str, analysis: _Analysis) -> None:
+    with _CACHE_LOCK:
+        _CACHE[digest] = analysis
+        _CACHE.move_to_end(digest)
+        while len(_CACHE) > DEFAULT_CACHE_SIZE:
+            _CACHE.popitem(last=False)
 
 
-def _find_strategy_classes(tree: ast.Module) -> List[ast.ClassDef]:
-    """BaseStrategy를 상속하는 클래스 노드를 찾는다."""
-    result = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            for base in node.bases:
-                base_name = _get_base_name(base)
-                if base_name and "BaseStrategy" in base_name:
-                    result.append(node)
-                    break
-    return result
+def _analyze(source_code: str) -> _Analysis:
+    digest = _digest(source_code)
+    analysis = _cache_get(digest)
+    if analysis is None:
+        analysis = _parse(source_code)
+        _cache_put(digest, analysis)
+    return analysis
 
 
 def _get_base_name(node: ast.expr) -> Optional[str]:
@@ -0,0 +1,221 @@
+"""Backtester / signals_to_weights 테스트"""
+from datetime import date
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbique_strategy import (
+    Backtester,
+    BaseStrategy,
+    MarketData,
+    Signal,
+    SignalBatch,
+    SignalDirection,
+    signals_to_weights,
+)
+
+
+# ── 테스트용 전략 ──
+
+
+class EqualWeight(BaseStrategy):
+    def __init__(self, params=None):
+        super().__init__(params)
+        self.seen: List[tuple] = []
+        self.completed: List[tuple] = []
+
+    def generate_signals(self, market_data: MarketData, rebalance_date: date) -> List[Signal]:
+        self.seen.append((rebalance_date, market_data.end_date, len(market_data.prices)))
+        return [Signal(ticker=t, score=1.0) for t in market_data.tickers]
+
+    def risk_constraints(self) -> dict:
+        return self.params.get("constraints", {})
+
+    def on_rebalance_complete(self, rebalance_date, weights, portfolio_value) -> None:
+        self.completed.append((rebalance_date, dict(weights), portfolio_value))
+
+
+class BatchMomentum(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        mom = market_data.momentum_all(5)
+        return SignalBatch.from_series(mom[mom > 0])
+
+
+class ListMomentum(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        mom = market_data.momentum_all(5)
+        return [Signal(ticker=t, score=float(m)) for t, m in mom[mom > 0].items()]
+
+
+class BadTicker(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        return [Signal(ticker="NOPE", score=1.0)]
+
+
+def _prices(days: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2024-01-01", periods=days)
+    data = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, (days, 3)), axis=0)
+    return pd.DataFrame(data, index=dates, columns=["A", "B", "C"])
+
+
+# ── signals_to_weights ──
+
+
+class TestSignalsToWeights:
+    def test_score_proportional(self):
+        w = signals_to_weights([Signal("A", 3.0), Signal("B", 1.0)])
+        assert w == pytest.approx({"A": 0.75, "B": 0.25})
+
+    def test_ignores_short_and_neutral(self):
+        w = signals_to_weights([
+            Signal("A", 1.0),
+            Signal("B", 5.0, direction=SignalDirection.SHORT),
+            Signal("C", 5.0, direction=SignalDirection.NEUTRAL),
+        ])
+        assert w == {"A": 1.0}
+
+    def test_max_weight_redistributes(self):
+        w = signals_to_weights(
+            [Signal("A", 8.0), Signal("B", 1.0), Signal("C", 1.0)], {"max_weight": 0.5}
+        )
+        assert w == pytest.approx({"A": 0.5, "B": 0.25, "C": 0.25})
+
+    def test_max_weight_leaves_cash(self):
+        w = signals_to_weights([Signal("A", 1.0), Signal("B", 1.0)], {"max_weight": 0.3})
+        assert w == pytest.approx({"A": 0.3, "B": 0.3})
+
+    def test_min_weight_drops_and_renormalizes(self):
+        w = signals_to_weights(
+            [Signal("A", 10.0), Signal("B", 9.5), Signal("C", 0.1)], {"min_weight": 0.05}
+        )
+        assert set(w) == {"A", "B"}
+        assert sum(w.values()) == pytest.approx(1.0)
+
+    def test_max_positions_top_scores(self):
+        w = signals_to_weights(
+            [Signal("A", 1.0), Signal("B", 3.0), Signal("C", 2.0)], {"max_positions": 2}
+        )
+        assert set(w) == {"B", "C"}
+
+    def test_explicit_weight(self):
+        w = signals_to_weights([Signal("A", 1.0, weight=0.6), Signal("B", 1.0), Signal("C", 1.0)])
+        assert w == pytest.approx({"A": 0.6, "B": 0.2, "C": 0.2})
+
+    def test_empty(self):
+        assert signals_to_weights([]) == {}
+
+    def test_min_weight_keeps_largest_feasible_set(self):
+        # 하한 미만 종목을 한꺼번에 버리지 않고, 재배분 후 하한을 지키는 최대 상위 집합 유지
+        w = signals_to_weights(
+            [Signal("A", 0.5), Signal("B", 0.2), Signal("C", 0.2), Signal("D", 0.05), Signal("E", 0.05)],
+            {"min_weight": 0.051},
+        )
+        assert set(w) == {"A", "B", "C", "D"}
+        assert min(w.values()) >= 0.051
+
+    def test_min_weight_above_max_weight(self):
+        assert signals_to_weights([Signal("A", 1.0)], {"max_weight": 0.1, "min_weight": 0.2}) == {}
+
+    def test_nonpositive_scores_excluded_under_cap(self):
+        w = signals_to_weights([Signal("A", 1.0), Signal("B", -1.0)], {"max_weight": 0.3})
+        assert w == pytest.approx({"A": 0.3})
+
+    def test_batch_last_signal_per_ticker(self):
+        batch = SignalBatch(["A", "B"], [0, 1, 0], [1.0, 1.0, 3.0])
+        assert signals_to_weights(batch) == pytest.approx({"A": 0.75, "B": 0.25})
+
+    def test_large_input_respects_constraints(self):
+        rng = np.random.default_rng(3)
+        n = 5000
+        batch = SignalBatch([f"T{i}" for i in range(n)], np.arange(n), rng.lognormal(0, 1, n))
+        constraints = {"max_weight": 0.001, "min_weight": 0.0002, "max_positions": 3000}
+        w = np.array(list(signals_to_weights(batch, constraints).values()))
+        assert len(w) <= 3000
+        assert w.max() <= 0.001 + 1e-12 and w.min() >= 0.0002 - 1e-12
+        assert w.sum() == pytest.approx(1.0)
+
+
+# ── Backtester ──
+
+
+class TestBacktester:
+    def test_monthly_rebalance_as_of_data(self):
+        prices = _prices()
+        strat = EqualWeight()
+        result = Backtester(strat, prices, rebalance="M").run()
+
+        # 각 리밸런싱 시점의 데이터는 해당일까지만 포함 (look-ahead 없음)
+        for rebalance_date, end_date, _ in strat.seen:
+            assert end_date == rebalance_date
+        assert [d.month for d, *_ in strat.seen] == sorted({d.month for d in prices.index})
+        assert len(strat.completed) == len(strat.seen)
+        assert result.weights.sum(axis=1).to_numpy() == pytest.approx(1.0)
+        assert result.equity.index[0] == pd.Timestamp(strat.seen[0][0])
+
+    def test_buy_and_hold_matches_manual(self):
+        prices = _prices(60)
+        result = Backtester(EqualWeight(), prices, rebalance=[prices.index[0]]).run()
+        expected = (prices / prices.iloc[0]).mean(axis=1)
+        assert result.equity.to_numpy() == pytest.approx(expected.to_numpy())
+
+    def test_daily_rebalance_matches_mean_return(self):
+        prices = _prices(40)
+        result = Backtester(EqualWeight(), prices, rebalance="D").run()
+        expected = (1 + prices.pct_change().iloc[1:].mean(axis=1)).cumprod()
+        assert result.equity.iloc[1:].to_numpy() == pytest.approx(expected.to_numpy())
+
+    def test_transaction_cost_and_constraints(self):
+        prices = _prices()
+        strat = EqualWeight({"constraints": {"max_weight": 0.2}})
+        result = Backtester(strat, prices, transaction_cost=0.01).run()
+        assert result.weights.to_numpy().max() == pytest.approx(0.2)
+        assert result.costs.iloc[0] == pytest.approx(0.01 * 0.6)
+        assert result.equity.iloc[0] == pytest.approx(1 - 0.006)
+
+    def test_missing_price_excluded(self):
+        prices = _prices(60)
+        prices.loc[:prices.index[30], "C"] = np.nan
+        strat = EqualWeight()
+        result = Backtester(strat, prices, rebalance="M").run()
+        assert result.weights["C"].iloc[0] == 0.0
+        assert not result.equity.isna().any()
+
+    def test_start_end_and_lookback(self):
+        prices = _prices()
+        strat = EqualWeight()
+        result = Backtester(strat, prices, lookback=10).run(start="2024-03-01", end="2024-04-30")
+        assert all(n <= 10 for *_, n in strat.seen)
+        assert result.equity.index[-1] <= pd.Timestamp("2024-04-30")
+        assert result.weights.index[0] >= pd.Timestamp("2024-03-01")
+
+    def test_stats(self):
+        stats = Backtester(EqualWeight(), _prices()).run().stats()
+        assert set(stats) >= {"total_return", "cagr", "volatility", "sharpe", "max_drawdown"}
+        assert stats["max_drawdown"] <= 0
+
+    def test_signal_batch_matches_list(self):
+        prices = _prices()
+        prices.iloc[:30, 0] = np.nan
+        batch = Backtester(BatchMomentum(), prices, rebalance="W").run()
+        listed = Backtester(ListMomentum(), prices, rebalance="W").run()
+        pd.testing.assert_series_equal(batch.equity, listed.equity)
+        pd.testing.assert_frame_equal(batch.weights, listed.weights)
+
+    def test_signal_batch_unknown_ticker(self):
+        class Bad(BaseStrategy):
+            def generate_signals(self, market_data, rebalance_date):
+                return SignalBatch(["A", "NOPE"], [1], [1.0])
+
+        with pytest.raises(KeyError, match="NOPE"):
+            Backtester(Bad(), _prices()).run()
+
+    def test_unknown_ticker_raises(self):
+        with pytest.raises(KeyError, match="NOPE"):
+            Backtester(BadTicker(), _prices()).run()
+
+    def test_bad_frequency(self):
+        with pytest.raises(ValueError, match="Unknown rebalance frequency"):
+            Backtester(EqualWeight(), _prices(), rebalance="X").run()
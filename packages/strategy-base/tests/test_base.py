@@ -128,3 +128,129 @@ class TestMarketData:
     def test_empty_prices_raises(self):
         with pytest.raises(ValueError, match="must not be empty"):
             MarketData(pd.DataFrame())
+
+
+class TestMarketDataViews:
+    def test_as_of_shares_buffer(self):
+        prices = _make_prices(["A", "B"], days=30)
+        md = MarketData(prices)
+        view = md.as_of(prices.index[9])
+        assert len(view.prices) == 10
+        assert view.end_date == prices.index[9].date()
+        assert np.shares_memory(view.values, md.values)
+        assert view.tickers == md.tickers
+
+    def test_as_of_lookback_and_window(self):
+        prices = _make_prices(["A"], days=30)
+        md = MarketData(prices)
+        assert len(md.as_of(prices.index[19], lookback=5).prices) == 5
+        win = md.window(prices.index[5], prices.index[14])
+        assert (win.start_date, win.end_date) == (prices.index[5].date(), prices.index[14].date())
+        pd.testing.assert_frame_equal(win.prices, prices.iloc[5:15], check_freq=False)
+        assert win.calculate_momentum("A", 5) == MarketData(prices.iloc[5:15]).calculate_momentum("A", 5)
+
+    def test_view_is_read_only(self):
+        md = MarketData(_make_prices(["A"], days=10))
+        view = md.window(end=md.prices.index[4])
+        with pytest.raises(ValueError):
+            view.values[0, 0] = 0.0
+
+    def test_view_tickers_are_copied(self):
+        md = MarketData(_make_prices(["A", "B"], days=10))
+        view = md.as_of(md.prices.index[4])
+        view.tickers.reverse()
+        assert md.tickers == ["A", "B"]
+        assert md.as_of(md.prices.index[4]).tickers == ["A", "B"]
+
+    def test_as_of_before_start_raises(self):
+        md = MarketData(_make_prices(["A"], days=10))
+        with pytest.raises(ValueError, match="must not be empty"):
+            md.as_of("2000-01-01")
+
+
+class TestCrossSectional:
+    @pytest.fixture
+    def md(self):
+        prices = _make_prices(["A", "B", "C", "D", "E"], days=120)
+        prices.iloc[:40, 1] = np.nan  # 늦게 상장
+        prices.iloc[-2:, 2] = np.nan  # 최근 거래정지
+        prices.iloc[:110, 3] = np.nan  # 이력 부족
+        return MarketData(prices)
+
+    @pytest.mark.parametrize("period", [1, 5, 20])
+    def test_matches_scalar(self, md, period):
+        for batch, scalar in [
+            (md.momentum_all, md.calculate_momentum),
+            (md.volatility_all, md.calculate_volatility),
+            (md.mean_return_all, md.calculate_mean_return),
+        ]:
+            result = batch(period)
+            assert list(result.index) == md.tickers
+            expected = [scalar(t, period) for t in md.tickers]
+            np.testing.assert_allclose(result.to_numpy(), np.nan_to_num(expected), rtol=1e-10)
+
+    def test_ma_deviation(self, md):
+        dev = md.ma_deviation_all(20)
+        ma = md.moving_average_all(20)
+        for t in ["A", "B", "C", "E"]:
+            series = md.prices[t].dropna()
+            expected_ma = series.iloc[-20:].mean()
+            assert ma[t] == pytest.approx(expected_ma)
+            assert dev[t] == pytest.approx((series.iloc[-1] - expected_ma) / expected_ma)
+        assert dev["D"] == 0.0 and ma["D"] == 0.0
+
+    def test_on_view(self, md):
+        view = md.as_of(md.prices.index[60])
+        np.testing.assert_allclose(
+            view.momentum_all(10).to_numpy(),
+            MarketData(md.prices.iloc[:61]).momentum_all(10).to_numpy(),
+        )
+
+    def test_invalid_period(self, md):
+        with pytest.raises(ValueError):
+            md.momentum_all(-1)
+
+
+class TestMarketDataCache:
+    def test_returns_memoized(self):
+        md = MarketData(_make_prices(["A", "B"], days=30))
+        assert md.returns is md.returns
+        assert md.cache_info()["hits"] == 1 and md.cache_info()["misses"] == 1
+
+    def test_log_returns(self):
+        prices = _make_prices(["A"], days=30)
+        md = MarketData(prices)
+        expected = np.log(prices["A"] / prices["A"].shift(1)).dropna()
+        np.testing.assert_allclose(md.log_returns["A"].to_numpy(), expected.to_numpy())
+
+    def test_per_ticker_series_reused(self):
+        md = MarketData(_make_prices(["A", "B"], days=60))
+        md.calculate_volatility("A", 20)
+        md.calculate_mean_return("A", 20)
+        assert md.ticker_returns("A") is md.ticker_returns("A")
+        assert md.cache_info()["entries"] == 2  # clean prices + returns
+
+    def test_bounded_and_clearable(self):
+        md = MarketData(_make_prices(list("ABCDEFGH"), days=100), cache_bytes=4000)
+        for t in md.tickers:
+            md.clean_prices(t)
+        info = md.cache_info()
+        assert 0 < info["bytes"] <= 4000
+        assert info["entries"] < len(md.tickers)
+        md.clear_cache()
+        assert md.cache_info()["entries"] == 0 and md.cache_info()["bytes"] == 0
+
+    def test_views_have_own_cache(self):
+        md = MarketData(_make_prices(["A"], days=30))
+        md.returns
+        view = md.as_of(md.prices.index[10])
+        assert len(view.returns) == 10
+        assert view.cache_bytes == md.cache_bytes
+
+    def test_cached_frames_are_read_only(self):
+        md = MarketData(_make_prices(["A", "B"], days=30))
+        with pytest.raises(ValueError):
+            md.returns.iloc[:, :] = 0.0
+        with pytest.raises(ValueError):
+            md.clean_prices("A").iloc[0] = 0.0
+        assert (md.returns != 0.0).all().all()
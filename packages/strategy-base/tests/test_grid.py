@@ -0,0 +1,117 @@
+"""run_grid / SharedPrices 테스트"""
+import subprocess
+import sys
+import textwrap
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbique_strategy import Backtester, BaseStrategy, SignalBatch
+from qbique_strategy.grid import SharedPrices, attach_prices, expand_grid, run_grid
+
+
+class GridMomentum(BaseStrategy):
+    """워커 프로세스에서 pickle로 참조되도록 모듈 최상위에 정의"""
+
+    def generate_signals(self, market_data, rebalance_date):
+        if self.params.get("fail"):
+            raise RuntimeError("boom")
+        mom = market_data.momentum_all(self.params.get("period", 20))
+        return SignalBatch.from_series(mom[mom > 0])
+
+    def risk_constraints(self) -> dict:
+        return {"max_weight": self.params.get("max_weight", 1.0)}
+
+
+@pytest.fixture(scope="module")
+def prices() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range("2020-01-01", periods=300)
+    data = 100 * np.cumprod(1 + rng.normal(0.0003, 0.012, (300, 8)), axis=0)
+    return pd.DataFrame(data, index=dates, columns=[f"T{i}" for i in range(8)])
+
+
+def test_expand_grid():
+    assert expand_grid({"a": [1, 2], "b": ["x"]}) == [{"a": 1, "b": "x"}, {"a": 2, "b": "x"}]
+    with pytest.raises(TypeError):
+        expand_grid({"a": "xyz"})
+
+
+def test_shared_prices_roundtrip(prices):
+    with SharedPrices(prices) as shared:
+        frame, shm = attach_prices(shared.spec)
+        pd.testing.assert_frame_equal(frame, prices, check_freq=False)
+        assert not frame.to_numpy().flags.writeable
+        del frame
+        shm.close()
+
+
+def test_run_grid_matches_serial_backtests(prices):
+    grid = {"period": [5, 20], "max_weight": [0.2, 0.5]}
+    table = run_grid(GridMomentum, prices, grid, metric="sharpe", processes=2, rebalance="W")
+
+    assert len(table) == 4
+    assert table["error"].isna().all()
+    assert table["sharpe"].is_monotonic_decreasing
+    for row in table.itertuples():
+        params = {"period": row.period, "max_weight": row.max_weight}
+        expected = Backtester(GridMomentum(params), prices, rebalance="W").run().stats()
+        assert row.sharpe == pytest.approx(expected["sharpe"])
+        assert row.total_return == pytest.approx(expected["total_return"])
+
+
+def test_run_grid_in_process_and_errors(prices):
+    table = run_grid(
+        GridMomentum, prices, {"fail": [False, True]}, metric="cagr", processes=1,
+        base_params={"period": 10},
+    )
+    assert table["error"].isna().tolist() == [True, False]
+    assert "RuntimeError: boom" in table["error"].iloc[1]
+    assert (table["period"] == 10).all()
+
+
+def test_run_grid_unknown_metric(prices):
+    with pytest.raises(KeyError, match="Unknown metric"):
+        run_grid(GridMomentum, prices, {"period": [5]}, metric="nope", processes=1)
+
+
+GRID_SCRIPT = textwrap.dedent('''
+    import sys
+    sys.path.insert(0, {tests!r})
+
+    import numpy as np
+    import pandas as pd
+
+    from qbique_strategy import grid
+    from test_grid import GridMomentum
+
+    class Recorded(grid.SharedPrices):
+        def __init__(self, prices):
+            super().__init__(prices)
+            print(self.spec["name"], flush=True)
+
+    if __name__ == "__main__":
+        grid.SharedPrices = Recorded
+        rng = np.random.default_rng(3)
+        dates = pd.bdate_range("2021-01-01", periods=120)
+        prices = pd.DataFrame(100 + rng.random((120, 4)).cumsum(axis=0), index=dates, columns=list("ABCD"))
+        table = grid.run_grid(GridMomentum, prices, {{"period": [5, 10, 20]}}, processes=2)
+        assert table["error"].isna().all()
+''')
+
+
+def test_run_grid_releases_shared_memory_without_tracker_warnings(tmp_path):
+    """워커가 추적을 해제하지 않으므로 resource tracker 경고 없이 블록이 정리된다"""
+    script = tmp_path / "grid_script.py"
+    script.write_text(GRID_SCRIPT.format(tests=str(Path(__file__).parent)), encoding="utf-8")
+    proc = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120)
+
+    assert proc.returncode == 0, proc.stderr
+    assert "resource_tracker" not in proc.stderr and "leaked" not in proc.stderr, proc.stderr
+    names = proc.stdout.split()
+    assert len(names) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=names[0])
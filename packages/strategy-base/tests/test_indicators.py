@@ -0,0 +1,97 @@
+"""RollingIndicators / MarketData view 지표 조회 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbique_strategy import MarketData
+from qbique_strategy.indicators import RollingIndicators, window_length
+
+KINDS = [
+    ("momentum", "calculate_momentum", "momentum_all"),
+    ("volatility", "calculate_volatility", "volatility_all"),
+    ("mean_return", "calculate_mean_return", "mean_return_all"),
+]
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2022-01-03", periods=200)
+    data = 100 * np.cumprod(1 + rng.normal(0.0005, 0.015, (200, 5)), axis=0)
+    frame = pd.DataFrame(data, index=dates, columns=["A", "B", "C", "D", "E"])
+    frame.iloc[:60, 1] = np.nan  # 늦게 상장
+    frame.iloc[100:104, 2] = np.nan  # 중간 거래정지
+    frame.iloc[-1, 3] = np.nan  # 마지막 날 결측
+    return frame
+
+
+def _fresh(prices: pd.DataFrame, lo: int, hi: int) -> MarketData:
+    """엔진을 쓰지 않는 독립 MarketData (기준값)"""
+    return MarketData(prices.iloc[lo:hi].copy())
+
+
+class TestRollingIndicators:
+    def test_window_length(self):
+        assert window_length("momentum", 20) == 21
+        assert window_length("moving_average", 20) == 20
+        with pytest.raises(ValueError):
+            window_length("nope", 5)
+
+    def test_lookup_marks_gaps(self, prices):
+        engine = RollingIndicators(prices.to_numpy())
+        values = engine.lookup("momentum", 5, row=103)
+        assert np.isnan(values[2])  # 윈도우에 거래정지 구간
+        assert np.isnan(engine.lookup("momentum", 5, row=40, column=1))  # 상장 전
+        assert values[0] == pytest.approx(prices["A"].iloc[103] / prices["A"].iloc[98] - 1)
+        assert np.isnan(engine.lookup("momentum", 5, row=10, lo=8, column=0))
+
+    def test_tables_bounded(self, prices):
+        engine = RollingIndicators(prices.to_numpy(), max_tables=2)
+        engine.precompute([("momentum", 5), ("momentum", 10), ("volatility", 5)])
+        assert len(engine._tables) == 2
+
+
+class TestViewLookups:
+    @pytest.mark.parametrize("period", [5, 20])
+    @pytest.mark.parametrize("row", [10, 59, 80, 102, 106, 150, 199])
+    def test_scalar_and_batch_match_direct(self, prices, period, row):
+        md = MarketData(prices)
+        view = md.as_of(prices.index[row])
+        expected_md = _fresh(prices, 0, row + 1)
+        for _, scalar, batch in KINDS:
+            expected = [getattr(expected_md, scalar)(t, period) for t in md.tickers]
+            got = [getattr(view, scalar)(t, period) for t in md.tickers]
+            np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-12)
+            np.testing.assert_allclose(getattr(view, batch)(period).to_numpy(), expected, rtol=1e-9, atol=1e-12)
+
+    @pytest.mark.parametrize("row", [30, 120, 199])
+    def test_lookback_views(self, prices, row):
+        md = MarketData(prices)
+        view = md.as_of(prices.index[row], lookback=25)
+        expected_md = _fresh(prices, row + 1 - 25, row + 1)
+        for period in (5, 24, 30):
+            np.testing.assert_allclose(
+                view.momentum_all(period).to_numpy(),
+                expected_md.momentum_all(period).to_numpy(),
+                rtol=1e-9,
+            )
+            np.testing.assert_allclose(
+                view.ma_deviation_all(period).to_numpy(),
+                expected_md.ma_deviation_all(period).to_numpy(),
+                rtol=1e-9,
+            )
+
+    def test_views_share_engine(self, prices):
+        md = MarketData(prices)
+        v1 = md.as_of(prices.index[50])
+        v2 = md.window(prices.index[10], prices.index[150])
+        v1.momentum_all(20)
+        v2.volatility_all(20)
+        assert v1.indicators is md.indicators is v2.indicators
+        assert set(md.indicators._tables) >= {("momentum", 20), ("volatility", 20)}
+
+    def test_root_does_not_build_engine(self, prices):
+        md = MarketData(prices)
+        md.momentum_all(20)
+        md.calculate_momentum("A", 20)
+        assert md._engine is None
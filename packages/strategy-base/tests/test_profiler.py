@@ -0,0 +1,104 @@
+"""StrategyProfiler 테스트"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbique_strategy import Backtester, BaseStrategy, MarketData, Signal
+from qbique_strategy.profiler import StrategyProfiler
+
+
+class PerTicker(BaseStrategy):
+    def __init__(self, params=None):
+        super().__init__(params)
+        self.completed = 0
+
+    def generate_signals(self, market_data, rebalance_date):
+        market_data.returns
+        signals = []
+        for ticker in market_data.tickers:
+            mom = market_data.calculate_momentum(ticker, 5)
+            if mom > 0:
+                signals.append(Signal(ticker=ticker, score=mom))
+        return signals
+
+    def on_rebalance_complete(self, rebalance_date, weights, portfolio_value) -> None:
+        self.completed += 1
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    dates = pd.bdate_range("2021-01-01", periods=260)
+    data = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, (260, 4)), axis=0)
+    frame = pd.DataFrame(data, index=dates, columns=["A", "B", "C", "D"])
+    frame.iloc[:30, 3] = np.nan
+    return frame
+
+
+@pytest.fixture
+def profiled(prices):
+    strategy = PerTicker()
+    profiler = StrategyProfiler()
+    result = Backtester(strategy, prices, rebalance="M", profiler=profiler).run()
+    return strategy, profiler, result
+
+
+def test_results_unchanged(prices, profiled):
+    _, _, result = profiled
+    plain = Backtester(PerTicker(), prices, rebalance="M").run()
+    pd.testing.assert_series_equal(result.equity, plain.equity)
+
+
+def test_per_rebalance_records(profiled):
+    strategy, profiler, result = profiled
+    assert strategy.completed == len(result.weights)
+    assert [r.date for r in profiler.rebalances] == [d.date() for d in result.weights.index]
+    for record in profiler.rebalances:
+        assert record.signals_wall > 0 and record.signals_cpu >= 0
+        assert record.signals_peak_bytes > 0
+        assert record.complete_wall > 0
+
+
+def test_method_counts_and_restore(profiled):
+    _, profiler, result = profiled
+    n = len(result.weights)
+    calls = profiler.calls
+    assert calls["MarketData.calculate_momentum"].calls == 4 * n
+    assert calls["MarketData.returns"].calls == n
+    assert calls["generate_signals"].calls == n
+    gen = calls["generate_signals"]
+    assert gen.total >= calls["MarketData.calculate_momentum"].total
+    assert gen.self_time <= gen.total
+    # 계측은 run() 동안만
+    assert not hasattr(MarketData.__dict__["calculate_momentum"], "__wrapped__")
+    assert not hasattr(MarketData.__dict__["returns"].fget, "__wrapped__")
+
+
+def test_report_and_exports(profiled, tmp_path):
+    _, profiler, _ = profiled
+    report = profiler.report()
+    assert report.startswith("Profile: PerTicker")
+    assert "MarketData.calculate_momentum" in report
+
+    data = json.loads(profiler.to_json(str(tmp_path / "profile.json")))
+    assert data["summary"]["rebalances"] == len(profiler.rebalances)
+    assert data["calls"]["MarketData.calculate_momentum"]["calls"] == profiler.calls[
+        "MarketData.calculate_momentum"
+    ].calls
+    assert json.loads((tmp_path / "profile.json").read_text()) == data
+
+    folded = profiler.to_collapsed(str(tmp_path / "profile.folded")).splitlines()
+    assert "PerTicker;generate_signals;MarketData.calculate_momentum" in {
+        line.rsplit(" ", 1)[0] for line in folded
+    }
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in folded)
+
+
+def test_instrument_not_reentrant():
+    first, second = StrategyProfiler(), StrategyProfiler()
+    with first.instrument():
+        with pytest.raises(RuntimeError, match="already instrumenting"):
+            with second.instrument():
+                pass
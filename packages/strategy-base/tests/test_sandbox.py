@@ -0,0 +1,241 @@
+"""SandboxPool 테스트"""
+import multiprocessing
+import socket
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbique_strategy import MarketData, SignalBatch
+from qbique_strategy.sandbox import SandboxPool, _SANDBOX_BUILTINS, _isolate_network
+
+MOMENTUM = '''
+from qbique_strategy import BaseStrategy, SignalBatch
+
+class Momentum(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        mom = market_data.momentum_all(self.params.get("period", 20))
+        return SignalBatch.from_series(mom[mom > 0])
+'''
+
+LIST_SIGNALS = '''
+from qbique_strategy import BaseStrategy, Signal
+
+class Dated(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        return [Signal(ticker=market_data.tickers[0], score=1.0, metadata={"date": str(rebalance_date)})]
+'''
+
+RAISES = '''
+from qbique_strategy import BaseStrategy
+
+class Raises(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        raise ValueError("bad input")
+'''
+
+SPINS = '''
+from qbique_strategy import BaseStrategy
+
+class Spins(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        while True:
+            pass
+'''
+
+ALLOCATES = '''
+from qbique_strategy import BaseStrategy
+
+class Allocates(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        block = bytearray(8 * 1024 ** 3)
+        return []
+'''
+
+SLEEPS = '''
+import time
+from qbique_strategy import BaseStrategy
+
+class Sleeps(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        time.sleep(30)
+        return []
+'''
+
+READS_FILE = '''
+import numpy as np
+from qbique_strategy import BaseStrategy, Signal
+
+class Leaks(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        data = np.fromfile("/etc/passwd", dtype=np.uint8)
+        return [Signal(ticker=bytes(data).decode(), score=1.0)]
+'''
+MUTATES = '''
+from qbique_strategy import BaseStrategy
+
+class Mutates(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        market_data.tickers.reverse()
+        market_data.returns.iloc[:, :] = 0
+        return []
+'''
+
+READS_RETURNS = '''
+from qbique_strategy import BaseStrategy, Signal
+
+class Reads(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        mean = market_data.returns.mean()
+        return [Signal(ticker=t, score=float(mean[t])) for t in market_data.tickers[:2]]
+'''
+
+# numpy 비공개 모듈 → inspect → 호출자 frame의 __builtins__로 open을 되찾는 탈출
+FRAME_ESCAPE = '''
+import numpy as np
+from qbique_strategy import BaseStrategy, Signal
+
+class Escapes(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        data = np._core.function_base.inspect.currentframe().f_back.f_globals["_"+"_builtins_"+"_"]["op"+"en"]("/etc/hostname").read()
+        return [Signal(ticker=market_data.tickers[0], score=1.0, metadata={"leak": data})]
+'''
+
+
+@pytest.fixture(scope="module")
+def prices() -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range("2023-01-02", periods=120)
+    data = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, (120, 6)), axis=0)
+    return pd.DataFrame(data, index=dates, columns=[f"T{i}" for i in range(6)])
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with SandboxPool(processes=2, cpu_seconds=1, memory_mb=1024, max_runs=3, timeout=5) as pool:
+        yield pool
+
+
+def test_batch_matches_in_process(pool, prices):
+    params = [{"period": p} for p in (5, 10, 20, 40, 5, 10, 20)]
+    results = pool.run_batch([MOMENTUM] * len(params), prices, "2023-04-28", params)
+
+    md = MarketData(prices).as_of("2023-04-28")
+    for result, p in zip(results, params):
+        assert result.ok and result.class_name == "Momentum"
+        assert isinstance(result.signals, SignalBatch)
+        mom = md.momentum_all(p["period"])
+        expected = mom[mom > 0]
+        assert result.signals.ticker_labels == list(expected.index)
+        np.testing.assert_allclose(result.signals.score, expected.to_numpy())
+    # 7회 실행 / 워커당 최대 3회 → 최소 1개 워커 교체
+    assert pool.recycled >= 1
+
+
+def test_rebalance_date_and_lookback(pool, prices):
+    result = pool.run(LIST_SIGNALS, MarketData(prices), rebalance_date="2023-03-15", lookback=10)
+    assert result.ok
+    assert result.signals[0].metadata == {"date": "2023-03-15"}
+
+
+def test_failures_are_isolated(pool, prices):
+    sources = [RAISES, "import os\n" + MOMENTUM, SPINS, ALLOCATES, MOMENTUM]
+    results = pool.run_batch(sources, prices)
+
+    assert results[0].error == "ValueError: bad input"
+    assert results[1].error.startswith("Forbidden import 'os'") and results[1].class_name is None
+    assert "CPU time limit" in results[2].error
+    assert results[3].error.startswith("MemoryError")
+    assert results[4].ok
+
+
+@pytest.mark.parametrize("rebalance_date", [None, "2023-04-28"])
+def test_runs_do_not_share_market_data(prices, rebalance_date):
+    md = MarketData(prices)
+    if rebalance_date is not None:
+        md = md.as_of(rebalance_date)
+    expected = md.returns.mean()
+    with SandboxPool(processes=1) as pool:
+        mutated, read = pool.run_batch([MUTATES, READS_RETURNS], prices, rebalance_date)
+    assert mutated.error.startswith("ValueError")
+    assert [s.ticker for s in read.signals] == ["T0", "T1"]
+    assert [s.score for s in read.signals] == pytest.approx(expected[["T0", "T1"]].tolist())
+
+
+def test_wall_clock_timeout(prices):
+    with SandboxPool(processes=1, timeout=0.5) as pool:
+        slow, fast = pool.run_batch([SLEEPS, MOMENTUM], prices)
+        assert slow.error == "Timed out after 0.5s"
+        assert fast.ok
+        assert pool.recycled == 1
+
+
+def test_dead_idle_worker_is_replaced(prices):
+    with SandboxPool(processes=1) as pool:
+        worker = pool._workers[0]
+        worker.process.kill()
+        worker.process.join()
+        result = pool.run(MOMENTUM, prices)
+        assert result.ok
+        assert pool.recycled == 1 and pool._workers[0] is not worker
+
+
+def test_params_length_mismatch(pool, prices):
+    with pytest.raises(ValueError, match="params"):
+        pool.run_batch([MOMENTUM, MOMENTUM], prices, params=[{}])
+
+
+def test_file_access_rejected(pool, prices):
+    for source in (
+        READS_FILE,
+        READS_FILE.replace('np.fromfile("/etc/passwd", dtype=np.uint8)', 'pd.read_csv("/etc/passwd")'),
+        READS_FILE.replace('np.fromfile("/etc/passwd", dtype=np.uint8)', 'market_data.prices.to_csv("/tmp/x")'),
+    ):
+        result = pool.run(source.replace("import numpy", "import pandas as pd\nimport numpy"), prices)
+        assert result.signals is None and result.class_name is None
+        assert "not allowed in the sandbox" in result.error
+
+
+def test_frame_escape_rejected(pool, prices):
+    result = pool.run(FRAME_ESCAPE, prices)
+    assert result.signals is None and result.class_name is None
+    assert "Attribute '._core' is not allowed in the sandbox" in result.error
+    for attr in ("f_back", "f_globals", "currentframe", "inspect"):
+        assert f"'.{attr}'" in result.error
+
+
+def test_restricted_builtins():
+    namespace = {"__name__": "__strategy__", "__builtins__": dict(_SANDBOX_BUILTINS)}
+    for name in ("open", "eval", "exec", "compile", "getattr"):
+        with pytest.raises(NameError):
+            exec(f"{name}", namespace)
+    with pytest.raises(ImportError, match="not allowed in the sandbox"):
+        exec("import os", namespace)
+    with pytest.raises(ImportError, match="not allowed in the sandbox"):
+        exec("from numpy import fromfile", namespace)
+    exec("import math\nclass A:\n    pass\nx = math.sqrt(4)", namespace)
+    assert namespace["x"] == 2.0
+
+
+def _connect_after_isolation(port, queue):
+    isolated = _isolate_network()
+    try:
+        socket.create_connection(("127.0.0.1", port), timeout=1).close()
+        queue.put((isolated, True))
+    except OSError:
+        queue.put((isolated, False))
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="POSIX only")
+def test_network_namespace(pool):
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        child = ctx.Process(target=_connect_after_isolation, args=(server.getsockname()[1], queue))
+        child.start()
+        isolated, connected = queue.get(timeout=10)
+        child.join()
+    if not isolated:
+        pytest.skip("no privilege to unshare the network namespace here")
+    assert not connected
+    assert pool.network_isolated is True
@@ -1,7 +1,9 @@
 """Signal / SignalDirection 테스트"""
+import numpy as np
+import pandas as pd
 import pytest
 
-from qbique_strategy import Signal, SignalDirection
+from qbique_strategy import Signal, SignalBatch, SignalDirection
 
 
 class TestSignalDirection:
@@ -47,3 +49,49 @@ class TestSignal:
     def test_direction_short(self):
         s = Signal(ticker="TSLA", score=-0.2, direction=SignalDirection.SHORT)
         assert s.direction == SignalDirection.SHORT
+
+
+class TestSignalBatch:
+    def test_roundtrip(self):
+        signals = [
+            Signal(ticker="A", score=1.0),
+            Signal(ticker="B", score=0.5, direction=SignalDirection.SHORT, weight=0.2),
+        ]
+        batch = SignalBatch.from_signals(signals)
+        assert len(batch) == 2
+        assert batch.ticker_labels == ["A", "B"]
+        assert batch.direction.tolist() == [0, 1]
+        assert batch.to_signals() == signals
+
+    def test_from_series(self):
+        scores = pd.Series([0.3, -0.1, 0.2], index=["A", "B", "C"])
+        batch = SignalBatch.from_series(scores[scores > 0])
+        assert batch.ticker_labels == ["A", "C"]
+        assert np.isnan(batch.weight).all()
+        assert [s.direction for s in batch.to_signals()] == [SignalDirection.LONG] * 2
+
+    def test_from_signals_with_universe(self):
+        batch = SignalBatch.from_signals([Signal(ticker="C", score=1.0)], tickers=["A", "B", "C"])
+        assert batch.index.tolist() == [2]
+        with pytest.raises(KeyError, match="Z"):
+            SignalBatch.from_signals([Signal(ticker="Z", score=1.0)], tickers=["A"])
+
+    def test_bulk_validation(self):
+        with pytest.raises(ValueError, match="weight must be between 0 and 1"):
+            SignalBatch(["A", "B"], [0, 1], [1.0, 1.0], weight=[0.5, 1.5])
+        with pytest.raises(ValueError, match="index out of range"):
+            SignalBatch(["A"], [0, 1], [1.0, 1.0])
+        with pytest.raises(ValueError, match="same length"):
+            SignalBatch(["A", "B"], [0, 1], [1.0])
+        with pytest.raises(ValueError, match="direction codes"):
+            SignalBatch(["A"], [0], [1.0], direction=[3])
+        with pytest.raises(ValueError, match="score must be finite, got nan"):
+            SignalBatch.from_series(pd.Series([1.0, np.nan], index=["A", "B"]))
+        with pytest.raises(ValueError, match="score must be finite, got inf"):
+            SignalBatch(["A"], [0], [np.inf])
+        with pytest.raises(ValueError, match="ticker must not be empty"):
+            SignalBatch([""], [0], [1.0])
+
+    def test_select(self):
+        batch = SignalBatch(["A", "B", "C"], [0, 1, 2], [3.0, 2.0, 1.0])
+        assert batch.select(batch.score > 1.5).ticker_labels == ["A", "B"]
@@ -1,7 +1,10 @@
 """validator 모듈 테스트"""
+from pathlib import Path
+
 import pytest
 
-from qbique_strategy import validate_strategy_code, detect_class_name
+from qbique_strategy import validate_files, validate_strategy_code, detect_class_name
+from qbique_strategy import validator
 
 
 VALID_STRATEGY = '''
@@ -154,3 +157,244 @@ class TestDetectClassName:
 
     def test_detect_multiple_returns_first(self):
         assert detect_class_name(MULTIPLE_CLASSES) == "StrategyA"
+
+
+NESTED_FIRST = '''
+from qbique_strategy import BaseStrategy
+
+class Outer:
+    class Inner(BaseStrategy):
+        def generate_signals(self, market_data, rebalance_date):
+            return []
+
+class TopLevel(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        return []
+'''
+
+
+class TestSinglePass:
+    def test_import_errors_precede_call_errors(self):
+        source = FORBIDDEN_EXEC + "\nimport socket\n"
+        errors = validate_strategy_code(source).errors
+        assert errors[0].startswith("Forbidden import 'socket'")
+        assert errors[1].startswith("Forbidden call 'exec()'")
+
+    def test_top_level_class_preferred_over_nested(self):
+        assert detect_class_name(NESTED_FIRST) == "TopLevel"
+
+
+class TestCache:
+    def setup_method(self):
+        validator.clear_cache()
+
+    def test_detect_reuses_validation(self):
+        validate_strategy_code(VALID_STRATEGY)
+        assert detect_class_name(VALID_STRATEGY) == "MyStrategy"
+        assert validator.cache_info() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_results_are_independent_copies(self):
+        first = validate_strategy_code(MISSING_METHOD)
+        first.errors.clear()
+        assert validate_strategy_code(MISSING_METHOD).errors
+
+
+class TestValidateFiles:
+    @pytest.fixture
+    def files(self, tmp_path):
+        sources = {
+            "valid.py": VALID_STRATEGY,
+            "copy.py": VALID_STRATEGY,
+            "exec.py": FORBIDDEN_EXEC,
+            "syntax.py": SYNTAX_ERROR,
+        }
+        paths = []
+        for name, source in sources.items():
+            (tmp_path / name).write_text(source, encoding="utf-8")
+            paths.append(tmp_path / name)
+        return paths + [tmp_path / "missing.py"]
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_aggregates_in_input_order(self, files, processes):
+        validator.clear_cache()
+        batch = validate_files(files, processes=processes)
+        names = [Path(p).name for p in batch.results]
+        assert names == ["valid.py", "copy.py", "exec.py", "syntax.py", "missing.py"]
+        assert len(batch) == 5
+        assert not batch.valid
+        assert [Path(p).name for p in batch.passed] == ["valid.py", "copy.py"]
+        errors = batch.errors()
+        assert any("exec" in e for e in errors[str(files[2])])
+        assert errors[str(files[4])][0].startswith("Cannot read file")
+        # 내용이 같은 파일은 한 번만 분석
+        assert validator.cache_info()["entries"] == 3
+
+    def test_uses_cache(self, files):
+        validator.clear_cache()
+        validate_strategy_code(VALID_STRATEGY)
+        batch = validate_files(files[:2], processes=1)
+        assert batch.valid
+        assert validator.cache_info()["hits"] == 1
+
+
+SLOW_STRATEGY = '''
+import pandas as pd
+from qbique_strategy import BaseStrategy, Signal
+
+class SlowStrategy(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        signals = []
+        vol = market_data.returns.std()
+        mean = market_data.returns.mean()
+        frame = pd.DataFrame()
+        for ticker in market_data.tickers:
+            mom = market_data.calculate_momentum(ticker, 20)
+            last = market_data.prices[ticker].iloc[-1]
+            clean = market_data.prices[ticker].dropna()
+            frame.loc[ticker] = [mom, last]
+            signals.append(Signal(ticker=ticker, score=mom))
+        return signals
+
+    def helper(self, market_data):
+        return [market_data.calculate_momentum(t) for t in market_data.tickers]
+'''
+
+
+class TestPerfLint:
+    def _warnings(self, source):
+        return [w for w in validate_strategy_code(source, perf_lint=True).warnings if w.startswith("Performance")]
+
+    def test_off_by_default(self):
+        result = validate_strategy_code(SLOW_STRATEGY)
+        assert result.valid is True
+        assert result.warnings == []
+
+    def test_flags_slow_patterns_with_alternatives(self):
+        result = validate_strategy_code(SLOW_STRATEGY, perf_lint=True)
+        assert result.valid is True
+        warnings = self._warnings(SLOW_STRATEGY)
+        expected = [
+            ("returns is accessed 2 times", "assign it to a local"),
+            ("calculate_momentum() called in a per-ticker loop", "momentum_all(period)"),
+            (".iloc[] indexing inside a loop", ".to_numpy()"),
+            ("dropna() inside a loop", "*_all()"),
+            (".loc[] assignment", "SignalBatch.from_series"),
+            ("Signal objects created per ticker", "SignalBatch.from_series"),
+        ]
+        assert len(warnings) == len(expected)
+        for warning, (pattern, alternative) in zip(warnings, expected):
+            assert pattern in warning and alternative in warning
+
+    def test_only_generate_signals_body_and_loop_bodies(self):
+        source = '''
+from qbique_strategy import BaseStrategy
+
+class S(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        rets = market_data.returns
+        for col in rets.iloc[:, :3].columns:
+            pass
+        return []
+
+    def helper(self, market_data):
+        for t in market_data.tickers:
+            market_data.calculate_momentum(t)
+'''
+        assert self._warnings(source) == []
+
+    def test_loops_in_comprehensions_and_while(self):
+        source = '''
+from qbique_strategy import BaseStrategy
+
+class S(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        vols = {t: market_data.calculate_volatility(t) for t in market_data.tickers}
+        while True:
+            r = market_data.returns
+            break
+        return []
+'''
+        warnings = self._warnings(source)
+        assert any("volatility_all(period)" in w for w in warnings)
+        assert any("returns accessed inside a loop" in w for w in warnings)
+
+    @pytest.mark.parametrize("example", ["momentum.py", "mean_reversion.py"])
+    def test_bundled_examples_are_clean(self, example):
+        path = Path(__file__).parent.parent / "examples" / example
+        assert self._warnings(path.read_text(encoding="utf-8")) == []
+
+    def test_validate_files_passes_flag(self, tmp_path):
+        path = tmp_path / "slow.py"
+        path.write_text(SLOW_STRATEGY, encoding="utf-8")
+        batch = validate_files([path], processes=1, perf_lint=True)
+        assert batch.valid
+        assert any(w.startswith("Performance") for w in batch.results[str(path)].warnings)
+
+
+def _strategy(body: str, imports: str = "import numpy as np\nimport pandas as pd\n") -> str:
+    return imports + f'''from qbique_strategy import BaseStrategy
+
+class S(BaseStrategy):
+    def generate_signals(self, market_data, rebalance_date):
+        {body}
+        return []
+'''
+
+
+class TestSandboxRules:
+    @pytest.mark.parametrize("body", [
+        'np.fromfile("/etc/passwd", dtype=np.uint8)',
+        'pd.read_csv("/etc/passwd")',
+        'market_data.prices.to_csv("/tmp/leak.csv")',
+        'np.load("/tmp/x.npy")',
+        'np.save("/tmp/x.npy", market_data.prices.to_numpy())',
+        'market_data.prices.to_numpy().tofile("/tmp/x.bin")',
+        'pd.io.common.get_handle("/etc/passwd", "r")',
+        'getattr(np, "from" + "file")("/etc/passwd")',
+        'market_data.__class__.__init__.__globals__',
+        'print(__builtins__)',
+        'np._core.function_base',
+        'market_data._root',
+        '(lambda: 0).__code__',
+        'f = next(iter([])).gi_frame.f_back.f_globals',
+        'code = self.generate_signals.co_consts',
+        'import_frame = pd.core.common.inspect.currentframe()',
+    ])
+    def test_file_access_rejected_in_sandbox(self, body):
+        source = _strategy(body)
+        assert validate_strategy_code(source).valid
+        result = validate_strategy_code(source, sandbox=True)
+        assert result.valid is False
+        assert any("not allowed in the sandbox" in e for e in result.errors)
+
+    @pytest.mark.parametrize("imports", [
+        "import json\n",
+        "from numpy import fromfile\n",
+        "from pandas import read_pickle\n",
+        "import numpy.lib.npyio\n",
+        "from qbique_strategy import validate_files\n",
+        "from qbique_strategy.sandbox import SandboxPool\n",
+        "from . import helpers\n",
+    ])
+    def test_imports_outside_allowlist_rejected(self, imports):
+        result = validate_strategy_code(_strategy("pass", imports), sandbox=True)
+        assert any("Import" in e and "sandbox" in e for e in result.errors)
+
+    def test_computation_is_allowed(self):
+        body = (
+            "prices = market_data.prices.to_numpy(); "
+            "frame = pd.DataFrame(np.log(prices)).dropna().to_dict()"
+        )
+        source = _strategy(body, "from __future__ import annotations\nimport math\nimport numpy as np\nimport pandas as pd\n")
+        assert validate_strategy_code(source, sandbox=True).valid
+
+    @pytest.mark.parametrize("example", ["momentum.py", "mean_reversion.py"])
+    def test_bundled_examples_pass(self, example):
+        path = Path(__file__).parent.parent / "examples" / example
+        assert validate_strategy_code(path.read_text(encoding="utf-8"), sandbox=True).valid
+
+    def test_validate_files_passes_flag(self, tmp_path):
+        path = tmp_path / "leak.py"
+        path.write_text(_strategy('pd.read_csv("/etc/passwd")'), encoding="utf-8")
+        assert validate_files([path], processes=1).valid
+        assert not validate_files([path], processes=1, sandbox=True).valid